@@ -1,18 +1,73 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import requests
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
 AOC_SESSION_FILE = Path("~/.aoc_session").expanduser()
+AOC_URL = "https://adventofcode.com"
+USER_AGENT = "github.com/rubalo/aoc by rubalo@users.noreply.github.com"
+
+# Puzzles are released at midnight EST
+RELEASE_HOUR_UTC = 5
+
+FETCHED = "fetched"
+NOT_MODIFIED = "not modified"
+ALREADY_FETCHED = "already fetched"
+
+
+class FetchError(Exception):
+    pass
+
+
+class RateLimiter:
+    """Space the calls of every thread by at least interval seconds."""
+
+    def __init__(self, interval: float) -> None:
+        self.interval = interval
+        self.next_call = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
 
 
 class Aoc:
-    def __init__(self, token: str | None) -> None:
+    def __init__(
+        self,
+        token: str | None,
+        *,
+        url: str = AOC_URL,
+        timeout: float = 10,
+        retries: int = 3,
+        backoff: float = 0.5,
+        interval: float = 0.2,
+    ) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.rate_limiter = RateLimiter(interval)
+        self._session = None
+        self.session_lock = threading.Lock()
+
         if token is not None:
             self.token = token
             return
@@ -32,22 +87,148 @@ class Aoc:
         logger.error("No session token found. Please provide one.")
         raise ValueError
 
-    def fetch_input(self, year: int, day: int, input_file: Path) -> None:
-        """Fetch the input data for the given year and day."""
+    @property
+    def session(self) -> requests.Session:
+        """Shared keep-alive session, retrying the transient errors."""
 
-        if input_file.exists():
+        with self.session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                retry = Retry(
+                    total=self.retries,
+                    backoff_factor=self.backoff,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=1, pool_maxsize=16, max_retries=retry
+                )
+
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers.update({"User-Agent": USER_AGENT})
+                session.cookies.set("session", self.token)
+                self._session = session
+        return self._session
+
+    def close(self) -> None:
+        with self.session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def fetch_input(
+        self, year: int, day: int, input_file: Path, *, refresh: bool = False
+    ) -> str:
+        """Fetch the input data for the given year and day.
+
+        An existing input is kept unless refresh is set, it is then only
+        downloaded again if the server copy changed.
+        """
+
+        meta_file = get_meta_file(input_file)
+        if input_file.exists() and not refresh:
             logger.info("Input data already fetched for year %s, day %s", year, day)
             logger.info("File: %s", input_file)
-            return
+            return ALREADY_FETCHED
+
+        headers = {}
+        if input_file.exists() and meta_file.exists():
+            with open(meta_file) as f:
+                meta = json.load(f)
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
 
-        url = f"https://adventofcode.com/{year}/day/{day}/input"
-        headers = {"Cookie": f"session={self.token}"}
-        response = requests.get(url, headers=headers, timeout=5)
-        if response.status_code != 200:
-            breakpoint()
-        response.raise_for_status()
+        self.rate_limiter.wait()
+        url = f"{self.url}/{year}/day/{day}/input"
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
 
-        with open(input_file, "w") as f:
-            f.write(response.text)
+        if response.status_code == 304:  # noqa
+            logger.info("Input data not modified for year %s, day %s", year, day)
+            return NOT_MODIFIED
+
+        if response.status_code != 200:  # noqa
+            _msg = f"Fetching {url} failed: {response.status_code} {response.reason}"
+            raise FetchError(_msg)
+
+        write_atomic(input_file, response.text)
+        meta = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        write_atomic(meta_file, json.dumps(meta))
 
         logger.info("Input data fetched for year %s, day %s", year, day)
+        return FETCHED
+
+    def fetch_inputs(
+        self,
+        inputs: list[tuple[int, int, Path]],
+        *,
+        max_workers: int = 4,
+        refresh: bool = False,
+    ) -> dict[tuple[int, int], str]:
+        """Fetch several (year, day, input file) concurrently.
+
+        The result maps each (year, day) to its fetch status, or to the
+        error message when it failed.
+        """
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.fetch_input, year, day, input_file, refresh=refresh
+                ): (year, day)
+                for year, day, input_file in inputs
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:  # noqa
+                    results[futures[future]] = f"error: {e}"
+        return dict(sorted(results.items()))
+
+
+def get_meta_file(input_file: Path) -> Path:
+    """Sidecar file keeping the validators of a fetched input."""
+
+    return input_file.with_name(f".{input_file.name}.json")
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Write the file through a temporary file renamed over it."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def get_nb_days(year: int) -> int:
+    """Number of puzzles of an event, 12 since 2025."""
+
+    return 12 if year >= 2025 else 25  # noqa
+
+
+def released_days(year: int, now: datetime | None = None) -> list[int]:
+    """List the days of an event whose puzzle is already released."""
+
+    now = now or datetime.now(UTC)
+    return [
+        day
+        for day in range(1, get_nb_days(year) + 1)
+        if datetime(year, 12, day, RELEASE_HOUR_UTC, tzinfo=UTC) <= now
+    ]
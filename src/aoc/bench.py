@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import logging
+import math
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+
+from aoc import memo, search
+from aoc.runner import Job
+from aoc.solution import load_solution
+from aoc.utils import get_data_directory, get_root_directory
+
+logger = logging.getLogger(__name__)
+
+HISTORY_FILE = "bench_history.jsonl"
+NS_PER_MS = 1_000_000
+
+
+@dataclass
+class Stats:
+    samples: list[int] = field(default_factory=list)
+
+    @property
+    def min(self) -> int:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> int:
+        ordered = sorted(self.samples)
+        return ordered[math.ceil(0.95 * len(ordered)) - 1]
+
+    def to_dict(self) -> dict[str, float]:
+        return {"min": self.min, "median": self.median, "p95": self.p95}
+
+
+@dataclass
+class BenchResult:
+    job: Job
+    answer: object
+    parse: Stats
+    solve: Stats
+    search: dict[str, int] = field(default_factory=dict)
+    memo: dict[str, dict[str, int | None]] = field(default_factory=dict)
+
+
+def measure(func: Callable[[], object], repeat: int, warmup: int) -> Stats:
+    """Call func warmup + repeat times and keep the repeat timings in ns."""
+
+    for _ in range(warmup):
+        func()
+
+    stats = Stats()
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        func()
+        stats.samples.append(time.perf_counter_ns() - start)
+    return stats
+
+
+def bench_job(job: Job, repeat: int, warmup: int) -> BenchResult:
+    """Benchmark the parse and solve stages of a part.
+
+    The parse stage reads and parses the input, the solve stage runs the
+    part on the parsed input. The legacy parts read their input themselves,
+    their parse stage only measures the input file read. The aoc.search
+    and aoc.memo counters are the ones of a single solve.
+    """
+
+    solution = load_solution(job.day, job.year)
+
+    def parse():
+        return solution.parse(solution.read())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse_stats = measure(parse, repeat, warmup)
+        parsed = parse()
+        search.stats.reset()
+        answer = solution.solve(job.part, parsed)
+        search_stats = search.stats.to_dict()
+        memo_stats = {name: x.to_dict() for name, x in memo.stats().items()}
+        solve_stats = measure(lambda: solution.solve(job.part, parsed), repeat, warmup)
+
+    return BenchResult(job, answer, parse_stats, solve_stats, search_stats, memo_stats)
+
+
+def get_history_file() -> Path:
+    return get_data_directory() / Path(HISTORY_FILE)
+
+
+def get_commit() -> tuple[str, bool]:
+    """Get the current commit hash and whether the work tree has changes."""
+
+    import git
+
+    repo = git.Repo(get_root_directory())
+    return repo.head.commit.hexsha, repo.is_dirty()
+
+
+def load_history() -> list[dict]:
+    history_file = get_history_file()
+    if not history_file.exists():
+        return []
+
+    with open(history_file) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def last_entry(history: list[dict], job: Job) -> dict | None:
+    """Find the most recent history entry of the given part."""
+
+    for entry in reversed(history):
+        if (entry["year"], entry["day"], entry["part"]) == (
+            job.year,
+            job.day,
+            job.part,
+        ):
+            return entry
+    return None
+
+
+def save_results(results: list[BenchResult], repeat: int, warmup: int) -> None:
+    """Append the results to the history store with the current commit."""
+
+    commit, dirty = get_commit()
+    timestamp = datetime.now(UTC).isoformat(timespec="seconds")
+
+    history_file = get_history_file()
+    history_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(history_file, "a") as f:
+        for result in results:
+            entry = {
+                "timestamp": timestamp,
+                "commit": commit,
+                "dirty": dirty,
+                "year": result.job.year,
+                "day": result.job.day,
+                "part": result.job.part,
+                "repeat": repeat,
+                "warmup": warmup,
+                "answer": str(result.answer),
+                "parse": result.parse.to_dict(),
+                "solve": result.solve.to_dict(),
+                "search": result.search,
+                "memo": result.memo,
+            }
+            f.write(json.dumps(entry) + "\n")
+
+
+def format_ms(value: float) -> str:
+    return f"{value / NS_PER_MS:.3f}ms"
+
+
+def format_result(result: BenchResult, previous: dict | None) -> str:
+    """Format a result line, comparing the solve median with the previous run."""
+
+    job = result.job
+    line = (
+        f"{job.year} day {job.day:02} part {job.part}: {result.answer} | "
+        f"parse min {format_ms(result.parse.min)} "
+        f"median {format_ms(result.parse.median)} "
+        f"p95 {format_ms(result.parse.p95)} | "
+        f"solve min {format_ms(result.solve.min)} "
+        f"median {format_ms(result.solve.median)} "
+        f"p95 {format_ms(result.solve.p95)}"
+    )
+
+    if result.search.get("searches"):
+        line += (
+            f" | {result.search['expanded']} expanded, "
+            f"{result.search['pushed']} pushed in {result.search['searches']} searches"
+        )
+
+    for name, info in result.memo.items():
+        line += (
+            f" | {name.rsplit('.', 1)[-1]} {info['hits']} hits, "
+            f"{info['misses']} misses, {info['evictions']} evictions"
+        )
+
+    if previous is not None:
+        prev_median = previous["solve"]["median"]
+        ratio = result.solve.median / prev_median if prev_median else float("inf")
+        line += f" | {ratio:.2f}x vs {previous['commit'][:8]}"
+
+    return line
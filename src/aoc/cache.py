@@ -0,0 +1,366 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from importlib.util import find_spec
+from pathlib import Path
+from types import CodeType, FunctionType, ModuleType
+from typing import TYPE_CHECKING, Any
+
+from aoc.utils import get_data_directory
+
+if TYPE_CHECKING:
+    from aoc.solution import DaySolution
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIRECTORY = ".cache"
+ANSWERS_FILE = "answers.json"
+PARSED_DIRECTORY = "parsed"
+
+
+@dataclass
+class CacheStats:
+    entries: int
+    hits: int
+    size: int
+    per_year: dict[int, int]
+    snapshots: int = 0
+    snapshots_size: int = 0
+
+
+def get_cache_directory() -> Path:
+    return get_data_directory() / Path(CACHE_DIRECTORY)
+
+
+def get_answers_file() -> Path:
+    return get_cache_directory() / Path(ANSWERS_FILE)
+
+
+def get_parsed_directory() -> Path:
+    return get_cache_directory() / Path(PARSED_DIRECTORY)
+
+
+def hash_file(path: Path) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def find_aoc_imports(path: Path) -> set[str]:
+    """List the aoc.* modules imported by the given source file."""
+
+    with open(path) as f:
+        tree = ast.parse(f.read(), filename=str(path))
+
+    modules = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            # from aoc import utils imports a module, not a name
+            names = [node.module] + [f"{node.module}.{x.name}" for x in node.names]
+        else:
+            continue
+        modules.update(x for x in names if x == "aoc" or x.startswith("aoc."))
+    return modules
+
+
+def find_module_file(name: str) -> Path | None:
+    try:
+        spec = find_spec(name)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or not spec.origin or not spec.origin.endswith(".py"):
+        return None
+    return Path(spec.origin)
+
+
+def hash_sources(module_name: str) -> str:
+    """Hash the source of a module and of every aoc module it imports."""
+
+    to_visit = [module_name]
+    sources = {}
+    while to_visit:
+        name = to_visit.pop()
+        path = find_module_file(name)
+        if path is None or path in sources:
+            continue
+        sources[path] = hash_file(path)
+        to_visit.extend(find_aoc_imports(path))
+
+    digest = hashlib.sha256()
+    for path in sorted(sources):
+        digest.update(sources[path].encode())
+    return digest.hexdigest()
+
+
+def get_key(day: int, year: int, part: int, input_file: Path) -> str:
+    """Build the cache key of a part from its input and solver source."""
+
+    digest = hashlib.sha256()
+    digest.update(f"{year}-{day:02}-{part}".encode())
+    digest.update(hash_file(input_file).encode())
+    digest.update(hash_sources(f"aoc.y{year}.day{day:02}").encode())
+    return digest.hexdigest()
+
+
+def load_answers() -> dict[str, dict]:
+    answers_file = get_answers_file()
+    if not answers_file.exists():
+        return {}
+
+    with open(answers_file) as f:
+        return json.load(f)
+
+
+def save_answers(answers: dict[str, dict]) -> None:
+    """Write the answers store, replacing the previous file atomically."""
+
+    answers_file = get_answers_file()
+    answers_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = answers_file.with_suffix(".tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(answers, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, answers_file)
+
+
+def get_answer(key: str) -> tuple[bool, object]:
+    """Look up a cached answer, returning whether it was found."""
+
+    answers = load_answers()
+    if key not in answers:
+        return False, None
+
+    entry = answers[key]
+    entry["hits"] += 1
+    save_answers(answers)
+    return True, entry["answer"]
+
+
+def set_answer(key: str, day: int, year: int, part: int, answer: object) -> None:
+    # numpy scalars are not serializable
+    if hasattr(answer, "item"):
+        answer = answer.item()
+    if not isinstance(answer, (int, str)):
+        logger.debug("Answer of type %s not cached", type(answer).__name__)
+        return
+
+    answers = load_answers()
+    answers[key] = {
+        "year": year,
+        "day": day,
+        "part": part,
+        "answer": answer,
+        "hits": 0,
+        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+    save_answers(answers)
+
+
+def get_stats() -> CacheStats:
+    answers = load_answers()
+    per_year = {}
+    for entry in answers.values():
+        per_year[entry["year"]] = per_year.get(entry["year"], 0) + 1
+
+    answers_file = get_answers_file()
+    snapshots = find_snapshots()
+    return CacheStats(
+        entries=len(answers),
+        hits=sum(entry["hits"] for entry in answers.values()),
+        size=answers_file.stat().st_size if answers_file.exists() else 0,
+        per_year=dict(sorted(per_year.items())),
+        snapshots=len(snapshots),
+        snapshots_size=sum(x.stat().st_size for x in snapshots),
+    )
+
+
+def clear_answers(year: int | None = None) -> int:
+    """Remove the cached answers, of a single year if given."""
+
+    answers = load_answers()
+    kept = {
+        key: entry
+        for key, entry in answers.items()
+        if year is not None and entry["year"] != year
+    }
+    save_answers(kept)
+    return len(answers) - len(kept)
+
+
+def hash_parser(module: ModuleType) -> str:
+    """Hash the parse function and what it uses.
+
+    The functions and classes of the day module reached from parse are
+    hashed by source, editing a part keeps the snapshot. The aoc modules
+    they use are hashed like hash_sources, with the modules they import.
+    A module can also bump a PARSE_VERSION constant to force a new snapshot.
+    """
+
+    digest = hashlib.sha256(str(getattr(module, "PARSE_VERSION", "")).encode())
+    to_visit: list[FunctionType | type] = [module.parse]
+    seen = set()
+    imported = set()
+    while to_visit:
+        obj = to_visit.pop()
+        if obj in seen:
+            continue
+        seen.add(obj)
+        digest.update(inspect.getsource(obj).encode())
+
+        for name in sorted(referenced_names(obj)):
+            value = getattr(module, name, None)
+            if isinstance(value, ModuleType):
+                owner = value.__name__
+            else:
+                owner = getattr(value, "__module__", None)
+
+            if owner == module.__name__ and isinstance(value, FunctionType | type):
+                to_visit.append(value)
+            elif isinstance(owner, str) and (
+                owner == "aoc" or owner.startswith("aoc.")
+            ):
+                imported.add(owner)
+
+    for name in sorted(imported):
+        digest.update(hash_sources(name).encode())
+    return digest.hexdigest()
+
+
+def referenced_names(obj: FunctionType | type) -> set[str]:
+    """List the global names used by a function, or by the methods and bases of
+    a class.
+    """
+
+    if not isinstance(obj, type):
+        return code_names(obj.__code__)
+
+    names = {base.__name__ for base in obj.__bases__}
+    for value in vars(obj).values():
+        if isinstance(value, property):
+            value = value.fget
+        # Unwrap the static and class methods
+        value = getattr(value, "__func__", value)
+        if isinstance(value, FunctionType):
+            names |= code_names(value.__code__)
+    return names
+
+
+def code_names(code: CodeType) -> set[str]:
+    """List the global names used by a code object and its nested functions."""
+
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= code_names(const)
+    return names
+
+
+def get_snapshot_prefix(day: int, year: int) -> str:
+    return f"y{year}-day{day:02}-"
+
+
+def get_parsed_key(solution: DaySolution, input_file: Path) -> str:
+    digest = hashlib.sha256(hash_file(input_file).encode())
+    digest.update(hash_parser(solution.module).encode())
+    return get_snapshot_prefix(solution.day, solution.year) + digest.hexdigest()[:16]
+
+
+def find_snapshots(year: int | None = None) -> list[Path]:
+    parsed_dir = get_parsed_directory()
+    if not parsed_dir.exists():
+        return []
+
+    prefix = f"y{year}-" if year is not None else ""
+    return sorted(x for x in parsed_dir.iterdir() if x.name.startswith(prefix))
+
+
+def freeze(parsed: Any) -> Any:
+    """Make the arrays of a loaded snapshot read-only, like the parse output."""
+
+    import numpy as np
+
+    if isinstance(parsed, np.ndarray):
+        parsed.flags.writeable = False
+    elif isinstance(parsed, (tuple, list)):
+        for x in parsed:
+            freeze(x)
+    return parsed
+
+
+def load_parsed(key: str) -> tuple[bool, Any]:
+    """Load a parse snapshot, returning whether it was found."""
+
+    parsed_dir = get_parsed_directory()
+    npz_file = parsed_dir / f"{key}.npz"
+    pickle_file = parsed_dir / f"{key}.pickle"
+
+    if npz_file.exists():
+        import numpy as np
+
+        with np.load(npz_file) as f:
+            return True, freeze(f["parsed"])
+
+    if pickle_file.exists():
+        with open(pickle_file, "rb") as f:
+            return True, freeze(pickle.load(f))
+
+    return False, None
+
+
+def save_parsed(key: str, parsed: Any) -> None:
+    """Save a parse snapshot, as npz for plain arrays and pickle otherwise."""
+
+    import numpy as np
+
+    parsed_dir = get_parsed_directory()
+    parsed_dir.mkdir(parents=True, exist_ok=True)
+
+    # Remove the stale snapshots of the same day
+    prefix = key[: key.rindex("-") + 1]
+    for old_file in parsed_dir.glob(f"{prefix}*"):
+        old_file.unlink()
+
+    if isinstance(parsed, np.ndarray) and parsed.dtype != object:
+        file, tmp_file = parsed_dir / f"{key}.npz", parsed_dir / f"{key}.tmp.npz"
+        np.savez(tmp_file, parsed=parsed)
+    else:
+        file, tmp_file = parsed_dir / f"{key}.pickle", parsed_dir / f"{key}.tmp"
+        try:
+            with open(tmp_file, "wb") as f:
+                pickle.dump(parsed, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.debug("Parsed input not snapshotted: %s", e)
+            tmp_file.unlink(missing_ok=True)
+            return
+    os.replace(tmp_file, file)
+
+
+def parse_cached(solution: DaySolution, input_file: Path) -> Any:
+    """Parse the input of a day, reusing the snapshot of a previous run."""
+
+    key = get_parsed_key(solution, input_file)
+    found, parsed = load_parsed(key)
+    if found:
+        logger.debug("Parsed input loaded from snapshot %s", key)
+        return parsed
+
+    parsed = solution.parse(solution.read())
+    save_parsed(key, parsed)
+    return parsed
+
+
+def clear_snapshots(year: int | None = None) -> int:
+    """Remove the parse snapshots, of a single year if given."""
+
+    snapshots = find_snapshots(year)
+    for snapshot in snapshots:
+        snapshot.unlink()
+    return len(snapshots)
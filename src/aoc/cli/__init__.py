@@ -3,12 +3,13 @@
 # SPDX-License-Identifier: MIT
 import logging
 import sys
+import time
 from datetime import UTC, datetime
+from pathlib import Path
 
 import click
 
 from aoc.__about__ import __version__
-from aoc.aoc import Aoc
 from aoc.utils import (
     create_day_structure,
     create_module_structure,
@@ -28,6 +29,26 @@ logger = logging.getLogger(__name__)
 
 MIN_AOC_YEAR = 2015
 
+# The sort keys of pstats and their aliases, pstats is imported only to profile
+PROFILE_SORT_KEYS = (
+    "calls",
+    "cumtime",
+    "cumulative",
+    "filename",
+    "line",
+    "module",
+    "name",
+    "ncalls",
+    "nfl",
+    "pcalls",
+    "stdname",
+    "time",
+    "tottime",
+)
+
+# Sub commands working on several days, they do not need the --day/--year prompts
+MULTI_DAY_COMMANDS = ("run-all", "bench", "cache", "startup-report", "fetch")
+
 
 @click.group(
     context_settings={"help_option_names": ["-h", "--help"]},
@@ -66,6 +87,11 @@ def aoc(ctx, *, verbose: bool, day: int, year: int, token: str) -> None:
         r_logger.setLevel(logging.DEBUG)
         logger.debug("Verbose mode enabled.")
 
+    if ctx.invoked_subcommand in MULTI_DAY_COMMANDS:
+        ctx.obj["year"] = year
+        ctx.obj["day"] = day
+        return
+
     if year == 0:
         i_year = click.prompt(
             "Enter the year of the Advent of Code", type=int, default=c_year
@@ -114,12 +140,71 @@ def init(ctx) -> None:
     required=False,
     default=0,
 )
+@click.option(
+    "--cache", "use_cache", is_flag=True, help="Reuse the answers already computed"
+)
+@click.option("--profile", is_flag=True, help="Profile the parts with cProfile")
+@click.option(
+    "--sort",
+    type=click.Choice(PROFILE_SORT_KEYS),
+    default="cumulative",
+    help="Sort key of the profile",
+)
+@click.option(
+    "--trace",
+    "traces",
+    multiple=True,
+    help="Enable the trace points matching a pattern like day03.* (repeatable)",
+)
+@click.option(
+    "--trace-out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="NDJSON trace file (default: data/trace.ndjson)",
+)
+@click.option(
+    "--trace-every", type=int, default=1, help="Keep one trace event out of N"
+)
+@click.option("--mem", is_flag=True, help="Trace the allocations and GC pauses")
+@click.option("--top", type=int, default=20, help="Number of functions/sites to show")
+@click.option(
+    "--out",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Write the profile as collapsed stacks for flamegraph tools",
+)
 @click.pass_context
-def run(ctx, part) -> None:
+def run(
+    ctx,
+    part: int,
+    use_cache: bool,
+    profile: bool,
+    traces: tuple[str, ...],
+    trace_out: Path | None,
+    trace_every: int,
+    mem: bool,
+    sort: str,
+    top: int,
+    out: Path | None,
+) -> None:
     day = ctx.obj["day"]
     year = ctx.obj["year"]
 
-    _run_day(day, year, part)
+    if traces:
+        from aoc import trace
+
+        trace_out = trace_out or get_data_directory() / trace.TRACE_FILE
+        trace.enable(list(traces), trace_out, trace_every)
+        ctx.call_on_close(trace.disable)
+        _msg = f"Tracing {', '.join(traces)} to {trace_out}"
+        logger.info(_msg)
+
+    if profile:
+        _profile_day(day, year, part, sort=sort, top=top, out=out)
+        return
+    if mem:
+        _memory_day(day, year, part, top=top)
+        return
+
+    _run_day(day, year, part, use_cache=use_cache)
 
 
 @aoc.command()
@@ -132,6 +217,222 @@ def fetch_day(ctx) -> None:
     _fetch_day(day, year, token)
 
 
+@aoc.command(help="Fetch the inputs of the selected days concurrently.")
+@click.option(
+    "--year",
+    "years",
+    type=int,
+    multiple=True,
+    help="Year to fetch, can be repeated (default: --year of aoc)",
+)
+@click.option("--days", help="Days to fetch, e.g. 1-25 or 1,3,5-7")
+@click.option("--all", "all_days", is_flag=True, help="Fetch every released day")
+@click.option("--jobs", "-j", type=int, default=4, help="Number of parallel fetches")
+@click.option("--refresh", is_flag=True, help="Check the fetched inputs for changes")
+@click.pass_context
+def fetch(
+    ctx,
+    years: tuple[int, ...],
+    days: str | None,
+    all_days: bool,
+    jobs: int,
+    refresh: bool,
+) -> None:
+    from aoc.aoc import Aoc, released_days
+    from aoc.runner import parse_days
+
+    if not years and ctx.obj["year"]:
+        years = (ctx.obj["year"],)
+    if not days and ctx.obj["day"]:
+        days = str(ctx.obj["day"])
+    if not years or not (days or all_days):
+        click.echo("Select the days to fetch with --year and --days or --all")
+        sys.exit(1)
+
+    inputs = []
+    for year in years:
+        create_year_data_directory(year)
+        released = released_days(year)
+        selected = released if all_days else parse_days(days)
+        inputs.extend(
+            (year, day, get_year_data_directory(year) / f"day{day:02}_input.txt")
+            for day in selected
+            if day in released
+        )
+
+    try:
+        aoc = Aoc(ctx.obj["token"])
+    except ValueError:
+        logger.exception("No session token found.")
+        logger.info("Aborting...")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = aoc.fetch_inputs(inputs, max_workers=jobs, refresh=refresh)
+    aoc.close()
+
+    for (year, day), status in results.items():
+        _msg = f"{year} day {day:02}: {status}"
+        logger.info(_msg)
+    _msg = f"Fetched {len(results)} inputs in {time.perf_counter() - start:.2f}s"
+    logger.info(_msg)
+
+    if any(status.startswith("error") for status in results.values()):
+        sys.exit(1)
+
+
+@aoc.command(name="run-all", help="Run every part of the selected days in parallel.")
+@click.option(
+    "--year",
+    "years",
+    type=int,
+    multiple=True,
+    help="Year to run, can be repeated (default: all years)",
+)
+@click.option("--days", help="Days to run, e.g. 1-25 or 1,3,5-7 (default: all days)")
+@click.option(
+    "--jobs", "-j", type=int, help="Number of worker processes (default: nb cpus)"
+)
+@click.pass_context
+def run_all_days(ctx, years: tuple[int, ...], days: str | None, jobs: int | None):
+    from aoc.runner import find_jobs, find_years, format_summary, parse_days, run_all
+
+    if not years:
+        years = (ctx.obj["year"],) if ctx.obj["year"] else find_years()
+    if not days and ctx.obj["day"]:
+        days = str(ctx.obj["day"])
+
+    selected_days = parse_days(days) if days else None
+    all_jobs = find_jobs(list(years), selected_days)
+    if not all_jobs:
+        logger.info("No day to run.")
+        return
+
+    _msg = f"Running {len(all_jobs)} parts of year(s) {', '.join(map(str, years))}"
+    logger.info(_msg)
+
+    start = time.perf_counter()
+    results = run_all(all_jobs, max_workers=jobs)
+    elapsed = time.perf_counter() - start
+
+    logger.info("")
+    logger.info(format_summary(results, elapsed))
+
+    if any(result.error is not None for result in results):
+        sys.exit(1)
+
+
+@aoc.command(help="Benchmark the selected days and keep a timing history.")
+@click.option(
+    "--year",
+    "years",
+    type=int,
+    multiple=True,
+    help="Year to benchmark, can be repeated (default: all years)",
+)
+@click.option("--days", help="Days to benchmark, e.g. 1-25 or 1,3,5-7")
+@click.option(
+    "--part", "-p", type=int, default=0, help="Part to benchmark (default: both)"
+)
+@click.option("--repeat", "-n", type=int, default=5, help="Number of measured runs")
+@click.option("--warmup", "-w", type=int, default=1, help="Number of warmup runs")
+@click.option("--no-save", is_flag=True, help="Do not record the results")
+@click.pass_context
+def bench(
+    ctx,
+    years: tuple[int, ...],
+    days: str | None,
+    part: int,
+    repeat: int,
+    warmup: int,
+    no_save: bool,
+) -> None:
+    from aoc.bench import (
+        bench_job,
+        format_result,
+        last_entry,
+        load_history,
+        save_results,
+    )
+    from aoc.runner import find_jobs, find_years, parse_days
+
+    if not years:
+        years = (ctx.obj["year"],) if ctx.obj["year"] else find_years()
+    if not days and ctx.obj["day"]:
+        days = str(ctx.obj["day"])
+
+    selected_days = parse_days(days) if days else None
+    jobs = [
+        job for job in find_jobs(list(years), selected_days) if part in (0, job.part)
+    ]
+
+    history = load_history()
+    results = []
+    for job in jobs:
+        try:
+            result = bench_job(job, repeat, warmup)
+        except Exception:
+            logger.exception("%d day %02d part %d failed", job.year, job.day, job.part)
+            continue
+        results.append(result)
+        logger.info(format_result(result, last_entry(history, job)))
+
+    if results and not no_save:
+        save_results(results, repeat, warmup)
+
+
+@aoc.group(help="Manage the answer and parse caches of aoc run --cache.")
+def cache() -> None:
+    pass
+
+
+@cache.command(help="Show the answer cache content.")
+def stats() -> None:
+    from aoc.cache import get_stats
+
+    cache_stats = get_stats()
+    _msg = (
+        f"{cache_stats.entries} cached answers, {cache_stats.hits} hits, "
+        f"{cache_stats.size / 1024:.1f} KiB"
+    )
+    logger.info(_msg)
+    for year, entries in cache_stats.per_year.items():
+        _msg = f"  {year}: {entries} answers"
+        logger.info(_msg)
+    _msg = (
+        f"{cache_stats.snapshots} parse snapshots, "
+        f"{cache_stats.snapshots_size / 1024:.1f} KiB"
+    )
+    logger.info(_msg)
+
+
+@cache.command(help="Remove the cached answers and parse snapshots.")
+@click.option("--year", type=int, help="Only remove the entries of this year")
+def clear(year: int | None) -> None:
+    from aoc.cache import clear_answers, clear_snapshots
+
+    removed = clear_answers(year)
+    removed_snapshots = clear_snapshots(year)
+    _msg = f"Removed {removed} cached answers and {removed_snapshots} snapshots."
+    logger.info(_msg)
+
+
+@aoc.command(
+    name="startup-report", help="Show the import cost of the CLI and a day module."
+)
+@click.option("--top", "-n", type=int, default=20, help="Number of modules to show")
+@click.pass_context
+def startup_report(ctx, top: int) -> None:
+    from aoc.startup import format_report, measure_imports
+
+    modules = ["aoc.cli"]
+    if ctx.obj["day"] and ctx.obj["year"]:
+        modules.append(f"aoc.y{ctx.obj['year']}.day{ctx.obj['day']:02}")
+
+    imports = measure_imports(modules)
+    logger.info(format_report(imports, top))
+
+
 @aoc.command(help="Initialize, fetch and run the given day and year.")
 @click.pass_context
 def day(ctx) -> None:
@@ -162,14 +463,14 @@ def _init_day(day: int, year: int) -> None:
     logger.info(_msg)
 
 
-def _run_day(day: int, year: int, part: int) -> None:
+def _run_day(day: int, year: int, part: int, *, use_cache: bool = False) -> None:
     """Run the given day and year."""
 
     _msg = f"Running day {day} of year {year}"
     logger.info(_msg)
 
     try:
-        run_day(day, year, part)
+        run_day(day, year, part, use_cache=use_cache)
     except FileNotFoundError:
         logger.exception("Day file does not exist.")
         logger.info("Aborting...")
@@ -178,6 +479,40 @@ def _run_day(day: int, year: int, part: int) -> None:
     _msg = f"Day {day} of year {year} run."
 
 
+def _profile_day(
+    day: int, year: int, part: int, *, sort: str, top: int, out: Path | None
+) -> None:
+    """Profile the given day and year, without its parse stage."""
+
+    from aoc.profiling import profile_day
+
+    _msg = f"Profiling day {day} of year {year}"
+    logger.info(_msg)
+
+    try:
+        profile_day(day, year, part, sort=sort, top=top, out=out)
+    except (FileNotFoundError, ModuleNotFoundError):
+        logger.exception("Day file does not exist.")
+        logger.info("Aborting...")
+        sys.exit(1)
+
+
+def _memory_day(day: int, year: int, part: int, *, top: int) -> None:
+    """Report the memory usage of the given day and year."""
+
+    from aoc.profiling import memory_day
+
+    _msg = f"Tracing the memory of day {day} of year {year}"
+    logger.info(_msg)
+
+    try:
+        memory_day(day, year, part, top=top)
+    except (FileNotFoundError, ModuleNotFoundError):
+        logger.exception("Day file does not exist.")
+        logger.info("Aborting...")
+        sys.exit(1)
+
+
 def _fetch_day(day: int, year: int, token: str) -> None:
     """Fetch the input data for the given day and year."""
 
@@ -190,6 +525,8 @@ def _fetch_day(day: int, year: int, token: str) -> None:
     if not get_year_test_directory(year).exists():
         create_year_test_directory(year)
 
+    from aoc.aoc import Aoc, FetchError
+
     try:
         aoc = Aoc(token)
         input_file = get_year_data_directory(year=year) / f"day{day:02}_input.txt"
@@ -198,3 +535,7 @@ def _fetch_day(day: int, year: int, token: str) -> None:
         logger.exception("No session token found.")
         logger.info("Aborting...")
         sys.exit(1)
+    except FetchError:
+        logger.exception("Fetching the input failed.")
+        logger.info("Aborting...")
+        sys.exit(1)
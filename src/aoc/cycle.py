@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Cycle:
+    """States repeat from step start on, every length steps."""
+
+    start: int
+    length: int
+
+    def reduce(self, n: int) -> int:
+        """First step with the same state as step n."""
+
+        if n < self.start:
+            return n
+        return self.start + (n - self.start) % self.length
+
+
+@dataclass(frozen=True)
+class Period:
+    """A signal fires at step offset, then every length steps."""
+
+    offset: int
+    length: int
+
+
+def _identity(state: Any) -> Any:
+    return state
+
+
+def has_cycle(
+    x0: Any,
+    step: Callable[[Any], Any | None],
+    key: Callable[[Any], Hashable] | None = None,
+) -> bool:
+    """Whether the sequence loops, step returning None when it stops."""
+
+    return _brent_length(x0, step, key or _identity) is not None
+
+
+def _brent_length(
+    x0: Any, step: Callable[[Any], Any | None], key: Callable[[Any], Hashable]
+) -> int | None:
+    # The tortoise teleports to the hare at each power of two
+    power = length = 1
+    tortoise = key(x0)
+    hare = step(x0)
+    while hare is not None and key(hare) != tortoise:
+        if power == length:
+            tortoise = key(hare)
+            power *= 2
+            length = 0
+        hare = step(hare)
+        length += 1
+    return None if hare is None else length
+
+
+def brent(
+    x0: Any,
+    step: Callable[[Any], Any | None],
+    key: Callable[[Any], Hashable] | None = None,
+) -> Cycle | None:
+    """Find the cycle of the sequence x0, step(x0), ... in constant memory.
+
+    The states are compared by key, to pack them or to leave out what does
+    not change the sequence. step returns None when the sequence stops,
+    there is then no cycle.
+    """
+
+    key = key or _identity
+    length = _brent_length(x0, step, key)
+    if length is None:
+        return None
+
+    # The hare runs length steps ahead, they meet at the start of the cycle
+    tortoise = hare = x0
+    for _ in range(length):
+        hare = step(hare)
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+    return Cycle(start, length)
+
+
+def floyd(
+    x0: Any,
+    step: Callable[[Any], Any | None],
+    key: Callable[[Any], Hashable] | None = None,
+) -> Cycle | None:
+    """Find the cycle of the sequence, like brent, with a hare twice as fast."""
+
+    key = key or _identity
+
+    def advance(state: Any | None) -> Any | None:
+        return None if state is None else step(state)
+
+    tortoise, hare = advance(x0), advance(advance(x0))
+    while hare is not None and key(tortoise) != key(hare):
+        tortoise = advance(tortoise)
+        hare = advance(advance(hare))
+    if hare is None:
+        return None
+
+    start = 0
+    tortoise = x0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    length = 1
+    hare = step(tortoise)
+    while key(tortoise) != key(hare):
+        hare = step(hare)
+        length += 1
+    return Cycle(start, length)
+
+
+def simulate_until(
+    x0: Any,
+    step: Callable[[Any], Any],
+    n: int,
+    key: Callable[[Any], Hashable] | None = None,
+) -> Any:
+    """State after n steps, skipping the full cycles once one is found.
+
+    The states met are kept, n can be far larger than the steps simulated.
+    """
+
+    key = key or _identity
+    states = [x0]
+    seen = {key(x0): 0}
+    state = x0
+    for i in range(1, n + 1):
+        state = step(state)
+        state_key = key(state)
+        if state_key in seen:
+            start = seen[state_key]
+            return states[Cycle(start, i - start).reduce(n)]
+        seen[state_key] = i
+        states.append(state)
+    return state
+
+
+def signal_periods(
+    step: Callable[[int], Iterable[Hashable]],
+    signals: Iterable[Hashable],
+    limit: int,
+) -> dict[Hashable, Period]:
+    """Period of each signal, from the first two steps it fires at.
+
+    step(i) runs the step i, counted from 1, and returns the signals fired.
+    The simulation stops once every signal fired twice, or after limit
+    steps. The signals not seen twice are left out.
+    """
+
+    pending = set(signals)
+    first: dict[Hashable, int] = {}
+    periods: dict[Hashable, Period] = {}
+    for i in range(1, limit + 1):
+        if not pending:
+            break
+        for signal in step(i):
+            if signal not in pending:
+                continue
+            if signal not in first:
+                first[signal] = i
+            elif i > first[signal]:
+                periods[signal] = Period(first[signal], i - first[signal])
+                pending.discard(signal)
+    return periods
+
+
+def crt(residues: Iterable[int], moduli: Iterable[int]) -> tuple[int, int] | None:
+    """Solve x = r (mod m) for every pair, the moduli need not be coprime.
+
+    Returns (x, lcm of the moduli), x the smallest non-negative solution,
+    or None when the congruences disagree.
+    """
+
+    x, m = 0, 1
+    for r, n in zip(residues, moduli, strict=True):
+        g = math.gcd(m, n)
+        if (r - x) % g:
+            return None
+        # x + m * k = r (mod n), with k = (r - x) / g * (m / g)^-1 (mod n / g)
+        k = (r - x) // g * pow(m // g, -1, n // g) % (n // g)
+        x += m * k
+        m = m // g * n
+        x %= m
+    return x, m
+
+
+def first_common(periods: Iterable[Period]) -> int | None:
+    """First step all the signals fire at, None if they never fire together."""
+
+    periods = list(periods)
+    if not periods:
+        return None
+    solved = crt([p.offset for p in periods], [p.length for p in periods])
+    if solved is None:
+        return None
+
+    x, m = solved
+    latest = max(p.offset for p in periods)
+    if x < latest:
+        x += (latest - x + m - 1) // m * m
+    return x
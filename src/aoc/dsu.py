@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import heapq
+
+
+class DisjointSet:
+    """Union-find over the elements 0..n-1, with union by size.
+
+    The paths are compressed by find, unless the unions can be rolled back:
+    rollback needs the trees to stay as the unions built them.
+    """
+
+    def __init__(self, n: int, *, rollback: bool = False) -> None:
+        self.parent = list(range(n))
+        self.size = [1] * n
+        self.components = n
+        self.can_rollback = rollback
+        # Roots attached by each union, to undo them
+        self.history: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self.parent)
+
+    def find(self, x: int) -> int:
+        parent = self.parent
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+
+        if not self.can_rollback:
+            while parent[x] != root:
+                parent[x], x = root, parent[x]
+        return root
+
+    def union(self, a: int, b: int) -> bool:
+        """Merge the sets of a and b, returning whether they were distinct."""
+
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+        self.components -= 1
+        if self.can_rollback:
+            self.history.append(b)
+        return True
+
+    def connected(self, a: int, b: int) -> bool:
+        return self.find(a) == self.find(b)
+
+    def component_size(self, x: int) -> int:
+        return self.size[self.find(x)]
+
+    def largest_k(self, k: int) -> list[int]:
+        """Sizes of the k largest sets, largest first."""
+
+        roots = (x for x, parent in enumerate(self.parent) if x == parent)
+        return heapq.nlargest(k, (self.size[x] for x in roots))
+
+    def snapshot(self) -> int:
+        """Mark the current state, to roll back to with rollback()."""
+
+        if not self.can_rollback:
+            _msg = "The disjoint set was built without rollback"
+            raise ValueError(_msg)
+        return len(self.history)
+
+    def rollback(self, snapshot: int) -> None:
+        """Undo the unions made since the snapshot."""
+
+        while len(self.history) > snapshot:
+            b = self.history.pop()
+            a = self.parent[b]
+            self.parent[b] = b
+            self.size[a] -= self.size[b]
+            self.components += 1
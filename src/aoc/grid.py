@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+import numpy as np
+
+from aoc.utils import byte_mask, lines_to_grid, read_grid
+
+# Value of the border cells, it differs from every printable character
+BORDER = 0
+
+
+class Grid:
+    """A character grid stored as one contiguous uint8 array.
+
+    The cells are addressed by flat int indices. A one cell border of
+    sentinel values surrounds the grid, the neighbors of an inner cell are
+    always valid indices and a walk stops on the border value instead of
+    checking the bounds.
+    """
+
+    def __init__(self, cells: np.ndarray, border: int = BORDER) -> None:
+        self.height, self.width = cells.shape
+        self.stride = self.width + 2
+        self.border = border
+
+        padded = np.full((self.height + 2, self.stride), border, dtype=np.uint8)
+        padded[1:-1, 1:-1] = cells
+        self.data = padded.ravel()
+        # Indexing a memoryview is much faster than numpy for a single cell
+        self.view = memoryview(self.data)
+
+        # Up, right, down, left then the diagonals clockwise from up-right
+        self.n4 = (-self.stride, 1, self.stride, -1)
+        self.n8 = (
+            *self.n4,
+            1 - self.stride,
+            1 + self.stride,
+            self.stride - 1,
+            -self.stride - 1,
+        )
+
+    @classmethod
+    def from_lines(cls, lines: Iterable[str], border: int = BORDER) -> Grid:
+        return cls(lines_to_grid(list(lines)), border)
+
+    @classmethod
+    def read(cls, day: int, year: int, border: int = BORDER) -> Grid:
+        return cls(read_grid(day, year), border)
+
+    def copy(self) -> Grid:
+        return Grid(self.cells, self.border)
+
+    def __reduce__(self) -> tuple:
+        # The memoryview cannot be pickled, rebuild the grid from its cells
+        return Grid, (self.cells.copy(), self.border)
+
+    @property
+    def cells(self) -> np.ndarray:
+        """(height, width) view of the cells without the border."""
+
+        return self.data.reshape(self.height + 2, self.stride)[1:-1, 1:-1]
+
+    def __getitem__(self, index: int) -> int:
+        return self.view[index]
+
+    def __setitem__(self, index: int, value: int) -> None:
+        self.view[index] = value
+
+    def __len__(self) -> int:
+        return self.height * self.width
+
+    def __str__(self) -> str:
+        return "\n".join(row.tobytes().decode() for row in self.cells)
+
+    def index(self, row: int, col: int) -> int:
+        return (row + 1) * self.stride + col + 1
+
+    def coords(self, index: int) -> tuple[int, int]:
+        row, col = divmod(index, self.stride)
+        return row - 1, col - 1
+
+    def to_complex(self, index: int) -> complex:
+        """Convert an index to the complex(row, col) position of aoc.utils."""
+
+        row, col = self.coords(index)
+        return complex(row, col)
+
+    def from_complex(self, pos: complex) -> int:
+        return self.index(int(pos.real), int(pos.imag))
+
+    def is_border(self, index: int) -> bool:
+        return self.view[index] == self.border
+
+    def indices(self) -> np.ndarray:
+        """Flat indices of the inner cells, in row order."""
+
+        rows = np.arange(1, self.height + 1) * self.stride
+        return (rows[:, None] + np.arange(1, self.width + 1)).ravel()
+
+    def mask(self, chars: bytes | str) -> np.ndarray:
+        """(height, width) boolean mask of the cells holding one of the chars."""
+
+        return byte_mask(self.cells, chars)
+
+    def find(self, chars: bytes | str) -> np.ndarray:
+        """Flat indices of the cells holding one of the chars."""
+
+        return np.flatnonzero(byte_mask(self.data, chars))
+
+    def find_one(self, char: bytes | str) -> int:
+        (found,) = self.find(char)
+        return int(found)
+
+    def count(self, chars: bytes | str) -> int:
+        return int(np.count_nonzero(self.mask(chars)))
+
+    def count_neighbors(self, chars: bytes | str, diagonals: bool = True) -> np.ndarray:
+        """(height, width) count of the neighbors holding one of the chars."""
+
+        mask = byte_mask(self.data, chars).astype(np.uint8)
+        counts = np.zeros_like(self.data)
+        inner = slice(self.stride + 1, len(self.data) - self.stride - 1)
+        for offset in self.n8 if diagonals else self.n4:
+            counts[inner] += mask[inner.start + offset : inner.stop + offset]
+        return counts.reshape(self.height + 2, self.stride)[1:-1, 1:-1]
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import bisect
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class IntervalSet:
+    """A set of integers stored as sorted, merged intervals.
+
+    The bounds are inclusive, like the puzzle ranges. The starts and ends
+    are kept in parallel array("q"), numpy views them without a copy.
+    """
+
+    __slots__ = ("ends", "starts")
+
+    def __init__(self, intervals: Iterable[tuple[int, int]] = ()) -> None:
+        self.starts = array("q")
+        self.ends = array("q")
+        for start, end in sorted(
+            (min(start, end), max(start, end)) for start, end in intervals
+        ):
+            # Merge the overlapping and the contiguous intervals
+            if self.ends and start <= self.ends[-1] + 1:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    @classmethod
+    def from_merged(cls, starts: Iterable[int], ends: Iterable[int]) -> IntervalSet:
+        """Build a set from intervals already sorted and merged."""
+
+        interval_set = cls()
+        interval_set.starts.extend(starts)
+        interval_set.ends.extend(ends)
+        return interval_set
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return zip(self.starts, self.ends)
+
+    def __repr__(self) -> str:
+        return f"IntervalSet({list(self)})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self.starts == other.starts and self.ends == other.ends
+
+    def __contains__(self, value: int) -> bool:
+        return self.contains(value)
+
+    def __or__(self, other: IntervalSet) -> IntervalSet:
+        return self.union(other)
+
+    def __and__(self, other: IntervalSet) -> IntervalSet:
+        return self.intersection(other)
+
+    def __sub__(self, other: IntervalSet) -> IntervalSet:
+        return self.difference(other)
+
+    @property
+    def total_length(self) -> int:
+        """Number of integers in the set."""
+
+        return sum(self.ends) - sum(self.starts) + len(self)
+
+    def contains(self, value: int) -> bool:
+        i = bisect.bisect_right(self.starts, value) - 1
+        return i >= 0 and value <= self.ends[i]
+
+    def contains_many(self, values: np.ndarray) -> np.ndarray:
+        """Boolean mask of the values in the set."""
+
+        import numpy as np
+
+        starts = np.frombuffer(self.starts, dtype=np.int64)
+        ends = np.frombuffer(self.ends, dtype=np.int64)
+        if not len(starts):
+            return np.zeros(np.shape(values), dtype=bool)
+
+        i = np.searchsorted(starts, values, side="right") - 1
+        return (i >= 0) & (values <= ends[np.maximum(i, 0)])
+
+    def union(self, other: IntervalSet) -> IntervalSet:
+        return IntervalSet([*self, *other])
+
+    def intersection(self, other: IntervalSet) -> IntervalSet:
+        starts, ends = [], []
+        i = j = 0
+        while i < len(self) and j < len(other):
+            start = max(self.starts[i], other.starts[j])
+            end = min(self.ends[i], other.ends[j])
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+            # Drop the interval ending first, it cannot meet the next ones
+            if self.ends[i] < other.ends[j]:
+                i += 1
+            else:
+                j += 1
+        return IntervalSet.from_merged(starts, ends)
+
+    def difference(self, other: IntervalSet) -> IntervalSet:
+        starts, ends = [], []
+        j = 0
+        for start, end in self:
+            # Skip the intervals of other ending before this one
+            while j < len(other) and other.ends[j] < start:
+                j += 1
+
+            k = j
+            while k < len(other) and other.starts[k] <= end:
+                if other.starts[k] > start:
+                    starts.append(start)
+                    ends.append(other.starts[k] - 1)
+                start = max(start, other.ends[k] + 1)
+                k += 1
+            if start <= end:
+                starts.append(start)
+                ends.append(end)
+        return IntervalSet.from_merged(starts, ends)
@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    Matrix = Sequence[Sequence[int]]
+
+
+def identity(n: int) -> list[list[int]]:
+    return [[int(i == j) for j in range(n)] for i in range(n)]
+
+
+def egcd(a: int, b: int) -> tuple[int, int, int]:
+    """(g, x, y) with a * x + b * y = g, g the non-negative gcd."""
+
+    x0, y0, x1, y1 = 1, 0, 0, 1
+    while b:
+        q, r = divmod(a, b)
+        a, b = b, r
+        x0, x1 = x1, x0 - q * x1
+        y0, y1 = y1, y0 - q * y1
+    if a < 0:
+        return -a, -x0, -y0
+    return a, x0, y0
+
+
+def rref(
+    rows: Sequence[Sequence[int | Fraction]],
+) -> tuple[list[list[Fraction]], list[int]]:
+    """Reduced row echelon form, exact, and the pivot column of each row.
+
+    The rows without pivot, all zeros, are left out.
+    """
+
+    matrix = [[Fraction(x) for x in row] for row in rows]
+    ncols = len(matrix[0]) if matrix else 0
+    pivots: list[int] = []
+    r = 0
+    for c in range(ncols):
+        pivot = next((i for i in range(r, len(matrix)) if matrix[i][c]), None)
+        if pivot is None:
+            continue
+        matrix[r], matrix[pivot] = matrix[pivot], matrix[r]
+        lead = matrix[r][c]
+        matrix[r] = [x / lead for x in matrix[r]]
+        for i, row in enumerate(matrix):
+            if i != r and row[c]:
+                factor = row[c]
+                matrix[i] = [x - factor * y for x, y in zip(row, matrix[r])]
+        pivots.append(c)
+        r += 1
+    return matrix[:r], pivots
+
+
+def solve(
+    a: Matrix, b: Sequence[int]
+) -> tuple[list[Fraction], list[list[Fraction]]] | None:
+    """Rational solutions of a @ x = b, None if there is none.
+
+    Returns a solution and a basis of the null space of a, every solution
+    being the first plus a combination of the basis.
+    """
+
+    ncols = len(a[0])
+    reduced, pivots = rref([[*row, rhs] for row, rhs in zip(a, b, strict=True)])
+    if pivots and pivots[-1] == ncols:
+        return None
+
+    x = [Fraction(0)] * ncols
+    for row, pivot in zip(reduced, pivots):
+        x[pivot] = row[-1]
+
+    basis = []
+    for free in (c for c in range(ncols) if c not in pivots):
+        vector = [Fraction(0)] * ncols
+        vector[free] = Fraction(1)
+        for row, pivot in zip(reduced, pivots):
+            vector[pivot] = -row[free]
+        basis.append(vector)
+    return x, basis
+
+
+def hermite_normal_form(a: Matrix) -> tuple[list[list[int]], list[list[int]]]:
+    """Row style Hermite normal form h of a, with u unimodular and u @ a = h.
+
+    h is upper triangular, its pivots positive and the entries above a pivot
+    reduced modulo the pivot.
+    """
+
+    h = [[int(x) for x in row] for row in a]
+    u = identity(len(h))
+    ncols = len(h[0]) if h else 0
+
+    def combine(p: int, q: int, r: int, s: int, i: int, j: int) -> None:
+        # Rows (i, j) become (p * i + q * j, r * i + s * j)
+        for m in (h, u):
+            m[i], m[j] = (
+                [p * x + q * y for x, y in zip(m[i], m[j])],
+                [r * x + s * y for x, y in zip(m[i], m[j])],
+            )
+
+    row = 0
+    for col in range(ncols):
+        if row == len(h):
+            break
+        for i in range(row + 1, len(h)):
+            if h[i][col]:
+                g, x, y = egcd(h[row][col], h[i][col])
+                combine(x, y, -h[i][col] // g, h[row][col] // g, row, i)
+        if not h[row][col]:
+            continue
+
+        if h[row][col] < 0:
+            h[row] = [-x for x in h[row]]
+            u[row] = [-x for x in u[row]]
+        for i in range(row):
+            factor = h[i][col] // h[row][col]
+            if factor:
+                h[i] = [x - factor * y for x, y in zip(h[i], h[row])]
+                u[i] = [x - factor * y for x, y in zip(u[i], u[row])]
+        row += 1
+    return h, u
+
+
+def smith_normal_form(
+    a: Matrix,
+) -> tuple[list[list[int]], list[list[int]], list[list[int]]]:
+    """Smith normal form d of a, with u, v unimodular and u @ a @ v = d.
+
+    d is diagonal, its entries non-negative, each one dividing the next.
+    """
+
+    d = [[int(x) for x in row] for row in a]
+    nrows, ncols = len(d), len(d[0]) if d else 0
+    u, v = identity(nrows), identity(ncols)
+
+    def add_row(src: int, dst: int, factor: int) -> None:
+        for m in (d, u):
+            m[dst] = [x + factor * y for x, y in zip(m[dst], m[src])]
+
+    def add_col(src: int, dst: int, factor: int) -> None:
+        for m in (d, v):
+            for row in m:
+                row[dst] += factor * row[src]
+
+    def swap(t: int, i: int, j: int) -> None:
+        for m in (d, u):
+            m[t], m[i] = m[i], m[t]
+        for m in (d, v):
+            for row in m:
+                row[t], row[j] = row[j], row[t]
+
+    for t in range(min(nrows, ncols)):
+        while True:
+            # The smallest entry left goes to the diagonal, the others are reduced by it
+            entries = [
+                (abs(d[i][j]), i, j)
+                for i in range(t, nrows)
+                for j in range(t, ncols)
+                if d[i][j]
+            ]
+            if not entries:
+                return d, u, v
+            _, i, j = min(entries)
+            swap(t, i, j)
+
+            for i in range(t + 1, nrows):
+                add_row(t, i, -(d[i][t] // d[t][t]))
+            for j in range(t + 1, ncols):
+                add_col(t, j, -(d[t][j] // d[t][t]))
+            if any(d[i][t] for i in range(t + 1, nrows)) or any(
+                d[t][j] for j in range(t + 1, ncols)
+            ):
+                continue
+
+            # The next entries must be multiples of this one
+            rest = next(
+                (
+                    i
+                    for i in range(t + 1, nrows)
+                    for j in range(t + 1, ncols)
+                    if d[i][j] % d[t][t]
+                ),
+                None,
+            )
+            if rest is None:
+                break
+            add_row(rest, t, 1)
+
+        if d[t][t] < 0:
+            d[t] = [-x for x in d[t]]
+            u[t] = [-x for x in u[t]]
+    return d, u, v
+
+
+def solve_integer(
+    a: Matrix, b: Sequence[int]
+) -> tuple[list[int], list[list[int]]] | None:
+    """Integer solutions of a @ x = b, None if there is none.
+
+    Like solve, returns a solution and a basis of the integer null space,
+    found with the Smith normal form: with u @ a @ v = d, x = v @ z and
+    d @ z = u @ b.
+    """
+
+    d, u, v = smith_normal_form(a)
+    ncols = len(v)
+    c = [sum(x * y for x, y in zip(row, b, strict=True)) for row in u]
+
+    z = [0] * ncols
+    free = []
+    for i in range(ncols):
+        diagonal = d[i][i] if i < len(d) else 0
+        if not diagonal:
+            free.append(i)
+        elif c[i] % diagonal:
+            return None
+        else:
+            z[i] = c[i] // diagonal
+    if any(c[i] for i in range(ncols, len(d))) or any(c[i] for i in free if i < len(d)):
+        return None
+
+    x = [sum(p * q for p, q in zip(row, z)) for row in v]
+    basis = [[row[i] for row in v] for i in free]
+    return x, basis
+
+
+def min_integer_solution(
+    a: Matrix,
+    b: Sequence[int],
+    upper: Sequence[int],
+    cost: Sequence[int] | None = None,
+) -> list[int] | None:
+    """Integer x with 0 <= x <= upper and a @ x = b of the lowest cost @ x.
+
+    The pivot variables of the reduced system follow from the free ones,
+    which are searched depth first. The range of each free variable is
+    narrowed by the bounds of the pivot variables, and a branch stops as
+    soon as its cost cannot get below the best one. The cost defaults to
+    the sum of x.
+    """
+
+    ncols = len(upper)
+    cost = [1] * ncols if cost is None else list(cost)
+    reduced, pivots = rref([[*row, rhs] for row, rhs in zip(a, b, strict=True)])
+    if pivots and pivots[-1] == ncols:
+        return None
+    free = sorted((c for c in range(ncols) if c not in pivots), key=upper.__getitem__)
+    bounds = [upper[f] for f in free]
+
+    # Scaled to integers: scale * x[pivot] = rhs - sum(coefs * x[free])
+    scales, rhs, coefs = [], [], []
+    for row in reduced:
+        scale = math.lcm(*(x.denominator for x in row))
+        scales.append(scale)
+        rhs.append(int(row[-1] * scale))
+        coefs.append([int(row[f] * scale) for f in free])
+    # The pivot values, scaled, cannot go over
+    limits = [scale * upper[p] for scale, p in zip(scales, pivots)]
+
+    # cost @ x = (base + weights @ x[free]) / denominator
+    fractions = [
+        cost[f] - sum(cost[p] * row[f] for row, p in zip(reduced, pivots)) for f in free
+    ]
+    constant = sum(cost[p] * row[-1] for row, p in zip(reduced, pivots))
+    denominator = math.lcm(constant.denominator, *(w.denominator for w in fractions))
+    base = int(constant * denominator)
+    weights = [int(w * denominator) for w in fractions]
+
+    # Range of the sums over the free variables from k on, at most
+    nfree = len(free)
+    low = [[0] * (nfree + 1) for _ in reduced]
+    high = [[0] * (nfree + 1) for _ in reduced]
+    for r, row in enumerate(coefs):
+        for k in reversed(range(nfree)):
+            term = row[k] * bounds[k]
+            low[r][k] = low[r][k + 1] + min(term, 0)
+            high[r][k] = high[r][k + 1] + max(term, 0)
+    cheapest = [0] * (nfree + 1)
+    for k in reversed(range(nfree)):
+        cheapest[k] = cheapest[k + 1] + min(weights[k] * bounds[k], 0)
+
+    best: list[int] | None = None
+    best_cost = math.inf
+    values = [0] * nfree
+
+    def search(k: int, totals: list[int], partial: int) -> None:
+        nonlocal best, best_cost
+        if k == nfree:
+            x = [0] * ncols
+            for f, value in zip(free, values):
+                x[f] = value
+            for p, scale, limit, total in zip(pivots, scales, limits, totals):
+                if total % scale or not 0 <= total <= limit:
+                    return
+                x[p] = total // scale
+            best, best_cost = x, partial
+            return
+
+        # 0 <= total - coef * value - rest <= limit, rest in [low, high]
+        first, last = 0, bounds[k]
+        for r, total in enumerate(totals):
+            coef = coefs[r][k]
+            top = total - low[r][k + 1]
+            bottom = total - high[r][k + 1] - limits[r]
+            if coef > 0:
+                first = max(first, -(-bottom // coef))
+                last = min(last, top // coef)
+            elif coef < 0:
+                first = max(first, -(top // -coef))
+                last = min(last, bottom // coef)
+            elif bottom > 0 or top < 0:
+                return
+
+        weight = weights[k]
+        values_range = (
+            range(first, last + 1) if weight >= 0 else range(last, first - 1, -1)
+        )
+        for value in values_range:
+            partial_cost = partial + weight * value
+            if partial_cost + cheapest[k + 1] >= best_cost:
+                break
+            values[k] = value
+            search(
+                k + 1,
+                [total - row[k] * value for row, total in zip(coefs, totals)],
+                partial_cost,
+            )
+
+    search(0, rhs, base)
+    return best
+
+
+def _fits_int64(a: np.ndarray, b: np.ndarray) -> bool:
+    # Every product has an entry of a, the differences of two must fit
+    max_a = int(abs(a).max()) if a.size else 0
+    max_b = int(abs(b).max()) if b.size else 0
+    return 2 * max_a * max(max_a, max_b) < 2**63
+
+
+def solve_2x2(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Integer solutions of the systems a[k] @ x[k] = b[k], all at once.
+
+    a has a shape (n, 2, 2) and b a shape (n, 2). Returns x and a mask of
+    the systems with a single, integer, solution, x being 0 for the others.
+    The arrays are int64, or Python ints when their products could
+    overflow.
+    """
+
+    import numpy as np
+
+    a, b = np.asarray(a), np.asarray(b)
+    dtype = np.int64 if _fits_int64(a, b) else object
+    a, b = a.astype(dtype), b.astype(dtype)
+
+    # Cramer's rule, exact on integers
+    det = a[:, 0, 0] * a[:, 1, 1] - a[:, 0, 1] * a[:, 1, 0]
+    num_x = b[:, 0] * a[:, 1, 1] - b[:, 1] * a[:, 0, 1]
+    num_y = a[:, 0, 0] * b[:, 1] - a[:, 1, 0] * b[:, 0]
+
+    solvable = det != 0
+    det = np.where(solvable, det, 1)
+    solvable &= (num_x % det == 0) & (num_y % det == 0)
+    x = np.stack([num_x // det, num_y // det], axis=-1)
+    x[~solvable] = 0
+    return x, solvable
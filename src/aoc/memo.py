@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import functools
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CacheInfo:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    size: int = 0
+    maxsize: int | None = None
+
+    def to_dict(self) -> dict[str, int | None]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": self.size,
+            "maxsize": self.maxsize,
+        }
+
+
+# Every cached function, cleared by DaySolution.solve before each part
+_registry: dict[str, Callable[..., Any]] = {}
+
+
+def cached(
+    maxsize: int | None = 128, key: Callable[..., Hashable] | None = None
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Memoize a function, evicting the least recently used results.
+
+    The cache only lives for the run of a part. The key defaults to the
+    arguments, a key function can leave out the ones constant during a
+    run, like the parsed input. A None maxsize never evicts.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache: OrderedDict[Hashable, Any] = OrderedDict()
+        info = CacheInfo(maxsize=maxsize)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if key is not None:
+                cache_key = key(*args, **kwargs)
+            elif kwargs:
+                cache_key = (args, tuple(sorted(kwargs.items())))
+            else:
+                cache_key = args
+
+            if cache_key in cache:
+                info.hits += 1
+                if maxsize is not None:
+                    cache.move_to_end(cache_key)
+                return cache[cache_key]
+
+            info.misses += 1
+            value = func(*args, **kwargs)
+            cache[cache_key] = value
+            if maxsize is not None and len(cache) > maxsize:
+                cache.popitem(last=False)
+                info.evictions += 1
+            return value
+
+        def cache_info() -> CacheInfo:
+            info.size = len(cache)
+            return CacheInfo(**vars(info))
+
+        def cache_clear() -> None:
+            cache.clear()
+            info.hits = info.misses = info.evictions = 0
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        _registry[f"{func.__module__}.{func.__qualname__}"] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def clear() -> None:
+    """Start a new run: empty every cache and reset its counters."""
+
+    for func in _registry.values():
+        func.cache_clear()
+
+
+def stats() -> dict[str, CacheInfo]:
+    """Counters of the caches used since the last clear, by function name."""
+
+    infos = {name: func.cache_info() for name, func in _registry.items()}
+    return {name: info for name, info in infos.items() if info.hits or info.misses}
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import logging
+import math
+import multiprocessing
+import os
+import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+JOBS_ENV = "AOC_JOBS"
+# Chunks per worker, to balance uneven tasks
+CHUNKS_PER_JOB = 4
+
+# Number of workers when pmap is not given one, see get_jobs
+default_jobs: int | None = None
+
+# State of a worker process, set by init_worker
+_func: Callable[..., Any] | None = None
+_args: tuple = ()
+_blocks: list[SharedMemory] = []
+
+
+class SharedArray:
+    """Reference to a numpy array copied to a shared memory block."""
+
+    def __init__(self, name: str, shape: tuple[int, ...], dtype: str) -> None:
+        self.name = name
+        self.shape = shape
+        self.dtype = dtype
+
+
+def set_default_jobs(jobs: int | None) -> None:
+    global default_jobs
+    default_jobs = jobs
+
+
+def get_jobs(jobs: int | None = None) -> int:
+    """Number of workers: the given one, the default one, AOC_JOBS or the CPUs."""
+
+    if jobs is None:
+        jobs = default_jobs
+    if jobs is None:
+        jobs = int(os.environ.get(JOBS_ENV, "0")) or os.cpu_count() or 1
+    return max(jobs, 1)
+
+
+def get_context() -> multiprocessing.context.BaseContext:
+    """Start the workers from a fresh server process, not by forking this one.
+
+    Forking a process running threads, like the profiling sampler or the
+    HTTP pool, can deadlock the child.
+    """
+
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def attach(name: str) -> SharedMemory:
+    if sys.version_info >= (3, 13):
+        # The parent owns the block, the worker must not unlink it on exit
+        return SharedMemory(name=name, track=False)
+    return SharedMemory(name=name)
+
+
+def share(args: tuple, blocks: list[SharedMemory]) -> tuple:
+    """Copy the numpy arrays of args to shared memory blocks.
+
+    The arrays are replaced by the (name, shape, dtype) needed to view them
+    again in the workers.
+    """
+
+    if "numpy" not in sys.modules:
+        return args
+    import numpy as np
+
+    shared = []
+    for arg in args:
+        if isinstance(arg, np.ndarray) and arg.dtype != object and arg.nbytes:
+            block = SharedMemory(create=True, size=arg.nbytes)
+            blocks.append(block)
+            np.ndarray(arg.shape, arg.dtype, buffer=block.buf)[...] = arg
+            arg = SharedArray(block.name, arg.shape, arg.dtype.str)
+        shared.append(arg)
+    return tuple(shared)
+
+
+def init_worker(func: Callable[..., Any], args: tuple) -> None:
+    """Keep the function and view the shared arrays, once per worker."""
+
+    global _func, _args
+
+    _func = func
+    viewed = []
+    for arg in args:
+        if isinstance(arg, SharedArray):
+            import numpy as np
+
+            block = attach(arg.name)
+            _blocks.append(block)
+            arg = np.ndarray(arg.shape, np.dtype(arg.dtype), buffer=block.buf)
+            arg.flags.writeable = False
+        viewed.append(arg)
+    _args = tuple(viewed)
+
+
+def run_chunk(items: list[Any]) -> list[Any]:
+    return [_func(item, *_args) for item in items]
+
+
+def pmap(
+    func: Callable[..., Any],
+    items: Iterable[Any],
+    *args: Any,
+    jobs: int | None = None,
+    chunksize: int | None = None,
+) -> list[Any]:
+    """Call func(item, *args) for every item in a process pool.
+
+    The results are in the order of the items, whatever the order the
+    workers finish in. The args are sent once per worker, their numpy
+    arrays through shared memory, read-only. func must be importable by
+    the workers, a module level function. With a single job, or a single
+    item, everything runs in the current process. Starting the pool costs
+    a few hundred milliseconds, only a longer serial run makes up for it.
+    """
+
+    items = list(items)
+    jobs = min(get_jobs(jobs), len(items))
+    if jobs <= 1:
+        return [func(item, *args) for item in items]
+
+    chunksize = chunksize or math.ceil(len(items) / (jobs * CHUNKS_PER_JOB))
+    chunks = [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+    logger.debug(
+        "Mapping %s on %d items, %d chunks, %d jobs",
+        func.__name__,
+        len(items),
+        len(chunks),
+        jobs,
+    )
+
+    blocks: list[SharedMemory] = []
+    try:
+        shared = share(args, blocks)
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=get_context(),
+            initializer=init_worker,
+            initargs=(func, shared),
+        ) as executor:
+            results = []
+            for chunk_results in executor.map(run_chunk, chunks):
+                results.extend(chunk_results)
+            return results
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
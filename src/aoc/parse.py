@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    Text = bytes | str | list[str]
+
+R_INT = re.compile(rb"-?\d+")
+R_UINT = re.compile(rb"\d+")
+R_BLANK_LINE = re.compile(rb"\r?\n[ \t\r]*\n")
+R_BLANK_LINE_STR = re.compile(r"\r?\n[ \t\r]*\n")
+
+
+def to_bytes(data: Text) -> bytes:
+    """Join the input lines, or encode the text, into a single buffer."""
+
+    if isinstance(data, bytes):
+        return data
+    if isinstance(data, str):
+        return data.encode()
+    return "\n".join(line.rstrip("\r\n") for line in data).encode()
+
+
+def ints(data: Text, signed: bool = True) -> np.ndarray:
+    """Extract every integer of the text as an int64 array.
+
+    The tokens are found by a single regex pass over the buffer and
+    converted by numpy. Unsigned, a "-" is a separator, like in "3-5".
+    """
+
+    import numpy as np
+
+    tokens = (R_INT if signed else R_UINT).findall(to_bytes(data))
+    if not tokens:
+        return np.empty(0, dtype=np.int64)
+    return np.array(tokens).astype(np.int64)
+
+
+def int_rows(data: Text, ncols: int, signed: bool = True) -> np.ndarray:
+    """Extract the integers of the text as ncols columns, like one row per line."""
+
+    values = ints(data, signed)
+    if len(values) % ncols:
+        _msg = f"{len(values)} integers cannot be split in {ncols} columns"
+        raise ValueError(_msg)
+    return values.reshape(-1, ncols)
+
+
+def split_blocks(data: Text) -> list[bytes] | list[str]:
+    """Split the text on its blank lines, bytes stay bytes."""
+
+    if isinstance(data, bytes):
+        blocks = R_BLANK_LINE.split(data)
+        return [x.strip(b"\r\n") for x in blocks if x.strip()]
+
+    text = data if isinstance(data, str) else "\n".join(x.rstrip("\r\n") for x in data)
+    return [x.strip("\r\n") for x in R_BLANK_LINE_STR.split(text) if x.strip()]
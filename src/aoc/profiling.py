@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import cProfile
+import gc
+import io
+import logging
+import pstats
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Self
+
+from aoc.solution import load_solution
+
+logger = logging.getLogger(__name__)
+
+US_PER_S = 1_000_000
+NS_PER_MS = 1_000_000
+BYTES_PER_MIB = 1024 * 1024
+
+# Interval between the snapshots looking for the allocation peak
+SNAPSHOT_INTERVAL = 0.1
+
+
+@dataclass
+class GcStats:
+    collections: list[int] = field(default_factory=lambda: [0, 0, 0])
+    collected: int = 0
+    pause: int = 0
+    max_pause: int = 0
+
+
+class GcMonitor:
+    """Count the garbage collections and their pause time via gc.callbacks."""
+
+    def __init__(self) -> None:
+        self.stats = GcStats()
+        self.start = 0
+
+    def callback(self, phase: str, info: dict[str, int]) -> None:
+        if phase == "start":
+            self.start = time.perf_counter_ns()
+            return
+
+        pause = time.perf_counter_ns() - self.start
+        self.stats.collections[info["generation"]] += 1
+        self.stats.collected += info["collected"]
+        self.stats.pause += pause
+        self.stats.max_pause = max(self.stats.max_pause, pause)
+
+    def __enter__(self) -> Self:
+        gc.callbacks.append(self.callback)
+        return self
+
+    def __exit__(self, *args) -> None:
+        gc.callbacks.remove(self.callback)
+
+
+class PeakSampler:
+    """Snapshot the traced allocations periodically, keeping the largest.
+
+    tracemalloc only gives the peak size, the sampled snapshot approximates
+    the allocation sites alive around the peak.
+    """
+
+    def __init__(self, interval: float = SNAPSHOT_INTERVAL) -> None:
+        self.interval = interval
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.size = -1
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def sample(self) -> None:
+        size, _ = tracemalloc.get_traced_memory()
+        if size > self.size:
+            self.size = size
+            self.snapshot = tracemalloc.take_snapshot()
+
+    def run(self) -> None:
+        while not self.stopped.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> Self:
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stopped.set()
+        self.thread.join()
+
+
+@dataclass
+class MemoryReport:
+    part: int
+    answer: object
+    peak: int
+    net: int
+    sites: list[tracemalloc.Statistic]
+    gc_stats: GcStats
+
+
+def profile_day(
+    day: int,
+    year: int,
+    part: int,
+    *,
+    sort: str = "cumulative",
+    top: int = 20,
+    out: Path | None = None,
+) -> pstats.Stats:
+    """Profile the parts of a day, the input is parsed before profiling."""
+
+    solution = load_solution(day, year)
+    parsed = None if solution.legacy else solution.parse(solution.read())
+
+    profiler = cProfile.Profile()
+    for x in (1, 2):
+        if part not in (0, x):
+            continue
+        profiler.enable()
+        answer = solution.solve(x, parsed)
+        profiler.disable()
+        logger.info("Part %d: %s", x, answer)
+
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.strip_dirs().sort_stats(sort).print_stats(top)
+    logger.info(stream.getvalue())
+
+    if out is not None:
+        # Collapse the unstripped stats, the labels keep the file names
+        with open(out, "w") as f:
+            f.writelines(f"{line}\n" for line in collapse_stacks(profiler))
+        logger.info("Collapsed stacks written to %s", out)
+
+    return stats
+
+
+def format_function(func: tuple[str, int, str]) -> str:
+    filename, lineno, name = func
+    if filename == "~":
+        # Built-in functions
+        return name
+    return f"{Path(filename).name}:{lineno}:{name}"
+
+
+def collapse_stacks(profiler: cProfile.Profile) -> list[str]:
+    """Build collapsed stacks ("a;b;c self_us") from the profiler call graph.
+
+    cProfile only records the caller/callee edges, the time of a function
+    called from several stacks is split according to the time spent on
+    each path.
+    """
+
+    stats = pstats.Stats(profiler).stats
+    children: dict[tuple, list[tuple]] = {}
+    for func, (*_, callers) in stats.items():
+        for caller in callers:
+            children.setdefault(caller, []).append(func)
+
+    lines = {}
+
+    def visit(func: tuple, stack: list[tuple], self_time: float, scale: float):
+        stack = [*stack, func]
+        if self_time > 0:
+            key = ";".join(format_function(x) for x in stack)
+            lines[key] = lines.get(key, 0) + self_time
+
+        for child in children.get(func, []):
+            if child in stack:
+                # Recursion, the time is already accounted for by the edge
+                continue
+            _, _, tt, ct = stats[child][4][func]
+            visit(child, stack, tt * scale, scale * ct / max(stats[child][3], 1e-12))
+
+    for func, (*_, callers) in stats.items():
+        if not callers:
+            visit(func, [], stats[func][2], 1.0)
+
+    return [
+        f"{key} {round(value * US_PER_S)}"
+        for key, value in sorted(lines.items())
+        if round(value * US_PER_S) > 0
+    ]
+
+
+def memory_day(day: int, year: int, part: int, *, top: int = 10) -> list[MemoryReport]:
+    """Trace the allocations and garbage collections of the parts of a day."""
+
+    solution = load_solution(day, year)
+    parsed = None if solution.legacy else solution.parse(solution.read())
+
+    reports = []
+    for x in (1, 2):
+        if part not in (0, x):
+            continue
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with GcMonitor() as monitor, PeakSampler() as sampler:
+                answer = solution.solve(x, parsed)
+            net, peak = tracemalloc.get_traced_memory()
+            snapshot = sampler.snapshot or tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces(
+            [
+                tracemalloc.Filter(inclusive=False, filename_pattern=__file__),
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, threading.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*"),
+            ]
+        )
+        sites = snapshot.statistics("lineno")[:top]
+        reports.append(MemoryReport(x, answer, peak, net, sites, monitor.stats))
+
+    for report in reports:
+        logger.info(format_memory_report(report))
+    return reports
+
+
+def format_memory_report(report: MemoryReport) -> str:
+    gc_stats = report.gc_stats
+    peak = report.peak / BYTES_PER_MIB
+    net = report.net / BYTES_PER_MIB
+    gen0, gen1, gen2 = gc_stats.collections
+    pause = gc_stats.pause / NS_PER_MS
+    max_pause = gc_stats.max_pause / NS_PER_MS
+    generations = f"(gen0 {gen0}, gen1 {gen1}, gen2 {gen2})"
+    collected = f"{gc_stats.collected} collected"
+    pauses = f"{pause:.2f}ms paused, max {max_pause:.2f}ms"
+    lines = [
+        f"Part {report.part}: {report.answer}",
+        f"  peak {peak:.2f} MiB, net {net:+.2f} MiB",
+        f"  gc {gen0 + gen1 + gen2} collections {generations}, {collected}, {pauses}",
+        "  top allocation sites near the peak:",
+    ]
+    for site in report.sites:
+        frame = site.traceback[0]
+        lines.append(
+            f"    {Path(frame.filename).name}:{frame.lineno}: "
+            f"{site.size / BYTES_PER_MIB:.2f} MiB in {site.count} blocks"
+        )
+    return "\n".join(lines)
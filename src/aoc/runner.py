@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import logging
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+
+from aoc.parallel import get_context, set_default_jobs
+from aoc.solution import load_solution
+from aoc.utils import get_data_directory, get_module_directory, get_year_directory
+
+logger = logging.getLogger(__name__)
+
+TIMINGS_FILE = "timings.json"
+PARTS = (1, 2)
+
+R_DAY_MODULE = re.compile(r"^day(\d{2})\.py$")
+R_YEAR_PACKAGE = re.compile(r"^y(\d{4})$")
+
+
+@dataclass(frozen=True)
+class Job:
+    year: int
+    day: int
+    part: int
+
+    @property
+    def key(self) -> str:
+        return f"{self.year}-{self.day:02}-{self.part}"
+
+
+@dataclass
+class JobResult:
+    job: Job
+    answer: object = None
+    wall: float = 0.0
+    cpu: float = 0.0
+    error: str | None = None
+
+
+def parse_days(spec: str) -> list[int]:
+    """Parse a day selection like "1-5,7,10-12" into a sorted list of days."""
+
+    days = set()
+    for chunk in spec.split(","):
+        chunk = chunk.strip()
+        if not chunk:
+            continue
+        if "-" in chunk:
+            start, end = chunk.split("-")
+            days.update(range(int(start), int(end) + 1))
+        else:
+            days.add(int(chunk))
+    return sorted(days)
+
+
+def find_years() -> list[int]:
+    """List the years that have a solution package."""
+
+    years = []
+    for path in get_module_directory().iterdir():
+        match = R_YEAR_PACKAGE.match(path.name)
+        if match and path.is_dir():
+            years.append(int(match.group(1)))
+    return sorted(years)
+
+
+def find_days(year: int) -> list[int]:
+    """List the days that have a solution module for the given year."""
+
+    year_dir = get_year_directory(year)
+    if not year_dir.exists():
+        return []
+
+    days = []
+    for path in year_dir.iterdir():
+        match = R_DAY_MODULE.match(path.name)
+        if match:
+            days.append(int(match.group(1)))
+    return sorted(days)
+
+
+def find_jobs(years: list[int], days: list[int] | None = None) -> list[Job]:
+    """Build one job per part of every selected day module."""
+
+    jobs = []
+    for year in years:
+        for day in find_days(year):
+            if days and day not in days:
+                continue
+            jobs.extend(Job(year, day, part) for part in PARTS)
+    return jobs
+
+
+def get_timings_file() -> Path:
+    return get_data_directory() / Path(TIMINGS_FILE)
+
+
+def load_timings() -> dict[str, float]:
+    """Load the last recorded wall time of each part."""
+
+    timings_file = get_timings_file()
+    if not timings_file.exists():
+        return {}
+
+    with open(timings_file) as f:
+        return json.load(f)
+
+
+def save_timings(results: list[JobResult]) -> None:
+    """Record the wall time of the successful parts for the next schedule."""
+
+    timings = load_timings()
+    for result in results:
+        if result.error is None:
+            timings[result.job.key] = result.wall
+
+    timings_file = get_timings_file()
+    timings_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(timings_file, "w") as f:
+        json.dump(timings, f, indent=2, sort_keys=True)
+
+
+def schedule(jobs: list[Job], timings: dict[str, float]) -> list[Job]:
+    """Order the jobs longest-first, unknown jobs being considered the longest."""
+
+    return sorted(
+        jobs, key=lambda job: timings.get(job.key, float("inf")), reverse=True
+    )
+
+
+def run_job(job: Job) -> JobResult:
+    """Run a single part in the current process, silencing the solution output."""
+
+    result = JobResult(job)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        solution = load_solution(job.day, job.year)
+        with contextlib.redirect_stdout(io.StringIO()):
+            parsed = None if solution.legacy else solution.parse(solution.read())
+            result.answer = solution.solve(job.part, parsed)
+    except Exception as e:  # noqa
+        result.error = f"{type(e).__name__}: {e}"
+    result.wall = time.perf_counter() - wall_start
+    result.cpu = time.process_time() - cpu_start
+    return result
+
+
+def run_all(jobs: list[Job], max_workers: int | None = None) -> list[JobResult]:
+    """Run the jobs in a process pool, logging each result as it finishes."""
+
+    timings = load_timings()
+    results = []
+
+    # The parts run in parallel already, their pmap calls stay serial
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=get_context(),
+        initializer=set_default_jobs,
+        initargs=(1,),
+    ) as executor:
+        futures = [executor.submit(run_job, job) for job in schedule(jobs, timings)]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            log_result(result)
+
+    save_timings(results)
+    return results
+
+
+def log_result(result: JobResult) -> None:
+    job = result.job
+    if result.error is not None:
+        logger.error(
+            "%d day %02d part %d failed: %s", job.year, job.day, job.part, result.error
+        )
+        return
+    logger.info(
+        "%d day %02d part %d: %s (%.3fs)",
+        job.year,
+        job.day,
+        job.part,
+        result.answer,
+        result.wall,
+    )
+
+
+def format_summary(results: list[JobResult], elapsed: float) -> str:
+    """Format the results as a table sorted by year, day and part."""
+
+    header = f"{'Year':<6}{'Day':<5}{'Part':<6}{'Answer':<40}{'Wall':>10}{'CPU':>10}"
+    lines = [header, "-" * len(header)]
+
+    for result in sorted(results, key=lambda x: (x.job.year, x.job.day, x.job.part)):
+        job = result.job
+        answer = result.error if result.error is not None else str(result.answer)
+        if len(answer) > 38:  # noqa
+            answer = answer[:35] + "..."
+        lines.append(
+            f"{job.year:<6}{job.day:<5}{job.part:<6}{answer:<40}"
+            f"{result.wall:>9.3f}s{result.cpu:>9.3f}s"
+        )
+
+    total_wall = sum(x.wall for x in results)
+    total_cpu = sum(x.cpu for x in results)
+    lines.append("-" * len(header))
+    lines.append(f"{'Total':<57}{total_wall:>9.3f}s{total_cpu:>9.3f}s")
+    lines.append(f"{'Elapsed':<57}{elapsed:>9.3f}s")
+    return "\n".join(lines)
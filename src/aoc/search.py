@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from collections.abc import Callable, Hashable, Iterable, Iterator
+from dataclasses import dataclass, field
+from itertools import count
+
+State = Hashable
+WeightedNeighbors = Callable[[State], Iterable[tuple[State, int]]]
+Neighbors = Callable[[State], Iterable[State]]
+Goal = Callable[[State], bool]
+
+
+@dataclass
+class SearchStats:
+    """Searches, expanded and pushed states since the last reset."""
+
+    searches: int = 0
+    expanded: int = 0
+    pushed: int = 0
+
+    def reset(self) -> None:
+        self.searches = self.expanded = self.pushed = 0
+
+    def to_dict(self) -> dict[str, int]:
+        return {
+            "searches": self.searches,
+            "expanded": self.expanded,
+            "pushed": self.pushed,
+        }
+
+
+# Counters of every search, read by aoc bench
+stats = SearchStats()
+
+
+@dataclass
+class SearchResult:
+    """Distances from the sources and the predecessors on the optimal paths.
+
+    The predecessors of a state hold a single state, or every state on an
+    optimal path to it when the search was run with all_paths. The sources
+    have no predecessor.
+    """
+
+    distances: dict[State, int]
+    predecessors: dict[State, list[State]]
+    goals: list[State] = field(default_factory=list)
+    expanded: int = 0
+    pushed: int = 0
+
+    @property
+    def cost(self) -> float:
+        """Distance of the goals, inf when no goal was reached."""
+
+        return self.distances[self.goals[0]] if self.goals else float("inf")
+
+    def path(self, state: State | None = None) -> list[State]:
+        """One optimal path from a source to the state, the first goal by default."""
+
+        state = self.goals[0] if state is None else state
+        path = [state]
+        while self.predecessors[path[-1]]:
+            path.append(self.predecessors[path[-1]][0])
+        return path[::-1]
+
+    def paths(self, state: State | None = None) -> Iterator[list[State]]:
+        """Every optimal path from a source to the state, the first goal by default."""
+
+        state = self.goals[0] if state is None else state
+        stack = [(state, [state])]
+        while stack:
+            current, path = stack.pop()
+            if not self.predecessors[current]:
+                yield path[::-1]
+            for previous in self.predecessors[current]:
+                stack.append((previous, [*path, previous]))
+
+    def on_paths(self, states: Iterable[State] | None = None) -> set[State]:
+        """States on an optimal path to one of the states, the goals by default."""
+
+        to_visit = list(self.goals if states is None else states)
+        seen = set(to_visit)
+        while to_visit:
+            for previous in self.predecessors[to_visit.pop()]:
+                if previous not in seen:
+                    seen.add(previous)
+                    to_visit.append(previous)
+        return seen
+
+
+def record(result: SearchResult) -> SearchResult:
+    stats.searches += 1
+    stats.expanded += result.expanded
+    stats.pushed += result.pushed
+    return result
+
+
+def dijkstra(
+    sources: Iterable[State],
+    neighbors: WeightedNeighbors,
+    *,
+    goal: Goal | None = None,
+    heuristic: Callable[[State], int] | None = None,
+    all_paths: bool = False,
+) -> SearchResult:
+    """Shortest paths from the sources with non-negative edge costs.
+
+    neighbors yields the (state, cost) pairs reachable from a state. The
+    search stops once the goals at the smallest distance are reached, the
+    goal states are not expanded. With a consistent heuristic, a lower
+    bound of the distance to the goal, it is an A* search.
+    """
+
+    result = SearchResult({}, {})
+    distances, predecessors = result.distances, result.predecessors
+    # The sequence number breaks the ties, the states need not be ordered
+    sequence = count()
+    heap = []
+    for source in sources:
+        distances[source] = 0
+        predecessors[source] = []
+        priority = heuristic(source) if heuristic else 0
+        heap.append((priority, next(sequence), source))
+    heapq.heapify(heap)
+
+    done = set()
+    best = float("inf")
+    while heap:
+        priority, _, state = heapq.heappop(heap)
+        if state in done:
+            continue
+        if priority > best:
+            break
+        done.add(state)
+
+        cost = distances[state]
+        if goal is not None and goal(state):
+            result.goals.append(state)
+            best = cost
+            continue
+
+        result.expanded += 1
+        for neighbor, step in neighbors(state):
+            new_cost = cost + step
+            old_cost = distances.get(neighbor)
+            if old_cost is None or new_cost < old_cost:
+                distances[neighbor] = new_cost
+                predecessors[neighbor] = [state]
+                priority = new_cost + heuristic(neighbor) if heuristic else new_cost
+                heapq.heappush(heap, (priority, next(sequence), neighbor))
+                result.pushed += 1
+            elif all_paths and new_cost == old_cost:
+                predecessors[neighbor].append(state)
+
+    return record(result)
+
+
+def astar(
+    sources: Iterable[State],
+    neighbors: WeightedNeighbors,
+    heuristic: Callable[[State], int],
+    *,
+    goal: Goal,
+    all_paths: bool = False,
+) -> SearchResult:
+    return dijkstra(
+        sources, neighbors, goal=goal, heuristic=heuristic, all_paths=all_paths
+    )
+
+
+def bfs(
+    sources: Iterable[State],
+    neighbors: Neighbors,
+    *,
+    goal: Goal | None = None,
+    all_paths: bool = False,
+) -> SearchResult:
+    """Shortest paths from the sources when every edge costs 1.
+
+    neighbors yields the states reachable from a state.
+    """
+
+    result = SearchResult({}, {})
+    distances, predecessors = result.distances, result.predecessors
+    for source in sources:
+        distances[source] = 0
+        predecessors[source] = []
+
+    queue = deque(distances)
+    best = float("inf")
+    while queue:
+        state = queue.popleft()
+        cost = distances[state]
+        if cost > best:
+            break
+        if goal is not None and goal(state):
+            result.goals.append(state)
+            best = cost
+            continue
+
+        result.expanded += 1
+        for neighbor in neighbors(state):
+            old_cost = distances.get(neighbor)
+            if old_cost is None:
+                distances[neighbor] = cost + 1
+                predecessors[neighbor] = [state]
+                queue.append(neighbor)
+                result.pushed += 1
+            elif all_paths and old_cost == cost + 1:
+                predecessors[neighbor].append(state)
+
+    return record(result)
+
+
+def bfs01(
+    sources: Iterable[State],
+    neighbors: WeightedNeighbors,
+    *,
+    goal: Goal | None = None,
+    all_paths: bool = False,
+) -> SearchResult:
+    """Shortest paths from the sources when every edge costs 0 or 1."""
+
+    result = SearchResult({}, {})
+    distances, predecessors = result.distances, result.predecessors
+    for source in sources:
+        distances[source] = 0
+        predecessors[source] = []
+
+    queue = deque(distances)
+    done = set()
+    best = float("inf")
+    while queue:
+        state = queue.popleft()
+        if state in done:
+            continue
+        cost = distances[state]
+        if cost > best:
+            break
+        done.add(state)
+        if goal is not None and goal(state):
+            result.goals.append(state)
+            best = cost
+            continue
+
+        result.expanded += 1
+        for neighbor, step in neighbors(state):
+            new_cost = cost + step
+            old_cost = distances.get(neighbor)
+            if old_cost is None or new_cost < old_cost:
+                distances[neighbor] = new_cost
+                predecessors[neighbor] = [state]
+                if step:
+                    queue.append(neighbor)
+                else:
+                    queue.appendleft(neighbor)
+                result.pushed += 1
+            elif all_paths and new_cost == old_cost:
+                predecessors[neighbor].append(state)
+
+    return record(result)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import functools
+import sys
+from collections.abc import Callable
+from dataclasses import dataclass
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Protocol
+
+from aoc import memo
+from aoc.utils import read_input
+
+PARSED_ATTRIBUTE = "takes_parsed"
+
+
+class Solution(Protocol):
+    """A day solution: the input is parsed once and shared by both parts."""
+
+    def parse(self, data: list[str]) -> Any: ...
+
+    def part1(self, parsed: Any) -> Any: ...
+
+    def part2(self, parsed: Any) -> Any: ...
+
+
+def solver(func: Callable[[Any], Any]) -> Callable[..., Any]:
+    """Mark a part as taking the parsed input.
+
+    The part can still be called without argument, the input of its
+    module is then read and parsed on the fly. Every call starts with empty
+    aoc.memo caches.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: Any) -> Any:
+        memo.clear()
+        if not args:
+            module = sys.modules[func.__module__]
+            args = (module.parse(module.get_input_data()),)
+        return func(*args)
+
+    setattr(wrapper, PARSED_ATTRIBUTE, True)
+    return wrapper
+
+
+@dataclass
+class DaySolution:
+    """Drive a day module, adapting the legacy zero-argument parts."""
+
+    day: int
+    year: int
+    module: ModuleType
+
+    @property
+    def legacy(self) -> bool:
+        return not getattr(self.module.part1, PARSED_ATTRIBUTE, False)
+
+    def read(self) -> Any:
+        """Read the raw input the way the module does, lines by default."""
+
+        if hasattr(self.module, "get_input_data"):
+            return self.module.get_input_data()
+        return read_input(day=self.day, year=self.year)
+
+    def parse(self, data: list[str]) -> Any:
+        """Parse the raw input, legacy modules parse it in their parts."""
+
+        if self.legacy:
+            return None
+        return self.module.parse(data)
+
+    def solve(self, part: int, parsed: Any) -> Any:
+        """Run a part, the aoc.memo caches start empty, legacy parts included."""
+
+        memo.clear()
+        func = getattr(self.module, f"part{part}")
+        if self.legacy:
+            return func()
+        return func(parsed)
+
+
+def load_solution(day: int, year: int) -> DaySolution:
+    """Import the given day module."""
+
+    return DaySolution(day, year, import_module(f"aoc.y{year}.day{day:02}"))
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import logging
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+R_IMPORT_TIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportTime:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Parse the stderr of python -X importtime."""
+
+    imports = []
+    for line in output.splitlines():
+        match = R_IMPORT_TIME.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append(
+                ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+    return imports
+
+
+def measure_imports(modules: list[str]) -> list[ImportTime]:
+    """Import the modules in a fresh interpreter and collect the import times."""
+
+    code = f"import {', '.join(modules)}"
+    process = subprocess.run(  # noqa
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_import_times(process.stderr)
+
+
+def format_report(imports: list[ImportTime], top: int) -> str:
+    """Format the most expensive imports, sorted by cumulative time."""
+
+    roots = [x for x in imports if x.depth == 0]
+    total = sum(x.cumulative_us for x in roots)
+
+    header = f"{'Module':<50}{'Self':>12}{'Cumulative':>14}"
+    lines = [header, "-" * len(header)]
+    for x in sorted(imports, key=lambda x: x.cumulative_us, reverse=True)[:top]:
+        lines.append(
+            f"{'  ' * x.depth + x.module:<50}"
+            f"{x.self_us / 1000:>10.1f}ms{x.cumulative_us / 1000:>12.1f}ms"
+        )
+    lines.append("-" * len(header))
+    lines.append(f"{'Total':<50}{'':>12}{total / 1000:>12.1f}ms")
+    return "\n".join(lines)
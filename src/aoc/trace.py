@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import fnmatch
+import json
+import logging
+import time
+from pathlib import Path
+from typing import IO, Any
+
+logger = logging.getLogger(__name__)
+
+TRACE_FILE = "trace.ndjson"
+
+
+class TracePoint:
+    """A named trace point, guarded by its enabled flag.
+
+    The arguments of emit are only built when the point is enabled:
+
+        if JOLTAGE.enabled:
+            JOLTAGE.emit(bank=bank, digit=digit)
+    """
+
+    __slots__ = ("count", "enabled", "every", "name")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.enabled = False
+        self.every = 1
+        self.count = 0
+
+    def emit(self, **fields: Any) -> None:
+        self.count += 1
+        if self.count % self.every:
+            return
+        _tracer.write(self.name, self.count, fields)
+
+
+class Tracer:
+    """Registry of the trace points and NDJSON writer of their events."""
+
+    def __init__(self) -> None:
+        self.points: dict[str, TracePoint] = {}
+        self.patterns: list[str] = []
+        self.every = 1
+        self.file: IO[str] | None = None
+        self.start = 0
+
+    def point(self, name: str) -> TracePoint:
+        if name not in self.points:
+            self.points[name] = TracePoint(name)
+            self.configure_point(self.points[name])
+        return self.points[name]
+
+    def configure_point(self, point: TracePoint) -> None:
+        point.enabled = any(fnmatch.fnmatch(point.name, x) for x in self.patterns)
+        point.every = self.every
+        point.count = 0
+
+    def enable(self, patterns: list[str], out: Path, every: int = 1) -> None:
+        self.disable()
+        self.patterns = list(patterns)
+        self.every = max(every, 1)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(out, "w")  # noqa
+        self.start = time.perf_counter_ns()
+        for point in self.points.values():
+            self.configure_point(point)
+
+    def disable(self) -> None:
+        self.patterns = []
+        for point in self.points.values():
+            self.configure_point(point)
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+    def write(self, name: str, seq: int, fields: dict[str, Any]) -> None:
+        if self.file is None:
+            return
+        event = {"t": time.perf_counter_ns() - self.start, "point": name, "seq": seq}
+        event.update(fields)
+        self.file.write(json.dumps(event, default=str) + "\n")
+
+
+_tracer = Tracer()
+
+
+def point(module: str, scope: str) -> TracePoint:
+    """Get the trace point of a module scope, named like day03.joltage."""
+
+    return _tracer.point(f"{module.rsplit('.', 1)[-1]}.{scope}")
+
+
+def enable(patterns: list[str], out: Path, every: int = 1) -> None:
+    """Enable the points matching the glob patterns, keeping 1 event in every."""
+
+    _tracer.enable(patterns, out, every)
+    enabled = [x.name for x in _tracer.points.values() if x.enabled]
+    logger.debug("Tracing %s to %s", ", ".join(enabled) or "nothing yet", out)
+
+
+def disable() -> None:
+    _tracer.disable()
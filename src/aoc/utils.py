@@ -1,27 +1,39 @@
 from __future__ import annotations
 
+import functools
 import logging
+import mmap
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-import git
-
 if TYPE_CHECKING:
     import numpy as np
 
-from aoc.aoc import Aoc
-
 MODULE_PATH = "src/aoc"
+ROOT_ENV = "AOC_ROOT"
 
 logger = logging.getLogger(__name__)
 
 
+@functools.cache
 def get_root_directory() -> Path:
-    """Get the root directory of the git repository."""
+    """Get the root directory of the git repository.
+
+    The AOC_ROOT environment variable takes precedence, otherwise the .git
+    entry is looked up from the current directory up to the filesystem root.
+    """
+
+    if os.environ.get(ROOT_ENV):
+        return Path(os.environ[ROOT_ENV]).expanduser().resolve()
 
-    git_repo = git.Repo(".", search_parent_directories=True)
-    git_root = git_repo.git.rev_parse("--show-toplevel")
-    return Path(git_root)
+    cwd = Path.cwd().resolve()
+    for directory in (cwd, *cwd.parents):
+        if (directory / ".git").exists():
+            return directory
+
+    _msg = f"No git repository found from {cwd}, set {ROOT_ENV}"
+    raise FileNotFoundError(_msg)
 
 
 def get_data_directory() -> Path:
@@ -151,17 +163,18 @@ def create_day_file(day: int, year: int) -> None:
 
 from __future__ import annotations
 from typing import LiteralString
+from aoc.solution import solver
 from aoc.utils import read_input
 
 import logging
 logger = logging.getLogger(__name__)
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day={day}, year={year})
 
 
-def parse_data(data: list[str]):
-    return data
+def parse(data: list[str]):
+    return tuple(data)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -170,17 +183,13 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\\n")
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    data = get_test_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part1(data) -> int:
     return 0
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    data = get_test_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part2(data) -> int:
     return 0
 """
 
@@ -226,8 +235,13 @@ def test_part2() -> None:
     logger.info("Created day test file: %s", day_test_file)
 
 
-def run_day(day: int, year: int, part: int) -> None:
-    """Run the given day and year."""
+def run_day(day: int, year: int, part: int, *, use_cache: bool = False) -> None:
+    """Run the given day and year.
+
+    With use_cache, an answer already computed by the same solver source on
+    the same input is read from the answer cache instead, and the parsed
+    input is reused as long as the input and the parse stage are unchanged.
+    """
 
     day_file = get_module_directory() / Path(f"y{year}/day{day:02}.py")
 
@@ -236,26 +250,53 @@ def run_day(day: int, year: int, part: int) -> None:
         raise FileNotFoundError(_msg)
 
     # Import the day module
-    from importlib import import_module
+    from aoc.solution import load_solution
 
-    module = import_module(f"aoc.y{year}.day{day:02}")
+    solution = load_solution(day, year)
 
     logger.info("Day %d of year %d", day, year)
+    parts = [x for x in (1, 2) if part in (0, x)]
+
+    keys = {}
+    if use_cache:
+        from aoc import cache
+
+        solution.read()  # Make sure the input is fetched
+        input_file = get_data_directory() / Path(f"y{year}/day{day:02}_input.txt")
+        for x in list(parts):
+            keys[x] = cache.get_key(day, year, x, input_file)
+            found, answer = cache.get_answer(keys[x])
+            if found:
+                logger.info("Part %d: %s (cached)", x, answer)
+                parts.remove(x)
+
+    if not parts:
+        return
+
+    # Parse the input once, both parts share it
+    if solution.legacy:
+        parsed = None
+    elif use_cache:
+        parsed = cache.parse_cached(solution, input_file)
+    else:
+        parsed = solution.parse(solution.read())
+
     # Run the solutions
-    if part in (0, 1):
-        part1 = module.part1()
-        logger.info("Part 1: %s", part1)
-    if part in (0, 2):
-        part2 = module.part2()
-        logger.info("Part 2: %s", part2)
+    for x in parts:
+        answer = solution.solve(x, parsed)
+        logger.info("Part %d: %s", x, answer)
+        if use_cache:
+            cache.set_answer(keys[x], day, year, x, answer)
 
 
-def read_input(day: int, year: int) -> list[str]:
-    """Read the input data for the given day and year."""
+def get_input_file(day: int, year: int) -> Path:
+    """Get the input file for the given day and year, fetching it if missing."""
 
     day_file = get_data_directory() / Path(f"y{year}/day{day:02}_input.txt")
 
     if not day_file.exists():
+        from aoc.aoc import Aoc
+
         _msg = f"Day input file does not exist: {day_file}"
         try:
             aoc = Aoc(token=None)
@@ -264,10 +305,92 @@ def read_input(day: int, year: int) -> list[str]:
         except Exception as e:
             raise FileNotFoundError(_msg) from e
 
-    with open(day_file) as f:
+    return day_file
+
+
+def read_input(day: int, year: int) -> list[str]:
+    """Read the input data for the given day and year."""
+
+    with open(get_input_file(day, year)) as f:
         return f.readlines()
 
 
+def read_grid(day: int, year: int) -> np.ndarray:
+    """Map the input file as a read-only (height, width) uint8 grid.
+
+    The grid is a view over the file bytes, the newline column is skipped
+    by the row stride.
+    """
+
+    with open(get_input_file(day, year), "rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return bytes_to_grid(buffer)
+
+
+def bytes_to_grid(buffer: bytes | mmap.mmap) -> np.ndarray:
+    """View the rows of a text buffer as a (height, width) uint8 grid."""
+
+    import numpy as np
+    from numpy.lib.stride_tricks import as_strided
+
+    data = np.frombuffer(buffer, dtype=np.uint8)
+
+    # Ignore the trailing newlines
+    size = len(data)
+    while size and data[size - 1] in b"\r\n":
+        size -= 1
+
+    newlines = np.flatnonzero(data[:size] == ord("\n"))
+    stride = int(newlines[0]) + 1 if len(newlines) else size + 1
+    width = stride - 1
+    if width and data[width - 1] == ord("\r"):
+        width -= 1
+
+    height = len(newlines) + 1
+    if size != (height - 1) * stride + width:
+        _msg = "The grid rows do not have the same length"
+        raise ValueError(_msg)
+
+    grid = as_strided(data, shape=(height, width), strides=(stride, 1))
+    grid.flags.writeable = False
+    return grid
+
+
+def lines_to_grid(lines: list[str]) -> np.ndarray:
+    """Build a uint8 grid from text lines, like read_grid does from the file."""
+
+    rows = [line.rstrip("\r\n") for line in lines if line.strip()]
+    return bytes_to_grid("\n".join(rows).encode())
+
+
+def to_grid(data: list[str] | np.ndarray) -> np.ndarray:
+    """Accept the grid of read_grid or the lines of a test input."""
+
+    if isinstance(data, list | tuple):
+        return lines_to_grid(data)
+    return data
+
+
+def byte_mask(grid: np.ndarray, chars: bytes | str) -> np.ndarray:
+    """Boolean mask of the grid cells equal to one of the chars, like b"#"."""
+
+    import numpy as np
+
+    if isinstance(chars, str):
+        chars = chars.encode()
+    if len(chars) == 1:
+        return grid == chars[0]
+    return np.isin(grid, np.frombuffer(chars, dtype=np.uint8))
+
+
+def find_bytes(grid: np.ndarray, chars: bytes | str) -> list[tuple[int, int]]:
+    """(row, col) positions of the grid cells equal to one of the chars."""
+
+    import numpy as np
+
+    return [(int(x), int(y)) for x, y in np.argwhere(byte_mask(grid, chars))]
+
+
 class Colors:
     HEADER = "\033[95m"
     OKBLUE = "\033[94m"
@@ -333,7 +456,7 @@ RIGHT = complex(1, 0)
 
 def get_value_at(board: np.array, position: complex) -> str:
     x, y = get_pos_coord(position)
-    if x in range(board.shape[0]) and y in range(board.shape[1]):
+    if 0 <= x < board.shape[0] and 0 <= y < board.shape[1]:
         return board[x, y]
     raise IndexError
 
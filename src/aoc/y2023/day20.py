@@ -5,13 +5,15 @@ from __future__ import annotations
 import os
 import queue
 from enum import Enum
-from typing import Protocol
-
-import networkx as nx
-from pyvis.network import Network
+from typing import TYPE_CHECKING, Protocol
 
+from aoc.cycle import first_common, signal_periods
+from aoc.solution import solver
 from aoc.utils import read_input
 
+if TYPE_CHECKING:
+    import networkx as nx
+
 
 class Pulse(Enum):
     HIGH = 1
@@ -148,15 +150,23 @@ class Conjonction:
         return f"{self.name}: {dict(self.recent_pulses)} - {self.dest}"
 
 
+# Button presses to find the period of the inputs feeding rx
+MAX_PRESSES = 50000
+
 PULSES = queue.Queue()
 MODULES: dict[str, Module] = {}
-NETWORK: nx.DiGraph = nx.DiGraph()
+NETWORK: nx.DiGraph | None = None
 
 
 def get_input_data() -> list[str]:
     return read_input(day=20, year=2023)
 
 
+def parse(data: list[str]) -> tuple[str, ...]:
+    # The modules hold the simulation state, they are built by each part
+    return tuple(line for line in data if line.strip())
+
+
 def parse_module(line: str) -> Module:
     name, dest = line.rstrip().split(" -> ")
     if name == "broadcaster":
@@ -172,7 +182,7 @@ def parse_module(line: str) -> Module:
     raise ValueError(_msg)
 
 
-def parse_input(data: list[str]) -> None:
+def parse_input(data: tuple[str, ...]) -> None:
     for line in data:
         module = parse_module(line)
         MODULES[module.name] = module
@@ -182,6 +192,11 @@ def parse_input(data: list[str]) -> None:
 
 
 def build_network() -> None:
+    import networkx as nx
+
+    global NETWORK  # noqa
+    NETWORK = nx.DiGraph()
+
     # Build Vertices
     NETWORK.add_nodes_from(MODULES.keys())
     NETWORK.add_nodes_from(["Button", "rx"])
@@ -195,6 +210,8 @@ def build_network() -> None:
 
 
 def display_network() -> None:
+    from pyvis.network import Network
+
     g = Network(directed=True)
     g.from_nx(NETWORK)
     g.prep_notebook()
@@ -222,7 +239,7 @@ def get_test_input_data() -> list[str]:
     return data.split("\n")
 
 
-def init(data: list[str]) -> None:
+def init(data: tuple[str, ...]) -> None:
     parse_input(data)
 
     # Build network
@@ -235,9 +252,8 @@ def init(data: list[str]) -> None:
     # display_network()
 
 
-def part1() -> int:
-    data = get_input_data()
-
+@solver
+def part1(data: tuple[str, ...]) -> int:
     init(data)
 
     # Par Modules
@@ -265,41 +281,32 @@ def part1() -> int:
     return nb_high * nb_low
 
 
-def count_pulses(f_src: str, f_dest: str, f_pulse: Pulse) -> int:
-    for nb_press in range(1, 50000):
-        PULSES.put(["Button", "Broadcaster", Pulse.LOW])
-
-        while PULSES.qsize() > 0:
-            source, dest, pulse = PULSES.get()
-
-            if source == f_src and dest == f_dest and pulse == f_pulse:
-                # print(f"Found: {source} -> {dest} : {pulse}, after {nb_press} presses")
-                return nb_press
-
-            MODULES[dest].process_signal(source, pulse)
-    return 0
+def press_button(feeder: str) -> list[str]:
+    """Press the button once, returning the modules sending a high pulse to feeder."""
 
+    fired = []
+    PULSES.put(["Button", "Broadcaster", Pulse.LOW])
+    while PULSES.qsize() > 0:
+        source, dest, pulse = PULSES.get()
+        if dest == feeder and pulse == Pulse.HIGH:
+            fired.append(source)
 
-def part2() -> int:
-    data = get_input_data()
-    init(data)
+        MODULES[dest].process_signal(source, pulse)
+    return fired
 
-    # display_network()
 
-    # How many inputs to get fg to send a high pulse to vr
-    vr_p = count_pulses("fg", "vr", Pulse.HIGH)
-    # print(f"fg -> vr: {vr_p}")
-    init(data)
-    # How many inputs to get pq to send a high pulse to vr
-    pq_p = count_pulses("pq", "vr", Pulse.HIGH)
-    # print(f"pq -> vr: {pq_p}")
-    init(data)
-    # How many inputs to get fm to send a high pulse to vr
-    fm_p = count_pulses("fm", "vr", Pulse.HIGH)
-    # print(f"fm -> vr: {fm_p}")
+@solver
+def part2(data: tuple[str, ...]) -> int:
     init(data)
-    # How many inputs to get dk to send a high pulse to vr
-    dk_p = count_pulses("dk", "vr", Pulse.HIGH)
-    # print(f"dk -> vr: {dk_p}")
 
-    return vr_p * pq_p * fm_p * dk_p
+    # rx gets a low pulse once every input of the conjonction feeding it is high,
+    # each input being high on its own period
+    feeder = next((m.name for m in MODULES.values() if "rx" in m.dest), None)
+    if not isinstance(MODULES.get(feeder), Conjonction):
+        return 0
+    inputs = list(MODULES[feeder].recent_pulses)
+
+    periods = signal_periods(lambda _: press_button(feeder), inputs, MAX_PRESSES)
+    if len(periods) < len(inputs):
+        return 0
+    return first_common(periods.values()) or 0
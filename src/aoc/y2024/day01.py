@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from collections import defaultdict
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
@@ -15,7 +16,7 @@ def get_test_input_data() -> list[str]:
     return [""]
 
 
-def parse(data: list[str]) -> tuple[list[int], list[int]]:
+def parse(data: list[str]) -> tuple[tuple[int, ...], tuple[int, ...]]:
     l1 = []
     l2 = []
 
@@ -25,27 +26,23 @@ def parse(data: list[str]) -> tuple[list[int], list[int]]:
         l1.append(int(a))
         l2.append(int(b))
 
-    l1.sort()
-    l2.sort()
+    return tuple(sorted(l1)), tuple(sorted(l2))
 
-    return l1, l2
 
-
-def part1() -> int:
-    data = get_input_data()
-    l1, l2 = parse(data)
+@solver
+def part1(data: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+    l1, l2 = data
     t_dist = 0
 
-    while len(l1) > 0:
-        a, b = l1.pop(0), l2.pop(0)
+    for a, b in zip(l1, l2):
         t_dist += abs(a - b)
 
     return t_dist
 
 
-def part2() -> int:
-    data = get_input_data()
-    l1, l2 = parse(data)
+@solver
+def part2(data: tuple[tuple[int, ...], tuple[int, ...]]) -> int:
+    l1, l2 = data
 
     l2_occurs = defaultdict(int)
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 MAX_DIFF = 4
@@ -11,13 +12,14 @@ def get_input_data() -> list[str]:
     return read_input(day=2, year=2024)
 
 
-def part1() -> int:
-    data = get_input_data()
-    safe = 0
-    for line in data:
-        levels = line.rstrip().split(" ")
-        levels = [int(x) for x in levels]
+def parse(data: list[str]) -> tuple[list[int], ...]:
+    return tuple([int(x) for x in line.rstrip().split(" ")] for line in data)
+
 
+@solver
+def part1(data: tuple[list[int], ...]) -> int:
+    safe = 0
+    for levels in data:
         if is_safe(levels):
             safe += 1
 
@@ -44,14 +46,10 @@ def dampener_safe(levels: list[int]) -> bool:
     return False
 
 
-def part2() -> int:
-    data = get_input_data()
-
+@solver
+def part2(data: tuple[list[int], ...]) -> int:
     safe = 0
-    for line in data:
-        levels = line.rstrip().split(" ")
-        levels = [int(x) for x in levels]
-
+    for levels in data:
         if is_safe(levels) or dampener_safe(levels):
             safe += 1
 
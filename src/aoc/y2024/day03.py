@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
@@ -15,8 +16,12 @@ def get_test_input_data() -> list[str]:
     return [""]
 
 
-def part1() -> int:
-    data = get_input_data()
+def parse(data: list[str]) -> tuple[str, ...]:
+    return tuple(x.rstrip() for x in data)
+
+
+@solver
+def part1(data: tuple[str, ...]) -> int:
     return multiply(data)
 
 
@@ -52,9 +57,8 @@ def clean_data(data: str) -> str:
     return res
 
 
-def part2_1() -> int:
-    data = get_input_data()
-    j_data = "".join([x.rstrip() for x in data])
+def part2_1(data: tuple[str, ...]) -> int:
+    j_data = "".join(data)
 
     c_data = [
         clean_data(j_data),
@@ -63,11 +67,11 @@ def part2_1() -> int:
     return multiply(c_data)
 
 
-def part2() -> int:
+@solver
+def part2(data: tuple[str, ...]) -> int:
     # First idea but wasn't working because it was applied line by line
     # Now that I know that the data is in one line, I can apply it to the whole data
-    data = get_input_data()
-    j_data = "".join([x.rstrip() for x in data])
+    j_data = "".join(data)
 
     pattern = re.compile(r"(don't\(\).*?do\(\))|(don't\(\).*?$)")
     c_data = pattern.sub("", j_data)
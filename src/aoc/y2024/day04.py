@@ -6,6 +6,7 @@ import re
 
 import numpy as np
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 pattern = re.compile("(?=(XMAS|SAMX))")
@@ -30,6 +31,12 @@ MXMXAXMASX"""
     return [str(x) for x in data.split("\n")]
 
 
+def parse(data: list[str]) -> np.array:
+    matrix = np.array([list(x.strip()) for x in data if x.strip()])
+    matrix.flags.writeable = False
+    return matrix
+
+
 def count_horizontal_patterns(matrix: np.array) -> int:
     res = 0
     for i in range(matrix.shape[0]):
@@ -55,10 +62,8 @@ def count_anti_diagonal_patterns(matrix: np.array) -> int:
     return count_diagonal_patterns(np.fliplr(matrix))
 
 
-def part1() -> int:
-    data = get_input_data()
-    matrix = np.array([list(x) for x in data])
-
+@solver
+def part1(matrix: np.array) -> int:
     # Horizontal
     res = count_horizontal_patterns(matrix)
 
@@ -110,10 +115,8 @@ def check_pattern(matrix: np.array) -> int:
     return 0
 
 
-def part2() -> int:
-    data = get_input_data()
-    matrix = np.array([list(x) for x in data])
-
+@solver
+def part2(matrix: np.array) -> int:
     res = 0
 
     for i in range(matrix.shape[0] - 2):
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from aoc.parse import int_rows, ints, split_blocks
+from aoc.solution import solver
 from aoc.utils import read_input
 
-PREDS = {}
+Preds = dict[int, set[int]]
+Rules = tuple[tuple[tuple[int, int], ...], tuple[list[int], ...]]
 
 
 def get_input_data() -> list[str]:
@@ -44,47 +47,42 @@ def get_test_input_data() -> list[str]:
     return [str(x) + "\n" for x in test_input.split("\n")]
 
 
-def parse_data(data: list[str]) -> tuple[list[tuple[int, int]], list[list[int]]]:
-    i = data.index("\n")
-    part1 = data[:i]
-    part2 = data[i + 1 :]
-
-    constraints = []
-    for line in part1:
-        a, b = line.rstrip().split("|")
-        constraints.append((int(a), int(b)))
+def parse(data: list[str]) -> Rules:
+    part1, part2 = split_blocks(data)
 
+    constraints = [tuple(x) for x in int_rows(part1, 2).tolist()]
     constraints = sorted(constraints, key=lambda x: x[0])
 
-    print_list = [[int(x) for x in line.rstrip().split(",")] for line in part2]
+    print_list = [ints(line).tolist() for line in part2.splitlines()]
 
-    return constraints, print_list
+    return tuple(constraints), tuple(print_list)
 
 
-def parse_constraints(constraints: list[tuple[int, int]]):
+def parse_constraints(constraints: tuple[tuple[int, int], ...]) -> Preds:
+    preds = {}
     for constraint in constraints:
         a, b = constraint
-        if b not in PREDS:
-            PREDS[b] = set()
-        PREDS[b].add(a)
+        if b not in preds:
+            preds[b] = set()
+        preds[b].add(a)
+    return preds
 
 
-def check_successors(page: int, successors: list[int]) -> bool:
+def check_successors(page: int, successors: list[int], preds: Preds) -> bool:
     return all(
-        page not in PREDS or successor not in PREDS[page] for successor in successors
+        page not in preds or successor not in preds[page] for successor in successors
     )
 
 
-def part1() -> int:
-    data = get_input_data()
-
-    constraints, print_lists = parse_data(data)
+@solver
+def part1(data: Rules) -> int:
+    constraints, print_lists = data
 
-    parse_constraints(constraints)
+    preds = parse_constraints(constraints)
 
     res = 0
 
-    good_list, _ = sort_lists(print_lists)
+    good_list, _ = sort_lists(print_lists, preds)
 
     for print_list in good_list:
         mid = len(print_list) // 2
@@ -93,12 +91,14 @@ def part1() -> int:
     return res
 
 
-def sort_lists(print_lists: list[list[int]]) -> tuple[list[list[int]], list[list[int]]]:
+def sort_lists(
+    print_lists: list[list[int]], preds: Preds
+) -> tuple[list[list[int]], list[list[int]]]:
     good_lists = []
     bad_lists = []
 
     for print_list in print_lists:
-        if check_list(print_list):
+        if check_list(print_list, preds):
             good_lists.append(print_list)
         else:
             bad_lists.append(print_list)
@@ -106,25 +106,25 @@ def sort_lists(print_lists: list[list[int]]) -> tuple[list[list[int]], list[list
     return good_lists, bad_lists
 
 
-def check_list(print_list: list[int]) -> bool:
+def check_list(print_list: list[int], preds: Preds) -> bool:
     for i, page in enumerate(print_list[:-1]):
         # Check page against its successors
         page = print_list[i]  # noqa
         successors = print_list[i + 1 :]
-        if not check_successors(page, successors):
+        if not check_successors(page, successors, preds):
             return False
     return True
 
 
-def fix_list(print_list: list[int]) -> list[int]:
+def fix_list(print_list: list[int], preds: Preds) -> list[int]:
     wl = print_list.copy()
 
-    while not check_list(wl):
+    while not check_list(wl, preds):
         for i in range(len(wl) - 1):
             page = wl[i]
             for j in range(i + 1, len(wl)):
                 successor = wl[j]
-                if page in PREDS and successor in PREDS[page]:
+                if page in preds and successor in preds[page]:
                     wl[i], wl[j] = wl[j], wl[i]
                     break
             else:
@@ -133,23 +133,22 @@ def fix_list(print_list: list[int]) -> list[int]:
     return wl
 
 
-def part2() -> int:
-    data = get_input_data()
-
-    constraints, print_lists = parse_data(data)
+@solver
+def part2(data: Rules) -> int:
+    constraints, print_lists = data
 
-    parse_constraints(constraints)
+    preds = parse_constraints(constraints)
 
     res = 0
 
-    _, bad_list = sort_lists(print_lists)
+    _, bad_list = sort_lists(print_lists, preds)
 
     fixed_list = []
 
     for print_list in bad_list:
-        while not check_list(print_list):
-            print_list = fix_list(print_list)  # noqa
-        fixed_list.append(fix_list(print_list))
+        while not check_list(print_list, preds):
+            print_list = fix_list(print_list, preds)  # noqa
+        fixed_list.append(fix_list(print_list, preds))
 
     for print_list in fixed_list:
         mid = len(print_list) // 2
@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-import enum
-
 import numpy as np
 
-from aoc.utils import read_input
+from aoc.solution import solver
+from aoc.utils import find_bytes, read_grid, to_grid
+
+OBSTACLE = ord("#")
+# The guard characters, by direction clockwise from up
+GUARDS = b"^>v<"
+UP, RIGHT, DOWN, LEFT = range(4)
 
 
-def get_input_data():
-    data = read_input(day=6, year=2024)
-    return parse_data(data)
+def get_input_data() -> np.ndarray:
+    return read_grid(day=6, year=2024)
 
 
-def parse_data(data: list[str]):
-    return np.array([np.array(list(row)) for row in data])
+def parse(data: list[str] | np.ndarray) -> np.ndarray:
+    return to_grid(data)
 
 
 def get_test_input_data() -> list[str]:
@@ -43,102 +46,138 @@ def get_test_input_data() -> list[str]:
 ..........#..........#..
 ..#.....#..........#....
 ........#.....#..#......"""
-    return parse_data(data.splitlines())
-
-
-class D(enum.Enum):
-    up = -1 + 0j
-    down = 1 + 0j
-    left = -1j
-    right = 1j
-
-
-def find_guard(data: np.array) -> tuple[complex, D] | None:
-    for i, row in enumerate(data):
-        for j, col in enumerate(row):
-            if col == "^":
-                return complex(i, j), D.up
-            if col == ">":
-                return complex(i, j), D.right
-            if col == "v":
-                return complex(i, j), D.down
-            if col == "<":
-                return complex(i, j), D.left
-    return None
-
-
-def get_guard_path(
-    g_s_pos: complex, d: D, data: np.array, mark: str = "X"
-) -> list[tuple[complex, D]]:
-    g_pos = g_s_pos
-
-    guard_path = [
-        (g_pos, d),
-    ]
-
-    while True:
-        n_coord = g_pos + d.value
-        n_x, n_y = int(n_coord.real), int(n_coord.imag)
-
-        if not (0 <= n_x < data.shape[0] and 0 <= n_y < data.shape[1]):
-            break
-
-        if data[n_x, n_y] in ["#", "0"]:
-            d = D(d.value * -1j)
-            continue
-
-        # move forward
-        g_pos += d.value
-        if (g_pos, d) in guard_path:
-            raise ValueError
-
-        guard_path.append((g_pos, d))
-
-        # Mark the start posityion in blue
-        if g_pos == g_s_pos:
-            data[int(g_pos.real), int(g_pos.imag)] = "^"
-        else:
-            data[int(g_pos.real), int(g_pos.imag)] = mark
-
-    return guard_path
-
-
-def part1() -> int:
-    data = get_input_data()
-    g_pos, d = find_guard(data)
-    guard_path = get_guard_path(g_pos, d, data)
-    guard_poss = {g for g, _ in guard_path}
-    return len(guard_poss)
-
-
-def part2() -> int:
-    data = get_input_data()
-    res = 0
-    g_pos, d = find_guard(data)
-
-    data_1 = data.copy()
-    guard_path = get_guard_path(g_pos, d, data_1)
-
-    obstacles = set()
-
-    cpt = 0
-    for pg, _ in guard_path[1:]:
-        data_w_obs = data.copy()
-
-        if pg == g_pos:
-            continue
-
-        if pg in obstacles:
+    return data.splitlines()
+
+
+def stop_columns(blocked: np.ndarray) -> np.ndarray:
+    """Column where the guard stops moving right from every cell.
+
+    It stops before the next obstacle of its row, or on the last column.
+    """
+
+    height, width = blocked.shape
+    columns = np.where(blocked, np.arange(width), width)
+    # Column of the first obstacle strictly on the right, the width if none
+    next_obstacle = np.full((height, width), width)
+    next_obstacle[:, :-1] = np.minimum.accumulate(columns[:, :0:-1], axis=1)[:, ::-1]
+    return next_obstacle - 1
+
+
+class Lab:
+    """The obstacles of the lab, indexed to move the guard from turn to turn.
+
+    The cells are flat indices. stops[d][cell] is the cell the guard stops
+    at moving in the direction d from cell, before an obstacle or on the
+    edge it leaves the lab from.
+    """
+
+    def __init__(self, grid: np.ndarray) -> None:
+        self.height, self.width = grid.shape
+        blocked = grid == OBSTACLE
+        rows, cols = np.indices(grid.shape)
+
+        right = rows * self.width + stop_columns(blocked)
+        left = (
+            rows * self.width
+            + (self.width - 1 - stop_columns(blocked[:, ::-1]))[:, ::-1]
+        )
+        down = stop_columns(blocked.T).T * self.width + cols
+        up = (self.height - 1 - stop_columns(blocked.T[:, ::-1]))[
+            :, ::-1
+        ].T * self.width + cols
+        self.stops = tuple(x.ravel().tolist() for x in (up, right, down, left))
+        self.deltas = (-self.width, 1, self.width, -1)
+
+        ((row, col),) = find_bytes(grid, GUARDS)
+        self.start = row * self.width + col
+        self.direction = GUARDS.index(grid[row, col])
+
+        # Turns of the current walk, stamped with its number instead of cleared
+        self.seen = [0] * (self.height * self.width * 4)
+        self.walks = 0
+
+    def leaves(self, cell: int, d: int) -> bool:
+        """Whether the guard leaves the lab moving in the direction d from cell."""
+
+        if d == UP:
+            return cell < self.width
+        if d == DOWN:
+            return cell >= (self.height - 1) * self.width
+        if d == RIGHT:
+            return cell % self.width == self.width - 1
+        return cell % self.width == 0
+
+    def path(self) -> list[tuple[int, int]]:
+        """Every (cell, direction) of the guard until it leaves, in order."""
+
+        cell, d = self.start, self.direction
+        path = [(cell, d)]
+        turns = set()
+        while True:
+            stop, delta = self.stops[d][cell], self.deltas[d]
+            path.extend((x, d) for x in range(cell + delta, stop + delta, delta))
+            if self.leaves(stop, d):
+                return path
+            if (stop, d) in turns:
+                _msg = "The guard never leaves the lab"
+                raise ValueError(_msg)
+            turns.add((stop, d))
+            cell, d = stop, (d + 1) % 4
+
+    def loops(self, obstacle: int, cell: int, d: int) -> bool:
+        """Whether the guard leaving cell in the direction d loops, with an
+        obstacle added.
+
+        The obstacle is only overlaid on the jumps. Only the turns are
+        tracked, a loop turns twice at the same cell in the same direction.
+        """
+
+        self.walks += 1
+        walk, seen, width = self.walks, self.seen, self.width
+        o_row, o_col = divmod(obstacle, width)
+        while True:
+            stop = self.stops[d][cell]
+
+            # The added obstacle stops the guard if it is ahead, before the stop
+            row, col = divmod(cell, width)
+            if d == UP:
+                ahead = col == o_col and stop // width <= o_row < row
+            elif d == DOWN:
+                ahead = col == o_col and row < o_row <= stop // width
+            elif d == RIGHT:
+                ahead = row == o_row and col < o_col <= stop % width
+            else:
+                ahead = row == o_row and stop % width <= o_col < col
+            if ahead:
+                stop = obstacle - self.deltas[d]
+            elif self.leaves(stop, d):
+                return False
+
+            state = stop * 4 + d
+            if seen[state] == walk:
+                return True
+            seen[state] = walk
+            cell, d = stop, (d + 1) % 4
+
+
+@solver
+def part1(data: np.ndarray) -> int:
+    lab = Lab(data)
+    return len({cell for cell, _ in lab.path()})
+
+
+@solver
+def part2(data: np.ndarray) -> int:
+    lab = Lab(data)
+    path = lab.path()
+
+    # An obstacle changes the path from the first time the guard meets it,
+    # the walk starts from the step before
+    tried = {lab.start}
+    loops = 0
+    for (cell, d), (previous, previous_d) in zip(path[1:], path):
+        if cell in tried:
             continue
-
-        x, y = int(pg.real), int(pg.imag)
-
-        obstacles.add(pg)
-        try:
-            data_w_obs[x, y] = "0"
-            get_guard_path(g_pos, d, data_w_obs, mark="*")
-        except ValueError:
-            res += 1
-        cpt += 1
-
-    return res
+        tried.add(cell)
+        loops += lab.loops(cell, previous, previous_d)
+    return loops
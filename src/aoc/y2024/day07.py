@@ -2,26 +2,23 @@
 
 from __future__ import annotations
 
+from aoc.parse import ints
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-class TestValidated(Exception):  # noqa
-    pass
+def get_input_data() -> list[str]:
+    return read_input(day=7, year=2024)
 
 
-def get_input_data():
-    data = read_input(day=7, year=2024)
-    return parse_data(data)
-
-
-def parse_data(data: list[str]):
+def parse(data: list[str]) -> tuple[tuple[int, tuple[int, ...]], ...]:
     parsed_data = []
-    lines = [x.strip() for x in data]
-    for line in lines:
-        r, n = line.split(":")
-        ns = n.split(" ")
-        parsed_data.append((int(r), [int(x) for x in ns if x]))
-    return parsed_data
+    for line in data:
+        if not line.strip():
+            continue
+        r, *ns = ints(line).tolist()
+        parsed_data.append((r, tuple(ns)))
+    return tuple(parsed_data)
 
 
 def get_test_input_data() -> list[str]:
@@ -35,61 +32,61 @@ def get_test_input_data() -> list[str]:
 21037: 9 7 18 13
 292: 11 6 16 20"""
     # data = "213: 2 1 3"
-    return parse_data(data.split("\n"))
-
-
-def compute(n: int, ns: list[int], test_value: int):
-    if len(ns) == 1:
-        if n * ns[0] == test_value:
-            raise TestValidated
-        if n + ns[0] == test_value:
-            raise TestValidated
-        return 0
-
-    compute(n * ns[0], ns[1:], test_value)
-    compute(n + ns[0], ns[1:], test_value)
-
-    return
-
-
-def compute2(n1: int, ns: list[int], test_value: int):
-    if len(ns) == 0:
-        if n1 == test_value:
-            raise TestValidated
-        return
-
-    if len(ns) == 1:
-        if n1 * ns[0] == test_value:
-            raise TestValidated
-        if n1 + ns[0] == test_value:
-            raise TestValidated
-
-    compute2(int(str(n1) + str(ns[0])), ns[1:], test_value)
-    compute2(n1 * ns[0], ns[1:], test_value)
-    compute2(n1 + ns[0], ns[1:], test_value)
-
-    return
-
-
-def part1() -> int:
-    data = get_input_data()
-    # data = get_test_input_data()
-    res = 0
-    for t_res, ns in data:
-        try:
-            compute(ns[0], ns[1:], t_res)
-        except TestValidated:
-            res += t_res
-    return res
-
-
-def part2() -> int:
-    data = get_input_data()
-    # data = get_test_input_data()
-    res = 0
-    for t_res, ns in data:
-        try:
-            compute2(ns[0], ns[1:], t_res)
-        except TestValidated:
-            res += t_res
-    return res
+    return data.split("\n")
+
+
+def count_assignments(
+    test_value: int, ns: tuple[int, ...], concat: bool, first: bool = False
+) -> int:
+    """Number of operator assignments making the equation true.
+
+    The operators are undone from the last number back: + by a subtraction,
+    * only when the value is divisible and || only when the value ends with
+    the digits of the number. The numbers are positive, like in the puzzle.
+    With first, the search stops at the first assignment found.
+    """
+
+    # 10 ** (number of digits) of each number, to strip it off a concatenation
+    shifts = []
+    for n in ns:
+        shift = 10
+        while shift <= n:
+            shift *= 10
+        shifts.append(shift)
+
+    def search(value: int, k: int) -> int:
+        n = ns[k]
+        if k == 0:
+            return int(value == n)
+
+        found = 0
+        if concat and value > n and value % shifts[k] == n:
+            found += search(value // shifts[k], k - 1)
+            if first and found:
+                return found
+        if value % n == 0:
+            found += search(value // n, k - 1)
+            if first and found:
+                return found
+        if value >= n:
+            found += search(value - n, k - 1)
+        return found
+
+    return search(test_value, len(ns) - 1)
+
+
+def calibrate(equation: tuple[int, tuple[int, ...]], concat: bool) -> int:
+    """Return the test value of the equation if it can be true, else 0."""
+
+    t_res, ns = equation
+    return t_res if count_assignments(t_res, ns, concat, first=True) else 0
+
+
+@solver
+def part1(data: tuple[tuple[int, tuple[int, ...]], ...]) -> int:
+    return sum(calibrate(equation, False) for equation in data)
+
+
+@solver
+def part2(data: tuple[tuple[int, tuple[int, ...]], ...]) -> int:
+    return sum(calibrate(equation, True) for equation in data)
@@ -6,16 +6,18 @@ from typing import LiteralString
 
 import numpy as np
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-def get_input_data():
-    data = read_input(day=8, year=2024)
-    return parse_data(data)
+def get_input_data() -> list[str]:
+    return read_input(day=8, year=2024)
 
 
-def parse_data(data: list[str]):
-    return np.array([np.array(list(x.rstrip())) for x in data])
+def parse(data: list[str]) -> tuple[np.array, dict[str, list[complex]]]:
+    grid = np.array([np.array(list(x.rstrip())) for x in data if x.strip()])
+    grid.flags.writeable = False
+    return grid, parse_antennas(grid)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -31,20 +33,17 @@ def get_test_input_data() -> list[LiteralString]:
 .........A..
 ............
 ............"""
-    return parse_data(data.split("\n"))
+    return data.split("\n")
 
 
-DATA = get_input_data()
-
-
-def parse_antennas():
+def parse_antennas(data: np.array) -> dict[str, list[complex]]:
     d = {}
-    for i, row in enumerate(DATA):
+    for i, row in enumerate(data):
         for j, _ in enumerate(row):
-            if DATA[i, j] == ".":
+            if data[i, j] == ".":
                 continue
 
-            antenna = str(DATA[i, j])
+            antenna = str(data[i, j])
             if antenna not in d:
                 d[antenna] = []
 
@@ -52,76 +51,79 @@ def parse_antennas():
     return d
 
 
-D = parse_antennas()
-ANTINODES = set()
-
-
-def print_data():
-    for row in DATA:
+def print_data(data: np.array):
+    for row in data:
         print("".join(row))  # noqa
 
 
-def get_frequency_antinodes(part: int):
-    for key in D:
-        get_antenas_antinodes(D[key], part)
+def get_frequency_antinodes(
+    antennas: dict[str, list[complex]], data: np.array, antinodes: set, part: int
+):
+    for key in antennas:
+        get_antenas_antinodes(antennas[key], data, antinodes, part)
 
 
-def get_antenas_antinodes(antenna: list, part: int):
+def get_antenas_antinodes(antenna: list, data: np.array, antinodes: set, part: int):
     for i, a in enumerate(antenna):
         for j, b in enumerate(antenna):
             if i == j:
                 continue
             if part == 1:
-                get_antinodes_1(a, b)
+                get_antinodes_1(a, b, data, antinodes)
             else:
-                get_antinodes_2(a, b)
+                get_antinodes_2(a, b, data, antinodes)
 
 
-def get_antinodes_1(a: complex, b: complex):
+def get_antinodes_1(a: complex, b: complex, data: np.array, antinodes: set):
     v = a - b
     anti_a = a + v
     anti_b = b - v
-    add_antinode(anti_a)
-    add_antinode(anti_b)
+    add_antinode(anti_a, data, antinodes)
+    add_antinode(anti_b, data, antinodes)
 
 
-def get_antinodes_2(a: complex, b: complex):
+def get_antinodes_2(a: complex, b: complex, data: np.array, antinodes: set):
     v = a - b
     anti_a = a + v
     anti_b = b - v
-    add_antinode(a)
-    add_antinode(b)
-    while add_antinode(anti_a):
+    add_antinode(a, data, antinodes)
+    add_antinode(b, data, antinodes)
+    while add_antinode(anti_a, data, antinodes):
         anti_a += v
-    while add_antinode(anti_b):
+    while add_antinode(anti_b, data, antinodes):
         anti_b -= v
 
 
-def add_antinode(v: complex) -> bool:
+def add_antinode(v: complex, data: np.array, antinodes: set) -> bool:
     x, y = int(v.real), int(v.imag)
-    if x < 0 or y < 0 or x >= DATA.shape[0] or y >= DATA.shape[1]:
+    if x < 0 or y < 0 or x >= data.shape[0] or y >= data.shape[1]:
         return False
 
-    ANTINODES.add(v)
-    if DATA[x, y] == ".":
-        DATA[x, y] = "#"
+    antinodes.add(v)
+    if data[x, y] == ".":
+        data[x, y] = "#"
 
     return True
 
 
-def part1() -> int:
-    global ANTINODES  # noqa
-    ANTINODES = set()
-    print_data()
-    get_frequency_antinodes(part=1)
-    print_data()
-    return len(ANTINODES)
+def count_antinodes(
+    grid: np.array, antennas: dict[str, list[complex]], part: int
+) -> int:
+    data = grid.copy()
+    antinodes = set()
+    print_data(data)
+    get_frequency_antinodes(antennas, data, antinodes, part=part)
+    print_data(data)
+    return len(antinodes)
+
+
+@solver
+def part1(data: tuple[np.array, dict[str, list[complex]]]) -> int:
+    grid, antennas = data
+    return count_antinodes(grid, antennas, part=1)
 
 
-def part2() -> int:
-    global ANTINODES  # noqa
-    ANTINODES = set()
-    print_data()
-    get_frequency_antinodes(part=2)
-    print_data()
-    return len(ANTINODES)
+@solver
+def part2(data: tuple[np.array, dict[str, list[complex]]]) -> int:
+    grid, antennas = data
+    return count_antinodes(grid, antennas, part=2)
@@ -6,15 +6,21 @@ from typing import LiteralString
 
 import numpy as np
 
-from aoc.utils import read_input
+from aoc.grid import Grid
+from aoc.solution import solver
+from aoc.utils import read_grid, to_grid
 
+TRAILHEAD = ord("0")
+PEAK = ord("9")
 
-def get_input_data():
-    return read_input(day=10, year=2024)
 
+def get_input_data() -> np.ndarray:
+    return read_grid(day=10, year=2024)
 
-def parse_data(data: list[str]):
-    return np.array([np.array([int(y) for y in x.strip()]) for x in data])
+
+def parse(data: list[str] | np.ndarray) -> np.ndarray:
+    # The heights stay characters, the impassable "." of some examples included
+    return to_grid(data)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -29,84 +35,55 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
-UP = -1 + 0j
-DOWN = 1 + 0j
-LEFT = 0 - 1j
-RIGHT = 0 + 1j
-
-
-def walk(data, i, j, direction, trail_id):
-    i1 = i + int(direction.real)
-    j1 = j + int(direction.imag)
-    if i1 < 0 or i1 >= len(data) or j1 < 0 or j1 >= len(data[0]):
-        return
-    if data[i1, j1] != data[i, j] + 1:
-        return
-    if data[i1, j1] == 9:  # noqa
-        TRAILS.add((trail_id, i1, j1))
-    find_trails(data, i1, j1, trail_id)
-
-
-def find_trails(data, i, j, trail_id):
-    walk(data, i, j, UP, trail_id)
-    walk(data, i, j, DOWN, trail_id)
-    walk(data, i, j, LEFT, trail_id)
-    walk(data, i, j, RIGHT, trail_id)
-
-
-def walk2(data, i, j, direction):
-    i1 = i + int(direction.real)
-    j1 = j + int(direction.imag)
-    if i1 < 0 or i1 >= len(data) or j1 < 0 or j1 >= len(data[0]):
-        return 0
-    if data[i1, j1] != data[i, j] + 1:
-        return 0
-    if data[i1, j1] == 9:  # noqa
-        return 1
-    return find_trails2(data, i1, j1)
-
-
-def find_trails2(data, i, j):
-    return sum(
-        [
-            walk2(data, i, j, UP),
-            walk2(data, i, j, DOWN),
-            walk2(data, i, j, LEFT),
-            walk2(data, i, j, RIGHT),
-        ]
-    )
-
-
-TRAILS = set()
-
-
-def count_trails():
-    return len(TRAILS)
-
-
-def part1() -> int:
-    r_data = get_input_data()
-    # r_data = get_test_input_data()
-    data = parse_data(r_data)
-    cpt = 1
-    for i, row in enumerate(data):
-        for j, _ in enumerate(row):
-            if data[i, j] == 0:
-                find_trails(data, i, j, cpt)
-                cpt += 1
-    return count_trails()
-
-
-def part2() -> int:
-    r_data = get_input_data()
-    # r_data = get_test_input_data()
-    data = parse_data(r_data)
-    cpt = 1
-    res = 0
-    for i, row in enumerate(data):
-        for j, _ in enumerate(row):
-            if data[i, j] == 0:
-                trail_count = find_trails2(data, i, j)
-                cpt += 1
-                res += trail_count
-    return res
+def scores(data: np.ndarray) -> list[int]:
+    """Number of peaks reachable from every trailhead.
+
+    The cells are processed a height at a time, from the peaks down. The
+    peaks reachable from a cell are a bitset, the union of the ones of
+    its neighbors one step higher.
+    """
+
+    grid = Grid(data)
+    view = grid.view
+    reach = [0] * len(grid.data)
+    for bit, cell in enumerate(np.flatnonzero(grid.data == PEAK).tolist()):
+        reach[cell] = 1 << bit
+
+    for height in reversed(range(TRAILHEAD, PEAK)):
+        for cell in np.flatnonzero(grid.data == height).tolist():
+            peaks = 0
+            for step in grid.n4:
+                if view[cell + step] == height + 1:
+                    peaks |= reach[cell + step]
+            reach[cell] = peaks
+    return [reach[cell].bit_count() for cell in np.flatnonzero(grid.data == TRAILHEAD)]
+
+
+def ratings(data: np.ndarray) -> np.ndarray:
+    """Number of trails from every cell to the peaks.
+
+    Like scores, a height at a time from the peaks down: the trails of
+    a cell are the sum of the ones of its neighbors one step higher, added
+    for the whole layer with shifted arrays.
+    """
+
+    trails = (data == PEAK).astype(np.int64)
+    for height in reversed(range(TRAILHEAD, PEAK)):
+        upper = np.where(data == height + 1, trails, 0)
+        total = np.zeros_like(trails)
+        total[1:, :] += upper[:-1, :]
+        total[:-1, :] += upper[1:, :]
+        total[:, 1:] += upper[:, :-1]
+        total[:, :-1] += upper[:, 1:]
+        trails = np.where(data == height, total, 0)
+    return trails
+
+
+@solver
+def part1(data: np.ndarray) -> int:
+    return sum(scores(data))
+
+
+@solver
+def part2(data: np.ndarray) -> int:
+    return int(ratings(data).sum())
@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+import bisect
+import logging
+from collections import Counter, defaultdict
 from typing import LiteralString
 
+from aoc import trace
+from aoc.memo import cached
+from aoc.solution import solver
 from aoc.utils import read_input
 
+logger = logging.getLogger(__name__)
 
-def get_input_data():
+TRACE_BLINK = trace.point(__name__, "blink")
+
+BLINKS_PART1 = 25
+BLINKS_PART2 = 75
+# 10 ** n, to count the digits of a stone and split it
+POWERS = tuple(10**n for n in range(40))
+
+
+def get_input_data() -> list[str]:
     return read_input(day=11, year=2024)
 
 
-def parse_data(data: list[str]):
-    return [int(x) for x in data[0].strip().split(" ")]
+def parse(data: list[str]) -> tuple[int, ...]:
+    return tuple(int(x) for x in data[0].strip().split(" "))
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -20,77 +35,89 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
-def divide_stones(stone_number: int) -> list[int]:
-    str_stone_number = str(stone_number)
-    mid = len(str_stone_number) // 2
-    stone_1 = str_stone_number[:mid]
-    stone_2 = str_stone_number[mid:]
+def digits(stone: int) -> int:
+    """Number of digits of the stone, 0 having one."""
 
-    return [int(stone_1), int(stone_2)]
+    n = bisect.bisect_right(POWERS, stone)
+    if n == len(POWERS):
+        # Past the precomputed powers, the stone got huge
+        while stone >= 10**n:
+            n += 1
+    return max(n, 1)
 
 
-def rules(stone_number: int) -> list[int]:
-    if stone_number == 0:
-        return [
-            1,
-        ]
+def divide_stones(stone_number: int, nb_digits: int) -> tuple[int, int]:
+    half = nb_digits // 2
+    return divmod(stone_number, POWERS[half] if half < len(POWERS) else 10**half)
+
 
-    if len(str(stone_number)) % 2 == 0:
-        return divide_stones(stone_number)
+# The stones repeat a lot, the rules of each value are computed once a run
+@cached(maxsize=None)
+def rules(stone_number: int) -> tuple[int, ...]:
+    if stone_number == 0:
+        return (1,)
 
-    return [
-        stone_number * 2024,
-    ]
+    nb_digits = digits(stone_number)
+    if nb_digits % 2 == 0:
+        return divide_stones(stone_number, nb_digits)
 
+    return (stone_number * 2024,)
 
-def blink(stones: list[int]) -> list[int]:
-    new_stones = []
-    for stone in stones:
-        new_stone = rules(stone)
-        new_stones.extend(new_stone)
-    return new_stones
 
+def blink(counts: dict[int, int]) -> dict[int, int]:
+    """Blink once, the stones being counted by value."""
 
-def part1() -> int:
-    data = get_input_data()
-    stones = parse_data(data)
-    for _ in range(25):
-        stones = blink(stones)
-    return len(stones)
+    new_counts: defaultdict[int, int] = defaultdict(int)
+    for stone, count in counts.items():
+        for new_stone in rules(stone):
+            new_counts[new_stone] += count
+    return new_counts
 
 
-NB_CACHE_STONES = 100
+def evolve(stones: tuple[int, ...], blinks: int) -> dict[int, int]:
+    """Count the stones by value after the blinks.
 
+    The order of the stones does not matter, the memory only grows with
+    the distinct values.
+    """
 
-def deep_first_compute(stone, depth, cache) -> int:
-    if stone < NB_CACHE_STONES and stone in cache and depth in cache[stone]:
-        return cache[stone][depth]
+    counts: dict[int, int] = Counter(stones)
+    for step in range(1, blinks + 1):
+        counts = blink(counts)
+        logger.debug("Blink %d: %d distinct stones", step, len(counts))
+        if TRACE_BLINK.enabled:
+            TRACE_BLINK.emit(
+                step=step, distinct=len(counts), stones=sum(counts.values())
+            )
+    return counts
 
-    if depth == 0:
-        return 1
 
-    stones = rules(stone)
+@solver
+def part1(stones: tuple[int, ...]) -> int:
+    return sum(evolve(stones, BLINKS_PART1).values())
 
-    res = deep_first_compute(stones[0], depth - 1, cache)
 
-    if len(stones) > 1:
-        res += deep_first_compute(stones[1], depth - 1, cache)
+@solver
+def part2(stones: tuple[int, ...]) -> int:
+    return sum(evolve(stones, BLINKS_PART2).values())
 
-    if stone < NB_CACHE_STONES:
-        if stone not in cache:
-            cache[stone] = {}
 
-        cache[stone][depth] = res
+def main() -> None:
+    """Blink at the stones of the input, logging the distinct values of each step."""
 
-    return res
+    import click
 
+    @click.command()
+    @click.option(
+        "--blinks", "-b", type=int, default=BLINKS_PART2, help="Number of blinks"
+    )
+    def run(blinks: int) -> None:
+        logging.basicConfig(level=logging.DEBUG, format="%(message)s")
+        counts = evolve(parse(get_input_data()), blinks)
+        logger.info("%d stones after %d blinks", sum(counts.values()), blinks)
 
-def part2() -> int:
-    data = get_input_data()
-    stones = parse_data(data)
+    run()
 
-    res = 0
-    for stone in stones:
-        res += deep_first_compute(stone, 75, {})
 
-    return res
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,8 @@ from typing import LiteralString
 
 import numpy as np
 
-from aoc.utils import read_input
+from aoc.solution import solver
+from aoc.utils import read_grid, to_grid
 
 UP = -1 + 0j
 DOWN = 1 + 0j
@@ -16,12 +17,12 @@ RIGHT = 0 + 1j
 MAX_NEIGHBORS = 4
 
 
-def get_input_data():
-    return read_input(day=12, year=2024)
+def get_input_data() -> np.ndarray:
+    return read_grid(day=12, year=2024)
 
 
-def parse_data(data: list[str]):
-    return np.array([np.array(list(line.rstrip())) for line in data])
+def parse(data: list[str] | np.ndarray) -> np.ndarray:
+    return to_grid(data)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -157,11 +158,11 @@ class Zone:
 def print_map(data: np.array) -> None:
     for i, row in enumerate(data):
         for j in range(len(row)):
-            print(data[i, j], end="")  # noqa
+            print(chr(data[i, j]), end="")  # noqa
         print("")  # noqa
 
 
-def walk_zone(plant: str, plot: complex, data: np.array, visited: set) -> list[complex]:
+def walk_zone(plant: int, plot: complex, data: np.array, visited: set) -> list[complex]:
     if plot in visited:
         return []
 
@@ -190,12 +191,12 @@ def build_zones(data) -> list[Zone]:
     for i, row in enumerate(data):
         for j in range(len(row)):
             plot = complex(i, j)
-            plant = str(data[i, j])
+            plant = data[i, j]
             if plot in visited:
                 continue
 
             plots = walk_zone(plant, plot, data, set())
-            zones.append(Zone(plant, set(plots)))
+            zones.append(Zone(chr(plant), set(plots)))
             visited.update(plots)
 
     return zones
@@ -206,10 +207,8 @@ def print_zones(zones: list[Zone]):
         print(zone)  # noqa
 
 
-def part1() -> int:
-    data = get_input_data()
-    # data = get_test_input_data()
-    mat = parse_data(data)
+@solver
+def part1(mat: np.array) -> int:
     # print_map(mat)
     zones = build_zones(mat)
     # print_zones(zones)
@@ -219,10 +218,8 @@ def part1() -> int:
     return res
 
 
-def part2() -> int:
-    data = get_input_data()
-    # data = get_test_input_data()
-    mat = parse_data(data)
+@solver
+def part2(mat: np.array) -> int:
     print_map(mat)
     zones = build_zones(mat)
     res = 0
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-import re
+import math
 from typing import LiteralString
 
-from aoc.utils import read_input
+import numpy as np
 
-R_ROBOT_LINE = re.compile("p=(-?\\d+),(-?\\d+) v=(-?\\d+),(-?\\d+).*")
+from aoc.parse import int_rows
+from aoc.solution import solver
+from aoc.utils import read_input
 
 WIDE = 101
 TALL = 103
@@ -21,16 +23,13 @@ RIGHT = complex(0, TALL)
 TOP = complex(WIDE, 0)
 BOTTOM = complex(-WIDE, 0)
 
-
-def parse_robot(line: str) -> tuple[complex, complex]:
-    n1, n2, n3, n4 = R_ROBOT_LINE.findall(line)[0]
-
-    return complex(int(n1), int(n2)), complex(int(n3), int(n4))
+# Steps checked at once by part2
+STEPS_PER_BATCH = 256
 
 
 class Robot:
-    def __init__(self, line: str) -> None:
-        self.pos, self.velocity = parse_robot(line)
+    def __init__(self, pos: complex, velocity: complex) -> None:
+        self.pos, self.velocity = pos, velocity
 
     def __str__(self) -> str:
         return f"Pos: {self.pos}, velocity: {self.velocity}"
@@ -53,12 +52,20 @@ class Robot:
         self.pos += direction
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=14, year=2024)
 
 
-def parse_data(data: list[str]):
-    return [Robot(line.strip()) for line in data]
+def parse(data: list[str]) -> tuple[tuple[complex, complex], ...]:
+    # p=x,y v=x,y
+    return tuple(
+        (complex(px, py), complex(vx, vy))
+        for px, py, vx, vy in int_rows(data, 4).tolist()
+    )
+
+
+def build_robots(data: tuple[tuple[complex, complex], ...]) -> list[Robot]:
+    return [Robot(pos, velocity) for pos, velocity in data]
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -117,9 +124,9 @@ def count_qadra(robots: list[Robot]) -> tuple[int, int, int, int, int]:
     return q1 * q2 * q3 * q4, q1, q2, q3, q4
 
 
-def part1() -> int:
-    data = get_input_data()
-    robots = parse_data(data)
+@solver
+def part1(data: tuple[tuple[complex, complex], ...]) -> int:
+    robots = build_robots(data)
 
     print_robots(robots)
     print()  # noqa
@@ -133,20 +140,30 @@ def part1() -> int:
     return count_qadra(robots)[0]
 
 
-def part2() -> int:
-    data = get_input_data()
-    robots = parse_data(data)
-
-    print_robots(robots)
-    print()  # noqa
-    print()  # noqa
-    cpt = 1
-    while True:
-        [x.move() for x in robots]
-        poss = [x.pos for x in robots]
-        counts = {x: poss.count(x) for x in poss}
-        if all([x == 1 for x in counts.values()]):  # noqa
-            print_robots(robots)
-            print("All robots are alone")  # noqa
-            return cpt
-        cpt += 1
+def robots_period(data: tuple[tuple[complex, complex], ...]) -> int:
+    """Steps before every robot is back, each axis having its own period."""
+
+    periods = []
+    for _, velocity in data:
+        periods.append(WIDE // math.gcd(int(velocity.real), WIDE))
+        periods.append(TALL // math.gcd(int(velocity.imag), TALL))
+    return math.lcm(*periods)
+
+
+@solver
+def part2(data: tuple[tuple[complex, complex], ...]) -> int:
+    robots = np.array(
+        [(p.real, p.imag, v.real, v.imag) for p, v in data], dtype=np.int64
+    ).reshape(-1, 4)
+    px, py, vx, vy = robots.T
+
+    # Past the period the robots are back where they started, no need to look further
+    period = robots_period(data)
+    for first in range(1, period + 1, STEPS_PER_BATCH):
+        steps = np.arange(first, min(first + STEPS_PER_BATCH, period + 1))[:, None]
+        positions = ((px + vx * steps) % WIDE) * TALL + (py + vy * steps) % TALL
+        positions.sort(axis=1)
+        alone = (positions[:, 1:] != positions[:, :-1]).all(axis=1)
+        if alone.any():
+            return int(steps[alone.argmax(), 0])
+    return 0
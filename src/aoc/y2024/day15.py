@@ -7,6 +7,7 @@ from typing import LiteralString
 
 import numpy as np
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 UP = complex(-1, 0)
@@ -27,10 +28,19 @@ class BCOLORS:
     UNDERLINE = "\033[4m"
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=15, year=2024)
 
 
+def parse(data: list[str]) -> tuple[np.array, np.array, tuple[complex, ...]]:
+    data = [x.strip() for x in data]
+    mapp, moves = parse_data_p1(data)
+    mapp2, _ = parse_data_p2(data)
+    mapp.flags.writeable = False
+    mapp2.flags.writeable = False
+    return mapp, mapp2, tuple(moves)
+
+
 def parse_data_p1(data: list[str]) -> tuple[np.array, list[complex]]:
     sep = data.index("")
     mapp = parse_map(data[:sep])
@@ -254,10 +264,10 @@ def get_coord(mapp: np.array, box_str="O") -> int:
     return res
 
 
-def part1() -> int:
-    data = [x.strip() for x in get_input_data()]
-    # data = get_test_input_data()
-    mapp, moves = parse_data_p1(data)
+@solver
+def part1(data: tuple[np.array, np.array, tuple[complex, ...]]) -> int:
+    mapp, _, moves = data
+    mapp = mapp.copy()
     print_map(mapp)
     print()  # noqa
 
@@ -271,9 +281,10 @@ def part1() -> int:
     return get_coord(mapp)
 
 
-def part2() -> int:
-    data = [x.strip() for x in get_input_data()]
-    mapp, moves = parse_data_p2(data)
+@solver
+def part2(data: tuple[np.array, np.array, tuple[complex, ...]]) -> int:
+    _, mapp, moves = data
+    mapp = mapp.copy()
     print_map(mapp)
     for n_move in moves:
         robot = find_robot2(mapp)
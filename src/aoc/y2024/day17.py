@@ -7,16 +7,17 @@ import re
 from statistics import median
 from typing import LiteralString
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 MAX_QUEUE_SIZE = 100
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=17, year=2024)
 
 
-def parse_data(data: list[str]):
+def parse(data: list[str]) -> tuple[dict[str, int], tuple[int, ...]]:
     registers = {}
     program = []
 
@@ -29,7 +30,7 @@ def parse_data(data: list[str]):
             program = program[0].split(",")
             program = list(map(int, program))
 
-    return registers, program
+    return registers, tuple(program)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -99,10 +100,10 @@ def out(operand, _):
     return operand % 8
 
 
-def part1() -> str:
-    data = get_input_data()
-    registers, program = parse_data(data)
-    output = run_program(registers, program)
+@solver
+def part1(data: tuple[dict[str, int], tuple[int, ...]]) -> str:
+    registers, program = data
+    output = run_program(registers.copy(), program)
     return ",".join(map(str, output))
 
 
@@ -194,10 +195,10 @@ def compute_number_of_match(result, program):
     return len([i for i, j in zip(result, program) if i == j])
 
 
-def part2() -> int:
-    data = get_input_data()
-    # data = get_test_input_data()
-    _, program = parse_data(data)
+@solver
+def part2(data: tuple[dict[str, int], tuple[int, ...]]) -> int:
+    _, program = data
+    program = list(program)
 
     min_value = 0
     max_value = 0
@@ -2,25 +2,43 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import numpy as np
 
+from aoc.search import SearchResult, bfs
+from aoc.solution import solver
 from aoc.utils import DOWN, LEFT, RIGHT, UP, read_input
 
 TEST_BOARD_SIZE = 6
 REAL_BOARD_SIZE = 70
 
+NO_BYTE = np.iinfo(np.int64).max
+
 
-def get_input_data():
-    return REAL_BOARD_SIZE, read_input(day=18, year=2024)
+def get_input_data() -> list[str]:
+    return read_input(day=18, year=2024)
 
 
-def parse_data(data):
+def parse(data: list[str]) -> tuple[int, tuple[tuple[int, complex], ...]]:
     coordonates = []
     for i, line in enumerate(data):
+        if not line.strip():
+            continue
         x, y = line.strip().split(",")
         coordonates.append((i, complex(int(x), int(y))))
 
-    return coordonates
+    # The example is played on the small board
+    max_coord = max(max(int(c.real), int(c.imag)) for _, c in coordonates)
+    board_size = TEST_BOARD_SIZE if max_coord <= TEST_BOARD_SIZE else REAL_BOARD_SIZE
+
+    return board_size, tuple(coordonates)
+
+
+def get_working_bytes(board_size: int) -> int:
+    if board_size == TEST_BOARD_SIZE:
+        return PART1_WORKING_TEST
+    return PART1_WORKING_REAL
 
 
 def get_test_input_data():
@@ -49,81 +67,44 @@ def get_test_input_data():
 0,5
 1,6
 2,0"""
-    return TEST_BOARD_SIZE, data.split("\n")
+    return data.split("\n")
 
 
 def build_board(board_size, coordonates):
-    board = np.array(
-        [
-            np.array(["." for _ in range(board_size + 1)], dtype=object)
-            for _ in range(board_size + 1)
-        ]
-    )
+    """Rank of the byte falling on each cell, NO_BYTE when none falls."""
 
+    board = np.full((board_size + 1, board_size + 1), NO_BYTE, dtype=np.int64)
     for i, coord in coordonates:
-        board[int(coord.imag), int(coord.real)] = str(i)
+        board[int(coord.imag), int(coord.real)] = i
 
     return board
 
 
-def get_shortest_path_at_rank(board, start_pos, end_pos, override_rank=None) -> tuple:
-    unvisited = {
-        complex(x, y) for x in range(board.shape[0]) for y in range(board.shape[1])
-    }
-    distances = {k: float("inf") for k in unvisited}
-    distances[start_pos] = 0
-    predecessors = {}
-
-    while unvisited:
-        # Get the unvisited with the smalest distance
-        current = min(unvisited, key=distances.get)
+def get_shortest_path_at_rank(board, start_pos, end_pos, rank) -> SearchResult:
+    """Search the board once the bytes up to rank have fallen."""
 
-        if current == end_pos:
-            break
-
-        current_rank = (
-            override_rank if override_rank is not None else distances[current]
-        )
-
-        for neighbor in [current + UP, current + DOWN, current + LEFT, current + RIGHT]:
-            if neighbor not in unvisited:
-                continue
-
-            cell_val = board[int(neighbor.imag)][int(neighbor.real)]
-            if cell_val != "." and int(cell_val) <= current_rank:
-                # It is now considered as a wall
-                continue
+    height, width = board.shape
 
-            new_distance = distances[current] + 1
-            if new_distance < distances[neighbor]:
-                distances[neighbor] = new_distance
-                predecessors[neighbor] = current
+    def neighbours(current: complex) -> Iterator[complex]:
+        for direction in (UP, DOWN, LEFT, RIGHT):
+            neighbor = current + direction
+            x, y = int(neighbor.real), int(neighbor.imag)
+            # The fallen bytes are walls
+            if 0 <= x < width and 0 <= y < height and board[y, x] > rank:
+                yield neighbor
 
-        unvisited.remove(current)
+    return bfs([start_pos], neighbours, goal=lambda x: x == end_pos)
 
-    return distances, predecessors
 
-
-def get_shortest_path(predecessors, start_pos, end_pos):
-    path = []
-    current = end_pos
-    while current != start_pos:
-        path.append(current)
-        current = predecessors[current]
-    return path
-
-
-def part1() -> int:
-    board_size, data = get_input_data()
-    # board_size, data = get_test_input_data()
-    coordonates = parse_data(data)
+@solver
+def part1(data: tuple[int, tuple[tuple[int, complex], ...]]) -> int:
+    board_size, coordonates = data
     board = build_board(board_size, coordonates)
     start_pos, end_pos = complex(0, 0), complex(board_size, board_size)
-    distances, predecessors = get_shortest_path_at_rank(
-        board, start_pos, end_pos, override_rank=1023
+    result = get_shortest_path_at_rank(
+        board, start_pos, end_pos, rank=get_working_bytes(board_size) - 1
     )
-    path = get_shortest_path(predecessors, start_pos, end_pos)
-    return len(path)
+    return int(result.cost)
 
 
 # Path working for part 1, no bit_stopper at least before those numbers
@@ -131,19 +112,16 @@ PART1_WORKING_TEST = 12
 PART1_WORKING_REAL = 1024
 
 
-def part2() -> int:
-    board_size, data = get_input_data()
-    # board_size, data = get_test_input_data()
-    coordonates = parse_data(data)
+@solver
+def part2(data: tuple[int, tuple[tuple[int, complex], ...]]) -> int:
+    board_size, coordonates = data
     board = build_board(board_size, coordonates)
     start_pos, end_pos = complex(0, 0), complex(board_size, board_size)
 
-    cpt = PART1_WORKING_TEST if board_size == TEST_BOARD_SIZE else PART1_WORKING_REAL
+    cpt = get_working_bytes(board_size)
 
-    distances, predecessors = get_shortest_path_at_rank(
-        board, start_pos, end_pos, override_rank=cpt
-    )
-    path = get_shortest_path(predecessors, start_pos, end_pos)
+    result = get_shortest_path_at_rank(board, start_pos, end_pos, rank=cpt)
+    path = set(result.path())
 
     while True:
         cpt += 1
@@ -151,13 +129,11 @@ def part2() -> int:
         # Skip if the bit stopper is not in the path
         if coordonates[cpt][1] not in path:
             continue
-        distances, predecessors = get_shortest_path_at_rank(
-            board, start_pos, end_pos, override_rank=cpt
-        )
-        if distances[end_pos] == float("inf"):
+        result = get_shortest_path_at_rank(board, start_pos, end_pos, rank=cpt)
+        if not result.goals:
             break
 
-        path = get_shortest_path(predecessors, start_pos, end_pos)
+        path = set(result.path())
 
     curent_bit_stopper = coordonates[cpt][1]
     x, y = int(curent_bit_stopper.real), int(curent_bit_stopper.imag)
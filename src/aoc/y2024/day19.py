@@ -5,16 +5,17 @@ from __future__ import annotations
 from collections import deque
 from typing import LiteralString
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=19, year=2024)
 
 
-def parse_data(data: list[str]):
-    towels = list(data[0].strip().split(", "))
-    desings = [x.strip() for x in data[2:]]
+def parse(data: list[str]) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    towels = tuple(data[0].strip().split(", "))
+    desings = tuple(x.strip() for x in data[2:])
     return towels, desings
 
 
@@ -99,10 +100,9 @@ def reduce_desings_complexity(designs: list[str]):
     return res
 
 
-def part1() -> int:
-    data = get_input_data()
-    # data = get_test_input_data()
-    designs, towels = parse_data(data)
+@solver
+def part1(data: tuple[tuple[str, ...], tuple[str, ...]]) -> int:
+    designs, towels = data
     designs = sorted(designs, key=lambda x: len(x), reverse=True)
     print(f"Nb designs {len(designs)}")  # noqa
     designs = reduce_desings_complexity(designs)
@@ -119,11 +119,10 @@ def part1() -> int:
     return res
 
 
-def part2() -> int:
+@solver
+def part2(data: tuple[tuple[str, ...], tuple[str, ...]]) -> int:
     res = 0
-    data = get_input_data()
-    # data = get_test_input_data()
-    designs, towels = parse_data(data)
+    designs, towels = data
     designs = sorted(designs, key=lambda x: len(x), reverse=True)
     print(f"Nb designs {len(designs)}")  # noqa
     reduce_designs = reduce_desings_complexity(designs)
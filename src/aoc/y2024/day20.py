@@ -2,33 +2,38 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from contextlib import suppress
 from typing import LiteralString
 
 import numpy as np
 
+from aoc.search import SearchResult, bfs
+from aoc.solution import solver
 from aoc.utils import (
     DOWN,
     LEFT,
     RIGHT,
     UP,
+    find_bytes,
     get_pos_coord,
     get_value_at,
-    read_input,
+    read_grid,
     time_it,
+    to_grid,
 )
 
 MIN_PICO_GAIN = 100
 
-TEST = False
+WALL = ord("#")
 
 
-def get_input_data():
-    return read_input(day=20, year=2024)
+def get_input_data() -> np.ndarray:
+    return read_grid(day=20, year=2024)
 
 
-def parse_data(data):
-    return np.array([np.array(list(row), dtype=object) for row in data])
+def parse(data: list[str] | np.ndarray) -> np.ndarray:
+    return to_grid(data)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -51,8 +56,8 @@ def get_test_input_data() -> list[LiteralString]:
 
 
 def find_start_stop(track: np.array) -> tuple[complex, complex]:
-    start, stop = np.where(track == "S"), np.where(track == "E")
-    return complex(start[0], start[1]), complex(stop[0], stop[1])
+    (start,), (stop,) = find_bytes(track, "S"), find_bytes(track, "E")
+    return complex(*start), complex(*stop)
 
 
 def is_cheatable_wall(track: np.array, position: complex, direction: complex) -> bool:
@@ -62,51 +67,22 @@ def is_cheatable_wall(track: np.array, position: complex, direction: complex) ->
         return False
 
     # If the landing is not a wall, it's not cheatable
-    if get_value_at(track, position + direction) == "#":
+    if get_value_at(track, position + direction) == WALL:
         return False
 
     return True
 
 
 @time_it
-def short_path(track: np.array, start: complex, stop: complex):
-    unvisited = {
-        complex(x, y)
-        for x in range(track.shape[0])
-        for y in range(track.shape[1])
-        if track[x, y] != "#"
-    }
-    distances = {k: float("inf") for k in unvisited}
-    distances[start] = 0
-
-    while unvisited:
-        current = min(unvisited, key=lambda x: distances[x])
-        unvisited.remove(current)
-
-        if current == stop:
-            break
-
-        neighbors = [current + direction for direction in [1, -1, 1j, -1j]]
-
-        for neighbor in neighbors:
-            if neighbor in unvisited:
-                distances[neighbor] = min(distances[neighbor], distances[current] + 1)
-    return distances
-
+def short_path(track: np.array, start: complex, stop: complex) -> SearchResult:
+    def neighbours(current: complex) -> Iterator[complex]:
+        for direction in [1, -1, 1j, -1j]:
+            neighbor = current + direction
+            # The track is surrounded by walls
+            if track[int(neighbor.real), int(neighbor.imag)] != WALL:
+                yield neighbor
 
-def get_path(
-    distances: dict[complex, int | float], start: complex, stop: complex
-) -> list[complex]:
-    path = []
-    current = stop
-    while current != start:
-        path.append(current)
-        neighbors = [current + direction for direction in [1, -1, 1j, -1j]]
-        current = min(
-            neighbors, key=lambda x: distances[x] if x in distances else float("inf")
-        )
-    path.append(start)
-    return path[::-1]
+    return bfs([start], neighbours, goal=lambda x: x == stop)
 
 
 def filter_shortcuts(raw_path, shortcuts, distances, wall_distances, symbol_pos):
@@ -141,7 +117,7 @@ def adj_matrix(track: np.array, symbols) -> np.array:
         complex(x, y)
         for x in range(track.shape[0])
         for y in range(track.shape[1])
-        if track[x, y] in symbols
+        if chr(track[x, y]) in symbols
     }
     symbol_poss = list(symbol_set)
 
@@ -154,7 +130,7 @@ def adj_matrix(track: np.array, symbols) -> np.array:
     for pos in symbol_poss:
         for direction in [1, 1j, -1, -1j]:
             with suppress(IndexError):
-                if get_value_at(track, pos + direction) in symbols:
+                if chr(get_value_at(track, pos + direction)) in symbols:
                     i = symbol_poss.index(pos)
                     j = symbol_poss.index(pos + direction)
                     adj_matrix[i, j] = 1
@@ -179,7 +155,7 @@ def get_adjacent_walls(track, pos):
     for direction in [UP, DOWN, LEFT, RIGHT]:
         neighbor = pos + direction
         with suppress(IndexError):
-            if get_value_at(track, neighbor) == "#":
+            if get_value_at(track, neighbor) == WALL:
                 c_walls.append(neighbor)
     return c_walls
 
@@ -195,17 +171,13 @@ def find_shortcuts(pos, c_wall, wall_distances, symbol_pos, shortcut_len):
     return [(pos, c_wall, egress_node) for egress_node in egress_nodes]
 
 
-def all_part(shortcut_len: int) -> int:
-    data = get_input_data()
-    if TEST:
-        data = get_test_input_data()
-    track = parse_data(data)
+def all_part(track: np.array, shortcut_len: int) -> int:
     start, stop = find_start_stop(track)
     print(f"Start: {start}, Stop: {stop}")  # noqa
 
     # Compute the normal path
-    distances = short_path(track, start, stop)
-    raw_path = get_path(distances, start, stop)
+    result = short_path(track, start, stop)
+    distances, raw_path = result.distances, result.path()
     print(f"Path length: {len(raw_path)}")  # noqa
 
     savings = {}
@@ -228,9 +200,11 @@ def all_part(shortcut_len: int) -> int:
     return res
 
 
-def part1() -> int:
-    return all_part(2)
+@solver
+def part1(track: np.array) -> int:
+    return all_part(track, 2)
 
 
-def part2() -> int:
-    return all_part(20)
+@solver
+def part2(track: np.array) -> int:
+    return all_part(track, 20)
@@ -4,15 +4,18 @@ from __future__ import annotations
 
 from typing import LiteralString
 
+from aoc import search
+from aoc.memo import cached
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=21, year=2024)
 
 
-def parse_data(data: list[str]):
-    return [x.strip() for x in data]
+def parse(data: list[str]) -> tuple[str, ...]:
+    return tuple(x.strip() for x in data if x.strip())
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -65,41 +68,22 @@ ARROW_KEYPAD = {
 }
 
 
-def get_neighbours(pos):
-    return [
-        (pos + 1, "v"),
-        (pos - 1, "^"),
-        (pos + 1j, ">"),
-        (pos - 1j, "<"),
-    ]
+DIRECTIONS = {1: "v", -1: "^", 1j: ">", -1j: "<"}
 
 
 def bfs(pad, start, end):
-    queue = [(start, [])]
-    visited = set()
-    paths = []
-
-    while queue:
-        queue = sorted(queue, key=lambda x: len(x[1]))
-        current, path = queue.pop(0)
-        visited.add(current)
-
-        if current == end:
-            paths += [path]
-            continue
-
-        for neighbor, direction in get_neighbours(current):
-            t_path = path.copy()
-            if neighbor not in pad.values():
-                continue
+    """Every shortest sequence of directions from start to end on the pad."""
 
-            if neighbor in visited:
-                continue
+    keys = set(pad.values())
 
-            t_path.append(direction)
-            queue.append((neighbor, t_path))
+    def neighbours(pos: complex) -> list[complex]:
+        return [pos + x for x in DIRECTIONS if pos + x in keys]
 
-    return ["".join(x) for x in paths]
+    result = search.bfs([start], neighbours, goal=lambda x: x == end, all_paths=True)
+    return [
+        "".join(DIRECTIONS[b - a] for a, b in zip(path, path[1:]))
+        for path in result.paths()
+    ]
 
 
 def get_path(keypad):
@@ -116,13 +100,10 @@ def get_path(keypad):
 DIGI_PATH = get_path(DIGIT_KEYPAD)
 ARROW_PATH = get_path(ARROW_KEYPAD)
 
-CACHE = {}
-
 
+# The keypad paths are the same for every call
+@cached(maxsize=4096, key=lambda code, keypad, lvl: (code, lvl))
 def enter_code(code, keypad, lvl):
-    if (code, lvl) in CACHE:
-        return CACHE[(code, lvl)]
-
     if lvl == 0:
         code = code[1:]
         return len(code)
@@ -136,17 +117,10 @@ def enter_code(code, keypad, lvl):
         min_sub_path = min(sub_paths_sub_lvl)
         l_path += min_sub_path
 
-    CACHE[(code, lvl)] = l_path
-
     return l_path
 
 
-def compute_robots(nb_robots, test) -> int:
-    data = get_input_data()
-    if test:
-        data = get_test_input_data()
-    codes = parse_data(data)
-
+def compute_robots(codes: tuple[str, ...], nb_robots: int) -> int:
     # Merge DIGI_PATH and ARROW_PATH
     paths = {}
     for k in DIGI_PATH:
@@ -170,9 +144,11 @@ def compute_robots(nb_robots, test) -> int:
     return final_r
 
 
-def part1() -> int:
-    return compute_robots(3, test=False)
+@solver
+def part1(codes: tuple[str, ...]) -> int:
+    return compute_robots(codes, 3)
 
 
-def part2() -> int:
-    return compute_robots(26, test=False)
+@solver
+def part2(codes: tuple[str, ...]) -> int:
+    return compute_robots(codes, 26)
@@ -2,18 +2,21 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Iterable, LiteralString
+from typing import LiteralString
 
+import numpy as np
+
+from aoc.parallel import pmap
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=22, year=2024)
 
 
-def parse_data(data: list[str]):
-    return [int(x) for x in data]
+def parse(data: list[str]) -> tuple[int, ...]:
+    return tuple(int(x) for x in data if x.strip())
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -59,83 +62,60 @@ def get_next_sn(sn: int) -> int:
     return sn
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    snss = parse_data(data)
+def final_secret(sn: int) -> int:
+    for _ in range(2000):
+        sn = get_next_sn(sn)
+    return sn
 
-    res = 0
 
-    for sn in snss:
-        nsn = sn
-        for _ in range(2000):
-            nsn = get_next_sn(nsn)
+@solver
+def part1(snss: tuple[int, ...]) -> int:
+    return sum(pmap(final_secret, snss))
 
-        print(f"sn: {sn}, nsn: {nsn}")
-        res += nsn
 
-    return res
+# A change is in -9..9, a sequence of 4 changes is packed in base 19
+NB_CHANGES = 19
+NB_SEQS = NB_CHANGES**4
+# Buyers simulated by a pmap task, the task returns the bananas of every sequence
+BUYERS_PER_TASK = 64
 
 
-def walk(codes: list[int]) -> Iterable[tuple[int, int, int, int, int]]:
-    for i in range(len(codes) - 3):
-        yield codes[i], codes[i + 1], codes[i + 2], codes[i + 3], i + 3
-
-
-def find_max_bananas(
-    prices: dict[int, list[int]], changes: dict[int, list[int]]
-) -> int:
-    seqs = {}
-    visited = defaultdict(list)
-    for buyer in range(len(prices)):
-        print(f"buyer: {buyer}, prices: {prices[buyer][:10]}")
-
-        for x in walk(changes[buyer]):
-            seq = x[:-1]
-            index = x[-1]
-            if seq not in seqs:
-                # if seq == (-2, 1, -1, 3) or seq ==  (-2, 2, -1, -1):
-                #     print(f"NEW seq: {seq}, index: {index} found for buyer: {buyer} : {prices[buyer][index + 1]}")
-                seqs[seq] = prices[buyer][index + 1]
-                visited[seq].append(buyer)
-            if buyer not in visited[seq]:
-                # if seq == (-2, 1, -1, 3) or seq ==  (-2, 2, -1, -1):
-                #     print(f"ADDED seq: {seq}, index: {index} found for buyer: {buyer} : {prices[buyer][index + 1]}, seqs[seq]: {seqs[seq]}")
-                seqs[seq] += prices[buyer][index + 1]
-                visited[seq].append(buyer)
-
-    max_bananas = max(seqs, key=lambda x: seqs[x])
-    res = seqs[max_bananas]
-    print(f"max_bananas_seq: {max_bananas}")
-    print(f"max_bananas: {res}")
+def sequence_bananas(buyers: tuple[int, ...]) -> np.ndarray:
+    """Bananas bought from the buyers for each sequence of changes."""
 
-    return res
+    bananas = np.zeros(NB_SEQS, dtype=np.int64)
+    for sn in buyers:
+        seen = bytearray(NB_SEQS)
+        seq = 0
+        price = sn % 10
+        for i in range(2000):
+            sn = get_next_sn(sn)
+            new_price = sn % 10
+            seq = (seq * NB_CHANGES + new_price - price + 9) % NB_SEQS
+            price = new_price
+            # The monkey sells at the first occurrence of the sequence
+            if i >= 3 and not seen[seq]:
+                seen[seq] = 1
+                bananas[seq] += price
+    return bananas
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    # data = get_test_input_data()
-    snss = parse_data(data)
+def find_max_bananas(snss: tuple[int, ...]) -> int:
+    tasks = [
+        snss[i : i + BUYERS_PER_TASK] for i in range(0, len(snss), BUYERS_PER_TASK)
+    ]
+    bananas = np.sum(pmap(sequence_bananas, tasks), axis=0)
 
-    secret_codes = defaultdict(list)
-    prices = defaultdict(list)
-
-    for buyer, sn in enumerate(snss):
-        nsn = sn
-        for _ in range(2001):
-            secret_codes[buyer].append(nsn)
-            prices[buyer].append(int(str(nsn)[-1]))
-            nsn = get_next_sn(nsn)
-
-    changes = defaultdict(list)
+    max_bananas = int(np.argmax(bananas))
+    res = int(bananas[max_bananas])
+    print(f"max_bananas: {res}")
 
-    for buyer in range(len(prices)):
-        changes[buyer] = [y - x for x, y in zip(prices[buyer], prices[buyer][1:])]
+    return res
 
-    print(f"secret_codes for buyer 0: {secret_codes[0][:10]}")
-    print(f"prices for buyer 0: {prices[0][:10]}")
-    print(f"changes for buyer 0: {changes[0][:10]}")
 
-    res = find_max_bananas(prices, changes)
+@solver
+def part2(snss: tuple[int, ...]) -> int:
+    res = find_max_bananas(snss)
 
     if res >= 2528:
         raise ValueError(f"res: {res} to high")
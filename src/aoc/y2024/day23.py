@@ -5,16 +5,16 @@ from __future__ import annotations
 from collections import defaultdict
 from typing import LiteralString
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-def get_input_data():
-    data = read_input(day=23, year=2024)
-    return [z.strip() for z in data]
+def get_input_data() -> list[str]:
+    return read_input(day=23, year=2024)
 
 
-def parse_data(data: list[str]):
-    return [z for z in data]
+def parse(data: list[str]) -> tuple[str, ...]:
+    return tuple(z.strip() for z in data if z.strip())
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -53,7 +53,7 @@ td-yn"""
     return data.split("\n")
 
 
-def find_computer_neighbors(computer_connections: list[str]):
+def find_computer_neighbors(computer_connections: tuple[str, ...]):
     neighbors = defaultdict(set)
     for connection in computer_connections:
         a, b = connection.split("-")
@@ -103,10 +103,8 @@ def find_chef_historian(networks):
     return chef_historian_networks
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    # data = get_test_input_data()
-    computer_connections = parse_data(data)
+@solver
+def part1(computer_connections: tuple[str, ...]) -> int:
     neighbors = find_computer_neighbors(computer_connections)
 
     print(neighbors)
@@ -129,10 +127,8 @@ def part1() -> int:
     return res
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    # data = get_test_input_data()
-    computer_connections = parse_data(data)
+@solver
+def part2(computer_connections: tuple[str, ...]) -> int:
     neighbors = find_computer_neighbors(computer_connections)
 
     n_max_networks = find_max_interconnected_networks(neighbors)
@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Tuple
 
+from aoc.parse import split_blocks
+from aoc.solution import solver
 from aoc.utils import read_input
 
 # Type definitions
@@ -41,10 +43,10 @@ class Connection:
 
 def get_input_data() -> List[str]:
     """Get the input data for the puzzle."""
-    return [x.strip() for x in read_input(day=24, year=2024)]
+    return read_input(day=24, year=2024)
 
 
-def parse_data(data: List[str]) -> Tuple[WireMap, List[Connection]]:
+def parse(data: List[str]) -> Tuple[WireMap, List[Connection]]:
     """Parse the input data into wire values and connections.
 
     Args:
@@ -53,17 +55,16 @@ def parse_data(data: List[str]) -> Tuple[WireMap, List[Connection]]:
     Returns:
         Tuple of (wire values, wire connections)
     """
-    split_pos = data.index("")
-    raw_wires, raw_connections = data[:split_pos], data[split_pos + 1 :]
+    raw_wires, raw_connections = (x.splitlines() for x in split_blocks(data))
 
     wires: WireMap = {}
     for wire in raw_wires:
-        name, value = wire.split(": ")
+        name, value = wire.strip().split(": ")
         wires[name] = int(value)
 
     connections: List[Connection] = []
     for connection in raw_connections:
-        code, res = connection.split(" -> ")
+        code, res = connection.strip().split(" -> ")
         w1, op, w2 = code.split(" ")
         connections.append(Connection(w1, Operation(op), w2, res))
 
@@ -174,15 +175,18 @@ def add(wires: WireMap, connections: List[Connection]) -> str:
     return "".join(str(res[wire]) for wire in z_wires)
 
 
-def part1() -> int:
+@solver
+def part1(data: Tuple[WireMap, List[Connection]]) -> int:
     """Solve part 1 of the puzzle.
 
+    Args:
+        data: Parsed wire values and connections
+
     Returns:
         int: Solution to part 1
     """
-    data = get_input_data()
-    wires, connections = parse_data(data)
-    res = add(wires, connections)
+    wires, connections = data
+    res = add(dict(wires), connections)
     return int(res, 2)
 
 
@@ -210,14 +214,18 @@ def print_number(number: List[int]):
     print("".join([str(x) for x in number[::-1]]))
 
 
-def part2() -> str:
+@solver
+def part2(data: Tuple[WireMap, List[Connection]]) -> str:
     """Solve part 2 of the puzzle.
 
+    Args:
+        data: Parsed wire values and connections
+
     Returns:
         int: Solution to part 2 (currently returns 0)
     """
     # Initial puzzle setup
-    _, connections = parse_data(get_input_data())
+    _, connections = data
 
     # Initialize wires
     wires: WireMap = {}
@@ -5,9 +5,10 @@ from __future__ import annotations
 from enum import Enum
 from typing import LiteralString
 
+from aoc.parse import split_blocks
+from aoc.solution import solver
 from aoc.utils import read_input
 
-SCHEMA_HEIGHT = 8
 MAX_HEIGHT = 5
 
 
@@ -39,16 +40,16 @@ Schema(type={self.schema_type}, heights={self.heights})
         return output
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=25, year=2024)
 
 
-def parse_data(data: list[str]) -> list[Schema]:
+def parse(data: list[str]) -> tuple[Schema, ...]:
 
     schemas = []
 
-    for i in range(0, len(data), SCHEMA_HEIGHT):
-        raw_schema = [x.strip() for x in data[i : i + SCHEMA_HEIGHT]]
+    for block in split_blocks(data):
+        raw_schema = [x.strip() for x in block.splitlines()]
 
         key_lock_schema = raw_schema[1 : 1 + MAX_HEIGHT]
         h0 = [x[0] for x in key_lock_schema].count("#")
@@ -65,7 +66,7 @@ def parse_data(data: list[str]) -> list[Schema]:
 
         schemas.append(Schema(schema_type, heights, raw_schema))
 
-    return schemas
+    return tuple(schemas)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -112,10 +113,8 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    p_data = parse_data(data)
-
+@solver
+def part1(p_data: tuple[Schema, ...]) -> int:
     locks = [schema for schema in p_data if schema.schema_type == SchemaType.LOCK]
     keys = [schema for schema in p_data if schema.schema_type == SchemaType.KEY]
 
@@ -137,6 +136,6 @@ def part1() -> int:
     return overlaps
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
+@solver
+def part2(p_data: tuple[Schema, ...]) -> int:  # noqa
     return 0
@@ -4,15 +4,16 @@ from __future__ import annotations
 
 from typing import LiteralString
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=1, year=2025)
 
 
-def parse_data(data: list[str]):
-    parsed_data = [(line[0], int(line[1:])) for line in data if line.strip()]
+def parse(data: list[str]) -> tuple[tuple[str, int], ...]:
+    parsed_data = tuple((line[0], int(line[1:])) for line in data if line.strip())
     print(parsed_data)
     return parsed_data
 
@@ -32,10 +33,8 @@ L82
     return data.split("\n")
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    parsed_data = parse_data(data)
-
+@solver
+def part1(parsed_data: tuple[tuple[str, int], ...]) -> int:
     dial = 50
     cpt = 0
 
@@ -53,11 +52,8 @@ def part1() -> int:
     return cpt
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    # data = get_test_input_data()
-    parsed_data = parse_data(data)
-
+@solver
+def part2(parsed_data: tuple[tuple[str, int], ...]) -> int:
     dial = 50
     cpt = 0
 
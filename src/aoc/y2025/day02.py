@@ -1,43 +1,28 @@
 import logging
-from typing import LiteralString, Protocol
+from typing import LiteralString
 
+import numpy as np
+
+from aoc import trace
+from aoc.intervals import IntervalSet
+from aoc.solution import solver
 from aoc.utils import read_input
 
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+TRACE_REPEATED = trace.point(__name__, "repeated")
+TRACE_RANGE = trace.point(__name__, "range")
+TRACE_INVALID = trace.point(__name__, "invalid")
 
-class IDValidator(Protocol):
-    def __call__(self, id_str: str) -> bool: ...
-
-
-def id_repeated_twice(id_str: str) -> bool:
-    if len(id_str) % 2 != 0:
-        return False
-    half_length = len(id_str) // 2
-    if id_str[:half_length] != id_str[half_length:]:
-        return False
-    return True
-
-
-def id_repeated_at_least_twice(id_str: str) -> bool:
-    length = len(id_str)
-    for i in range(length, 1, -1):
-        if length % i != 0:
-            continue
-        part_length = length // i
-        part = id_str[:part_length]
-        if part * i == id_str:
-            logger.debug(f"ID {id_str} is repeated at least twice as {part} * {i}")
-            return True
-    return False
+# 10**18 < 2**63, the largest power of 10 in int64
+INT64_DIGITS = 18
 
 
 def get_input_data():
     return read_input(day=2, year=2025)
 
 
-def parse_data(data: list[str]):
+def parse(data: list[str]) -> tuple[tuple[int, int], ...]:
     parsed_ranges = []
     for data_line in data:
         for range_pair in data_line.split(","):
@@ -48,7 +33,7 @@ def parse_data(data: list[str]):
             start_int = int(start_str)
             end_int = int(end_str)
             parsed_ranges.append((start_int, end_int))
-    return parsed_ranges
+    return tuple(parsed_ranges)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -57,33 +42,60 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
+def repeated_ids(start: int, end: int, at_least_twice: bool) -> np.ndarray:
+    """List the IDs of start..end repeating a sequence of digits twice, or more.
+
+    An ID of length digits repeating a part of part_length digits is the
+    part times 10..010..01, e.g. 123123 = 123 * 1001. Only the parts giving
+    an ID of the range are generated.
+    """
+    ids = [np.empty(0, dtype=np.int64)]
+    for length in range(max(len(str(start)), 2), len(str(end)) + 1):
+        # The IDs of 19 digits or more overflow int64, they are Python ints
+        dtype = np.int64 if length <= INT64_DIGITS else object
+        low = max(start, 10 ** (length - 1))
+        high = min(end, 10**length - 1)
+        for part_length in range(1, length // 2 + 1):
+            times, rest = divmod(length, part_length)
+            if rest or (times != 2 and not at_least_twice):
+                continue
+            if TRACE_REPEATED.enabled:
+                TRACE_REPEATED.emit(length=length, part_length=part_length, times=times)
+            factor = (10**length - 1) // (10**part_length - 1)
+            parts = np.arange(-(-low // factor), high // factor + 1, dtype=dtype)
+            ids.append(parts * factor)
+    # 1111 repeats both 1 and 11
+    return np.unique(np.concatenate(ids))
+
+
 def detect_invalid_ids(
-    ranges: list[tuple[int, int]], funcs: list[IDValidator]
-) -> list[int]:
-    invalid_ids = []
-    for start, end in ranges:
-        logger.debug(f"Checking range: {start}-{end}")
-        for id_num in range(start, end + 1):
-            id_str = str(id_num)
-            for func in funcs:
-                if func(id_str):
-                    logger.debug(f"Invalid ID found: {id_str}")
-                    invalid_ids.append(id_num)
+    ranges: tuple[tuple[int, int], ...], at_least_twice: bool
+) -> np.ndarray:
+    id_ranges = IntervalSet(ranges)
+    if TRACE_RANGE.enabled:
+        for start, end in id_ranges:
+            TRACE_RANGE.emit(start=start, end=end)
+
+    invalid_ids = np.concatenate(
+        [np.empty(0, dtype=np.int64)]
+        + [repeated_ids(start, end, at_least_twice) for start, end in id_ranges]
+    )
+    if TRACE_INVALID.enabled:
+        for id_num in invalid_ids:
+            TRACE_INVALID.emit(id=int(id_num))
 
     return invalid_ids
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    parsed_data = parse_data(data)
-    funcs = [id_repeated_twice]
-    invalid_ids = detect_invalid_ids(parsed_data, funcs)
-    return sum(invalid_ids)
+@solver
+def part1(parsed_data: tuple[tuple[int, int], ...]) -> int:
+    invalid_ids = detect_invalid_ids(parsed_data, at_least_twice=False)
+    # The sum of large IDs can overflow int64
+    return int(invalid_ids.sum(dtype=object))
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    parsed_data = parse_data(data)
-    funcs = [id_repeated_at_least_twice]
-    invalid_ids = detect_invalid_ids(parsed_data, funcs)
-    return sum(invalid_ids)
+@solver
+def part2(parsed_data: tuple[tuple[int, int], ...]) -> int:
+    invalid_ids = detect_invalid_ids(parsed_data, at_least_twice=True)
+    # The sum of large IDs can overflow int64
+    return int(invalid_ids.sum(dtype=object))
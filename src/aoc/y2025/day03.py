@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from typing import LiteralString
 
+from aoc import trace
+from aoc.solution import solver
 from aoc.utils import read_input
 
 NB_BATTERIES_PART1 = 2
@@ -12,20 +14,25 @@ NB_BATTERIES_PART2 = 12
 
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(level=logging.DEBUG)
+
+TRACE_BANK = trace.point(__name__, "bank")
+TRACE_BATTERY = trace.point(__name__, "battery")
+TRACE_DIGIT = trace.point(__name__, "digit")
 
 
 def get_input_data():
     return read_input(day=3, year=2025)
 
 
-def parse_data(data: list[str]) -> list[list[int]]:
+def parse(data: list[str]) -> tuple[list[int], ...]:
     parsed_data = []
     for line in data:
+        if not line.strip():
+            continue
         parsed_line = [int(char) for char in line.strip()]
         parsed_data.append(parsed_line)
 
-    return parsed_data
+    return tuple(parsed_data)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -37,7 +44,7 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
-def find_joltages(banks: list[list[int]], nb_batteries: int) -> list[int]:
+def find_joltages(banks: tuple[list[int], ...], nb_batteries: int) -> list[int]:
     joltages = []
     for bank in banks:
         joltages.append(find_joltage(bank, nb_batteries))
@@ -47,18 +54,20 @@ def find_joltages(banks: list[list[int]], nb_batteries: int) -> list[int]:
 def find_joltage(bank: list[int], nb_batteries: int) -> int:
     bats = [0] * nb_batteries
     bats_indexes = [x for x in range(nb_batteries)]
-    logger.debug(f"Finding joltage for bank: {bank}")
 
     for i in range(nb_batteries):
         # Look for the biggest jolt for first digit
-        logger.debug(f"--- Bat {i}/{nb_batteries} ---")
-        logger.debug(f"Bats         : {bats}")
-        logger.debug(f"Bats indexes : {bats_indexes}")
-        logger.debug(
-            f"Range is from {bats_indexes[i]} to {len(bank) - nb_batteries + i}"
-        )
+        if TRACE_BATTERY.enabled:
+            TRACE_BATTERY.emit(
+                bat=i,
+                bats=list(bats),
+                indexes=list(bats_indexes),
+                start=bats_indexes[i],
+                end=len(bank) - nb_batteries + i,
+            )
         for j in range(bats_indexes[i], len(bank) - nb_batteries + i + 1):
-            logger.debug(f"Considering bank[{j}] = {bank[j]}")
+            if TRACE_DIGIT.enabled:
+                TRACE_DIGIT.emit(bat=i, index=j, digit=bank[j], best=bats[i])
             if bank[j] > bats[i]:
                 bats[i] = bank[j]
                 bats_indexes[i] = j + 1
@@ -68,25 +77,23 @@ def find_joltage(bank: list[int], nb_batteries: int) -> int:
                         bats_indexes[i], bats_indexes[i] + nb_batteries - i - 1
                     )
                 ]
-                logger.debug(f"  New bat value: {bats[i]}")
 
-    logger.debug(f"Final bats: {bats}")
     joltage = int("".join(str(bat) for bat in bats))
+    if TRACE_BANK.enabled:
+        TRACE_BANK.emit(bank=bank, bats=bats, joltage=joltage)
     return joltage
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    parsed_data = parse_data(data)
+@solver
+def part1(parsed_data: tuple[list[int], ...]) -> int:
     print(parsed_data)
     joltages = find_joltages(parsed_data, NB_BATTERIES_PART1)
     print(joltages)
     return sum(joltages)
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    parsed_data = parse_data(data)
+@solver
+def part2(parsed_data: tuple[list[int], ...]) -> int:
     print(parsed_data)
     joltages = find_joltages(parsed_data, NB_BATTERIES_PART2)
     print(joltages)
@@ -5,28 +5,22 @@ from __future__ import annotations
 import logging
 from typing import LiteralString
 
+from aoc import trace
+from aoc.grid import Grid
+from aoc.solution import solver
 from aoc.utils import read_input
 
 logger = logging.getLogger(__name__)
 
+TRACE_POSITION = trace.point(__name__, "position")
+
 
 def get_input_data():
     return read_input(day=4, year=2025)
 
 
-def parse_data(data: list[str]):
-    parsed = []
-    for line in data:
-        if not line.strip():
-            continue
-        logger.debug(f"Parsing line: {line}")
-        parsed_line = [x for x in line.strip()]
-        parsed_line.append(".")  # Padding to avoid index errors
-        parsed_line.insert(0, ".")  # Padding to avoid index errors
-        parsed.append(parsed_line)
-    parsed.insert(0, ["."] * len(parsed[0]))  # Top padding
-    parsed.append(["."] * len(parsed[0]))  # Bottom padding
-    return parsed
+def parse(data: list[str]) -> Grid:
+    return Grid.from_lines(data)
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -44,65 +38,49 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
-def find_movable_rolls(data: list[list[str]]) -> list[complex]:
+def find_movable_rolls(grid: Grid) -> list[int]:
+    view, n8 = grid.view, grid.n8
+    roll = ord("@")
+
     movable_rolls = []
-    for lin in range(1, len(data) - 1):
-        for col in range(1, len(data[0]) - 1):
-            pos = complex(col, lin)
-            logger.debug(f"Checking position: {pos}")
-            if data[lin][col] != "@":
-                continue
-            # Check adjacent positions
-            # Up, Down, Left, Right, and Diagonals
-            adjacent_positions = [
-                pos + 1j,  # Up
-                pos - 1j,  # Down
-                pos - 1,  # Left
-                pos + 1,  # Right
-                pos + 1 + 1j,  # Up-Right
-                pos + 1 - 1j,  # Down-Right
-                pos - 1 + 1j,  # Up-Left
-                pos - 1 - 1j,  # Down-Left
-            ]
-            adj_roll_count = 0
-            for adj in adjacent_positions:
-                if data[int(adj.imag)][int(adj.real)] == "@":
-                    adj_roll_count += 1
-
-            if adj_roll_count < 4:
-                movable_rolls.append(pos)
+    for index in grid.find("@").tolist():
+        if TRACE_POSITION.enabled:
+            TRACE_POSITION.emit(pos=grid.coords(index))
+        # The border is never a roll, no bounds check needed
+        adj_roll_count = 0
+        for offset in n8:
+            if view[index + offset] == roll:
+                adj_roll_count += 1
+
+        if adj_roll_count < 4:
+            movable_rolls.append(index)
 
     return movable_rolls
 
 
-def print_floor(data: list[list[str]], movable_rolls: list[complex] = []) -> None:
-    for lin in range(len(data)):
-        line_str = ""
-        for col in range(len(data[0])):
-            if complex(col, lin) in movable_rolls:
-                line_str += "X"
-            else:
-                line_str += data[lin][col]
-        print(line_str)
+def print_floor(grid: Grid, movable_rolls: list[int] = []) -> None:
+    grid = grid.copy()
+    for index in movable_rolls:
+        grid[index] = ord("X")
+    print(grid)
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)
-    rolls = find_movable_rolls(data)
+@solver
+def part1(grid: Grid) -> int:
+    rolls = find_movable_rolls(grid)
     return len(rolls)
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)
+@solver
+def part2(grid: Grid) -> int:
+    grid = grid.copy()
 
     nb_movable_rolls = 0
     while True:
-        rolls = find_movable_rolls(data)
+        rolls = find_movable_rolls(grid)
         if not rolls:
             break
         nb_movable_rolls += len(rolls)
         for roll in rolls:
-            data[int(roll.imag)][int(roll.real)] = "."
+            grid[roll] = ord(".")
     return nb_movable_rolls
@@ -4,13 +4,19 @@ from __future__ import annotations
 
 from typing import LiteralString
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 
-def get_input_data():
+def get_input_data() -> list[str]:
     return read_input(day=6, year=2025)
 
 
+def parse(data: list[str]) -> tuple[list[Operation], list[Operation]]:
+    """Parse the input both ways, by rows for part 1 and by columns for part 2"""
+    return parse_data(data), parse_data_cephal(data)
+
+
 class Operation:
     def __init__(self, symbol: str, values: list[int]):
         self.symbol = symbol
@@ -97,9 +103,9 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part1(operations: tuple[list[Operation], list[Operation]]) -> int:
+    data, _ = operations
     result = 0
     for operation in data:
         op_result = operation.apply()
@@ -109,9 +115,9 @@ def part1() -> int:
     return result
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data_cephal(data)  # noqa
+@solver
+def part2(operations: tuple[list[Operation], list[Operation]]) -> int:
+    _, data = operations
     print(data)
     result = 0
     for operation in data:
@@ -5,6 +5,7 @@ from __future__ import annotations
 import logging
 from typing import LiteralString, Tuple
 
+from aoc.solution import solver
 from aoc.utils import read_input
 
 logger = logging.getLogger(__name__)
@@ -14,7 +15,7 @@ def get_input_data():
     return read_input(day=7, year=2025)
 
 
-def parse_data(data: list[str]):
+def parse(data: list[str]) -> list[list[str]]:
     input = []
     for line in data:
         if not line.strip():
@@ -58,16 +59,16 @@ def count_splits(data: list[list[str]]) -> Tuple[int, int]:
     splitter_count = 0
     timeline = 1
 
-    logger.debug(f"Initial beam position at {start_pos}")
-    logger.debug(f"Processing row : {data[0]}")
+    logger.debug("Initial beam position at %s", start_pos)
+    logger.debug("Processing row : %s", data[0])
     for i, line in enumerate(data[1:]):
-        logger.debug(f"Processing row : {line}")
+        logger.debug("Processing row : %s", line)
         new_beans = set()
         for bean in beams_positions:
             if line[bean] == "^":
                 new_beans.add(bean - 1)
                 new_beans.add(bean + 1)
-                logger.debug(f"Beam at {bean} split to {bean - 1} and {bean + 1}")
+                logger.debug("Beam at %d split to %d and %d", bean, bean - 1, bean + 1)
                 splitter_count += 1
                 timeline += nb_beams[bean]
                 nb_beams[bean - 1] += nb_beams[bean]
@@ -81,16 +82,14 @@ def count_splits(data: list[list[str]]) -> Tuple[int, int]:
     return splitter_count, timeline
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part1(data: list[list[str]]) -> int:
     print(data)
     nb_splitters, _ = count_splits(data)
     return nb_splitters
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part2(data: list[list[str]]) -> int:
     _, timelines = count_splits(data)
     return timelines
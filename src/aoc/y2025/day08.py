@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-import collections
 import logging
+import math
 from dataclasses import dataclass
 from typing import LiteralString
 
+from aoc import trace
+from aoc.dsu import DisjointSet
+from aoc.parse import int_rows
+from aoc.solution import solver
 from aoc.utils import read_input
 
 logger = logging.getLogger(__name__)
 
+TRACE_CIRCUITS = trace.point(__name__, "circuits")
+
 
 @dataclass
 class Point3D:
@@ -29,12 +35,7 @@ def get_input_data():
 
 
 def parse_data(data: list[str]) -> list[Point3D]:
-    parsed_data = []
-    for line in data:
-        if line.strip():
-            x, y, z = map(int, line.split(","))
-            parsed_data.append(Point3D(x, y, z))
-    return parsed_data
+    return [Point3D(x, y, z) for x, y, z in int_rows(data, 3).tolist()]
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -62,6 +63,12 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
+def parse(data: list[str]) -> tuple[list[Point3D], list[tuple[float, tuple[int, int]]]]:
+    """Parse the points and sort the distances of all pairs, both parts share them"""
+    points = parse_data(data)
+    return points, compute_distances(points)
+
+
 def compute_distances(points: list[Point3D]) -> list[tuple[float, tuple[int, int]]]:
     """Compute distances between all pairs of points.
     Store them in a 2d array
@@ -81,70 +88,42 @@ def compute_distances(points: list[Point3D]) -> list[tuple[float, tuple[int, int
 def connecting_circuits(
     distances: list[tuple[float, tuple[int, int]]],
     nb_boxes: int,
-) -> tuple[collections.Counter, int, int]:
-    """Connect circuits based on distances.
+) -> tuple[DisjointSet, int, int]:
+    """Connect circuits based on distances, like Kruskal.
     Args:
         distances (list[tuple[float, tuple[int, int]]]): Sorted list of distances and point indices.
     """
 
-    circuits = {}
-    nb_circuits = 0
-    circuits_by_length = collections.Counter()
+    circuits = DisjointSet(nb_boxes)
     i, j = -1, -1
 
     for _, (i, j) in distances:
-        if i not in circuits and j not in circuits:
-            # New Circuit
-            circuits[i] = nb_circuits
-            circuits[j] = nb_circuits
-            nb_circuits += 1
-        elif i in circuits and j not in circuits:
-            # i Already in a circuit
-            circuits[j] = circuits[i]
-        elif i not in circuits and j in circuits:
-            # j Already in a circuit
-            circuits[i] = circuits[j]
-        else:
-            # I and j already in circuits
-            if circuits[i] != circuits[j]:
-                # We need to merge the two circuits :
-                circuit_to_change = circuits[j]
-                for key in circuits:
-                    if circuits[key] == circuit_to_change:
-                        circuits[key] = circuits[i]
-
-        circuits_by_length = collections.Counter(circuits.values())
-        logger.debug(f"Circuits by length: {circuits_by_length}")
-        if (
-            len(circuits_by_length) == 1
-            and list(circuits_by_length.values())[0] == nb_boxes
-        ):
+        circuits.union(i, j)
+
+        if TRACE_CIRCUITS.enabled:
+            TRACE_CIRCUITS.emit(
+                i=i, j=j, components=circuits.components, largest=circuits.largest_k(3)
+            )
+        if circuits.components == 1:
             logger.info("All boxes are connected.")
             break
-    return circuits_by_length, i, j
+    return circuits, i, j
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)
-    distances = compute_distances(data)
+@solver
+def part1(parsed: tuple[list[Point3D], list[tuple[float, tuple[int, int]]]]) -> int:
+    data, distances = parsed
     nb_boxes = len(data)
-    circuits_by_length, _, _ = connecting_circuits(distances[: 1000 + 1], nb_boxes)
-    lengths = list(circuits_by_length.values())
-    circuit_lengths = sorted(lengths, reverse=True)
-    result = 1
-    for length in circuit_lengths[:3]:
-        result *= length
-    return result
-
-
-def part2() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)
-    distances = compute_distances(data)
+    circuits, _, _ = connecting_circuits(distances[: 1000 + 1], nb_boxes)
+    return math.prod(circuits.largest_k(3))
+
+
+@solver
+def part2(parsed: tuple[list[Point3D], list[tuple[float, tuple[int, int]]]]) -> int:
+    data, distances = parsed
     nb_boxes = len(data)
     _, i, j = connecting_circuits(distances, nb_boxes)
     point_i = data[i]
     point_j = data[j]
-    logger.info(f"Last connected points: {point_i} and {point_j}")
+    logger.info("Last connected points: %s and %s", point_i, point_j)
     return point_i.x * point_j.x
@@ -10,12 +10,15 @@ import threading
 import time
 from collections import defaultdict
 from enum import Enum, auto
-from typing import Iterator, LiteralString
-
-import pygame
+from typing import TYPE_CHECKING, Iterator, LiteralString
 
+from aoc.parse import int_rows
+from aoc.solution import solver
 from aoc.utils import read_input
 
+if TYPE_CHECKING:
+    import pygame
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,17 +42,9 @@ def get_input_data():
     return read_input(day=9, year=2025)
 
 
-def parse_data(data: list[str]) -> list[complex]:
+def parse(data: list[str]) -> list[complex]:
     """Return a list of complex numbers representing the points"""
-    input = []
-    for line in data:
-        if line.strip() == "":
-            continue
-
-        x, y = line.split(",")
-        input.append(complex(int(x), int(y)))
-
-    return input
+    return [complex(x, y) for x, y in int_rows(data, 2).tolist()]
 
 
 def get_test_input_data() -> list[LiteralString]:
@@ -77,13 +72,15 @@ def compute_surfaces(data: list[complex]) -> tuple[complex, complex, int]:
             width = abs(p2.real - p1.real) + 1
             height = abs(p2.imag - p1.imag) + 1
             area = width * height
-            logger.debug(f"Area between {p1} and {p2}: {area}")
+            logger.debug("Area between %s and %s: %s", p1, p2, area)
             if area > max_surface:
                 max_surface = area
                 max_p1 = p1
                 max_p2 = p2
 
-    logger.debug(f"Max surface: {max_surface} between points {max_p1} and {max_p2}")
+    logger.debug(
+        "Max surface: %s between points %s and %s", max_surface, max_p1, max_p2
+    )
 
     return max_p1, max_p2, int(max_surface)
 
@@ -91,9 +88,8 @@ def compute_surfaces(data: list[complex]) -> tuple[complex, complex, int]:
 Vector = tuple[complex, complex]
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part1(data: list[complex]) -> int:
     _, _, max_surface = compute_surfaces(data)
     return max_surface
 
@@ -101,6 +97,8 @@ def part1() -> int:
 def pygame_init(
     title: str, width: int, height: int
 ) -> tuple[float, float, float, float, pygame.Surface]:
+    import pygame
+
     logger.info("Starting Pygame visualization...")
     pygame.init()
     pygame.key.set_repeat(300, 40)
@@ -137,6 +135,8 @@ def pygame_loop(
     title: str = "Pygame Visualization",
     fps: int = 60,
 ):
+    import pygame
+
     clock = pygame.time.Clock()
     logger.info("Initializing Pygame...")
     COEFF_W, COEFF_H, INSET_W, INSET_H, screen = pygame_init(title, width, height)
@@ -162,7 +162,7 @@ def pygame_loop(
                     logger.debug("SPACE key pressed, toggling step mode")
                     event_queue.put(pygame.event.Event(pygame.USEREVENT + 1))
                 else:
-                    logger.debug(f"Key {event.key} pressed, forwarding event")
+                    logger.debug("Key %s pressed, forwarding event", event.key)
                     event_queue.put(pygame.event.Event(pygame.USEREVENT + 2))
             else:  # Forward other events to the event queue
                 event_queue.put(event)
@@ -344,7 +344,7 @@ def point_on_segment(p: complex, a: complex, b: complex, epsilon=1e-9) -> bool:
 
 def raycast_right_axis(point: complex, path: list[complex]) -> list[int]:
     """Return list of itersections when raycasting right from point"""
-    logger.debug(f"Raycasting right from point {point}")
+    logger.debug("Raycasting right from point %s", point)
     px, py = point.real, point.imag
     n = len(path)
     intersections = set()
@@ -375,7 +375,7 @@ def raycast_right_axis(point: complex, path: list[complex]) -> list[int]:
 
 def raycast_up_axis(point: complex, path: list[complex]) -> list[int]:
     """Count how many times a raycast upward intersects the polygon edges"""
-    logger.debug(f"Raycasting up from point {point}")
+    logger.debug("Raycasting up from point %s", point)
     px, py = point.real, point.imag
     n = len(path)
     intersections = set()
@@ -556,7 +556,7 @@ def vector_is_inside_boundaries(
     vector: Vector,
 ) -> bool:
     """Check if a vector is fully inside the boundaries"""
-    (p1, p2) = vector
+    p1, p2 = vector
     x1, y1 = p1.real, p1.imag
     x2, y2 = p2.real, p2.imag
 
@@ -619,6 +619,9 @@ def game_loop(
         try:
             while True:
                 event = event_queue.get_nowait()
+                # Events only come from the visualization, pygame is loaded
+                import pygame
+
                 if event.type == pygame.QUIT:
                     running = False
                     logger.debug("QUIT event received in game loop")
@@ -667,19 +670,21 @@ def game_loop(
 
             try:
                 point = next(points_boundaries)
-                logger.debug(f"Processing point {point}")
+                logger.debug("Processing point %s", point)
             except StopIteration:
                 logger.info("No more points to process, ending game loop")
                 phase = Phase.RUN
                 continue
 
-            logger.debug(f"Finding longest horizontal segment for point {point}")
+            logger.debug("Finding longest horizontal segment for point %s", point)
             if point.real in H_BOUNDARIES.keys():
                 logger.debug(
                     f"Using cached horizontal boundaries for y={int(point.imag)}"
                 )
             else:
-                logger.debug(f"Computing horizontal boundaries for y={int(point.imag)}")
+                logger.debug(
+                    "Computing horizontal boundaries for y=%s", int(point.imag)
+                )
                 H_BOUNDARIES[int(point.imag)] = get_horizontal_boudaries(
                     data, int(point.imag)
                 )
@@ -701,7 +706,7 @@ def game_loop(
                     f"Using cached vertical boundaries for x={int(point.real)}"
                 )
             else:
-                logger.debug(f"Computing vertical boundaries for x={int(point.real)}")
+                logger.debug("Computing vertical boundaries for x=%s", int(point.real))
                 V_BOUNDARIES[int(point.real)] = get_vertical_boudaries(
                     data, int(point.real)
                 )
@@ -801,15 +806,14 @@ def game_loop(
         time.sleep(0.01)  # Simulate some processing delay
         step = False
 
-    logger.info(f"Max rectangle area found: {max_area}")
-    logger.info(f"Max rectangle corners: {max_rectangle}")
+    logger.info("Max rectangle area found: %s", max_area)
+    logger.info("Max rectangle corners: %s", max_rectangle)
     cmd_queue.put(("QUIT", None))
     return int(max_area)
 
 
-def part2():
-    data = get_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part2(data: list[complex]) -> int:
     result = 0
 
     cmd_queue: queue.Queue = queue.Queue()
@@ -817,6 +821,8 @@ def part2():
 
     # Is visualization enabled?
     if "-v" in sys.argv:
+        import pygame
+
         logger.info("Visualization enabled")
 
         width, height = get_boundaries(data)
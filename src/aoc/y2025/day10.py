@@ -7,6 +7,8 @@ import re
 from collections import deque
 from typing import Deque, LiteralString
 
+from aoc.linalg import min_integer_solution
+from aoc.solution import solver
 from aoc.utils import read_input
 
 logger = logging.getLogger(__name__)
@@ -24,7 +26,7 @@ re_pattern = re.compile(
 class Machine:
     diagram: list[str]
     buttons: list[tuple]
-    joltages: set[int]
+    joltages: tuple[int, ...]
 
     def __init__(self, line: str):
         self.parse_input(line)
@@ -44,7 +46,8 @@ class Machine:
             tuple(int(num) for num in btn.strip("()").split(","))
             for btn in buttons_str.strip().split()
         ]
-        self.joltages = set(
+        # One target per counter, in order
+        self.joltages = tuple(
             int(jolt.strip()) for jolt in joltages_str.strip("{}").split(",")
         )
 
@@ -83,6 +86,21 @@ class Machine:
 
         return new_state
 
+    def fewest_presses(self) -> int:
+        """Fewest presses to bring every counter to its joltage, 0 if impossible.
+
+        Pressing button j x[j] times is the linear system a @ x = joltages,
+        a[i][j] being 1 when button j increases counter i.
+        """
+        a = [
+            [int(counter in button) for button in self.buttons]
+            for counter in range(len(self.joltages))
+        ]
+        # A button cannot be pressed more than the lowest counter it increases
+        upper = [min(self.joltages[i] for i in button) for button in self.buttons]
+        presses = min_integer_solution(a, self.joltages, upper)
+        return 0 if presses is None else sum(presses)
+
     def activated(self, state: list[str]) -> bool:
         return self.diagram == state
 
@@ -94,7 +112,7 @@ def get_input_data():
     return read_input(day=10, year=2025)
 
 
-def parse_data(data: list[str]) -> list[Machine]:
+def parse(data: list[str]) -> list[Machine]:
     machines = []
     for line in data:
         if not line.strip():
@@ -111,19 +129,20 @@ def get_test_input_data() -> list[LiteralString]:
     return data.split("\n")
 
 
-def part1() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)  # noqa
+@solver
+def part1(data: list[Machine]) -> int:
     result = 0
     queue: Deque[tuple[list[str], list[int]]] = deque()
 
     for m in data:
-        logger.info(f"Processing machine: {m}")
+        logger.info("Processing machine: %s", m)
         queue.append((m.initial_state(), []))
 
         while queue:
             state, buttons_pressed = queue.popleft()
-            logger.debug(f"Current state: {state}, buttons pressed: {buttons_pressed}")
+            logger.debug(
+                "Current state: %s, buttons pressed: %s", state, buttons_pressed
+            )
             wrong_indexes = m.index_to_flip(state)
             possible_buttons = m.list_buttons(wrong_indexes)
             for button in possible_buttons:
@@ -133,7 +152,9 @@ def part1() -> int:
                 if m.activated(new_state):
                     result += len(new_buttons_pressed)
                     logger.info(
-                        f"Machine activated with buttons: {new_buttons_pressed}, nb buttons: {len(new_buttons_pressed)}"
+                        "Machine activated with buttons: %s, nb buttons: %d",
+                        new_buttons_pressed,
+                        len(new_buttons_pressed),
                     )
                     queue.clear()
                     break
@@ -143,7 +164,6 @@ def part1() -> int:
     return result
 
 
-def part2() -> int:
-    data = get_input_data()  # noqa
-    data = parse_data(data)  # noqa
-    return 0
+@solver
+def part2(data: list[Machine]) -> int:
+    return sum(m.fewest_presses() for m in data)
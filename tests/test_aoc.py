@@ -0,0 +1,124 @@
+# Advent of Code - Fetcher - Test
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ClassVar
+
+import pytest
+
+from aoc.aoc import (
+    ALREADY_FETCHED,
+    FETCHED,
+    NOT_MODIFIED,
+    Aoc,
+    FetchError,
+    released_days,
+)
+
+ETAG = '"v1"'
+
+
+class AocHandler(BaseHTTPRequestHandler):
+    """Stand-in of adventofcode.com serving /<year>/day/<day>/input."""
+
+    protocol_version = "HTTP/1.1"
+    requests: ClassVar[list[str]] = []
+    failures: ClassVar[dict[str, int]] = {}
+
+    def do_GET(self) -> None:  # noqa
+        self.requests.append(self.path)
+        _, year, _, day, _ = self.path.split("/")
+
+        if self.failures.get(self.path, 0) > 0:
+            self.failures[self.path] -= 1
+            self.reply(503, b"")
+        elif "session=token" not in self.headers.get("Cookie", ""):
+            self.reply(400, b"")
+        elif int(day) > 25:  # noqa
+            self.reply(404, b"")
+        elif self.headers.get("If-None-Match") == ETAG:
+            self.reply(304, b"")
+        else:
+            self.reply(200, f"input {year} {day}\n".encode())
+
+    def reply(self, status: int, body: bytes) -> None:
+        self.send_response(status)
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[str]:
+    AocHandler.requests = []
+    AocHandler.failures = {}
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), AocHandler)
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def aoc(server: str) -> Iterator[Aoc]:
+    aoc = Aoc("token", url=server, backoff=0, interval=0)
+    yield aoc
+    aoc.close()
+
+
+def test_fetch_input(aoc: Aoc, tmp_path: Path) -> None:
+    input_file = tmp_path / "day01_input.txt"
+    assert aoc.fetch_input(2024, 1, input_file) == FETCHED
+    assert input_file.read_text() == "input 2024 1\n"
+    assert aoc.fetch_input(2024, 1, input_file) == ALREADY_FETCHED
+    assert aoc.fetch_input(2024, 1, input_file, refresh=True) == NOT_MODIFIED
+    assert len(AocHandler.requests) == 2  # noqa
+    assert sorted(x.name for x in tmp_path.iterdir()) == [
+        ".day01_input.txt.json",
+        "day01_input.txt",
+    ]
+
+
+def test_fetch_input_retry(aoc: Aoc, tmp_path: Path) -> None:
+    AocHandler.failures["/2024/day/2/input"] = 2
+    assert aoc.fetch_input(2024, 2, tmp_path / "day02_input.txt") == FETCHED
+    assert len(AocHandler.requests) == 3  # noqa
+
+
+def test_session_shared(aoc: Aoc) -> None:
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        sessions = list(executor.map(lambda _: aoc.session, range(8)))
+    assert all(session is sessions[0] for session in sessions)
+
+
+def test_fetch_input_error(aoc: Aoc, tmp_path: Path) -> None:
+    input_file = tmp_path / "day26_input.txt"
+    with pytest.raises(FetchError):
+        aoc.fetch_input(2024, 26, input_file)
+    assert not input_file.exists()
+
+
+def test_fetch_inputs(aoc: Aoc, tmp_path: Path) -> None:
+    inputs = [(2024, day, tmp_path / f"day{day:02}_input.txt") for day in range(20, 28)]
+    results = aoc.fetch_inputs(inputs, max_workers=4)
+    assert list(results) == [(2024, day) for day in range(20, 28)]
+    assert results[(2024, 25)] == FETCHED
+    assert results[(2024, 26)].startswith("error")
+    assert (tmp_path / "day25_input.txt").read_text() == "input 2024 25\n"
+
+
+def test_released_days() -> None:
+    assert released_days(2024) == list(range(1, 26))
+    assert released_days(2025, datetime(2025, 12, 3, 4, tzinfo=UTC)) == [1, 2]
+    assert released_days(2025, datetime(2025, 12, 3, 5, tzinfo=UTC)) == [1, 2, 3]
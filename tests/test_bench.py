@@ -0,0 +1,19 @@
+# Advent of Code - Bench - Test
+
+from __future__ import annotations
+
+from aoc.bench import Stats, measure
+
+
+def test_stats() -> None:
+    stats = Stats(list(range(1, 101)))
+    assert stats.min == 1
+    assert stats.median == 50.5
+    assert stats.p95 == 95
+
+
+def test_measure() -> None:
+    calls = []
+    stats = measure(lambda: calls.append(1), repeat=3, warmup=2)
+    assert len(calls) == 5
+    assert len(stats.samples) == 3
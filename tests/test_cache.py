@@ -0,0 +1,131 @@
+# Advent of Code - Cache - Test
+
+from __future__ import annotations
+
+import sys
+from importlib.util import module_from_spec, spec_from_file_location
+from pathlib import Path
+from types import ModuleType
+
+import numpy as np
+import pytest
+
+from aoc import cache
+
+
+@pytest.fixture(autouse=True)
+def data_directory(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(cache, "get_data_directory", lambda: tmp_path)
+    return tmp_path
+
+
+def test_find_aoc_imports(tmp_path: Path) -> None:
+    source = tmp_path / "day01.py"
+    source.write_text("import os\nfrom aoc.utils import read_input\nimport aoc.grid\n")
+    assert cache.find_aoc_imports(source) == {
+        "aoc.utils",
+        "aoc.utils.read_input",
+        "aoc.grid",
+    }
+
+
+def test_key_changes_with_input(tmp_path: Path) -> None:
+    input_file = tmp_path / "input.txt"
+    input_file.write_text("1\n")
+    key = cache.get_key(1, 2024, 1, input_file)
+    assert key == cache.get_key(1, 2024, 1, input_file)
+    assert key != cache.get_key(1, 2024, 2, input_file)
+
+    input_file.write_text("2\n")
+    assert key != cache.get_key(1, 2024, 1, input_file)
+
+
+def test_answers() -> None:
+    assert cache.get_answer("key") == (False, None)
+
+    cache.set_answer("key", 1, 2024, 1, 42)
+    cache.set_answer("other", 1, 2023, 1, "a,b")
+    assert cache.get_answer("key") == (True, 42)
+
+    stats = cache.get_stats()
+    assert stats.entries == 2
+    assert stats.hits == 1
+    assert stats.per_year == {2023: 1, 2024: 1}
+
+    assert cache.clear_answers(2023) == 1
+    assert cache.clear_answers() == 1
+    assert cache.get_stats().entries == 0
+
+
+def load_module(path: Path, source: str) -> ModuleType:
+    path.write_text(source)
+    spec = spec_from_file_location(path.stem, path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_hash_parser(tmp_path: Path) -> None:
+    parser = "def to_int(x):\n    return int(x)\n\ndef parse(data):\n"
+    parser += "    return [to_int(x) for x in data]\n"
+    module = load_module(
+        tmp_path / "day01.py", parser + "def part1(p):\n    return 1\n"
+    )
+    key = cache.hash_parser(module)
+
+    # Editing a part keeps the parser hash
+    module = load_module(
+        tmp_path / "day02.py", parser + "def part1(p):\n    return 2\n"
+    )
+    assert cache.hash_parser(module) == key
+
+    # Editing a helper of the parser changes it
+    module = load_module(tmp_path / "day03.py", parser.replace("int(x)", "float(x)"))
+    assert cache.hash_parser(module) != key
+
+
+def test_hash_parser_classes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = "class Box:\n    def __init__(self, x):\n        self.x = int(x)\n\n"
+    parser += "def parse(data):\n    return [Box(x) for x in data]\n"
+
+    keys = []
+    for source in (parser, parser.replace("int(x)", "float(x)")):
+        module = load_module(tmp_path / "day01.py", source)
+        # The source of a class is found through its module
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        keys.append(cache.hash_parser(module))
+
+    # Editing a class built by the parser changes it
+    assert keys[0] != keys[1]
+
+
+def test_hash_parser_imports(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    parser = "from aoc.parse import ints\n\ndef parse(data):\n    return ints(data)\n"
+    module = load_module(tmp_path / "day01.py", parser)
+
+    hashed = []
+    monkeypatch.setattr(cache, "hash_sources", lambda name: hashed.append(name) or "v1")
+    key = cache.hash_parser(module)
+    assert hashed == ["aoc.parse"]
+
+    # Editing an aoc module used by the parser changes it
+    monkeypatch.setattr(cache, "hash_sources", lambda name: "v2")
+    assert cache.hash_parser(module) != key
+
+
+@pytest.mark.parametrize(
+    "parsed", [np.arange(6).reshape(2, 3), (np.zeros(2), {"a": 1}), [1, 2]]
+)
+def test_snapshots(parsed: object) -> None:
+    assert cache.load_parsed("y2024-day01-key") == (False, None)
+
+    cache.save_parsed("y2024-day01-key", parsed)
+    found, loaded = cache.load_parsed("y2024-day01-key")
+    assert found
+    assert repr(loaded) == repr(parsed)
+
+    # A new key replaces the snapshot of the day
+    cache.save_parsed("y2024-day01-other", parsed)
+    assert len(cache.find_snapshots(2024)) == 1
+    assert cache.clear_snapshots(2023) == 0
+    assert cache.clear_snapshots() == 1
@@ -0,0 +1,34 @@
+# Advent of Code - CLI - Test
+
+from __future__ import annotations
+
+import pstats
+
+import pytest
+from click.testing import CliRunner
+
+from aoc import profiling
+from aoc.cli import PROFILE_SORT_KEYS, aoc
+
+
+def test_profile_sort_keys() -> None:
+    assert set(PROFILE_SORT_KEYS) == set(pstats.Stats.sort_arg_dict_default)
+
+
+@pytest.mark.parametrize("sort", ["cumtime", "cumulative", "tottime", "time"])
+def test_run_profile_sort(monkeypatch: pytest.MonkeyPatch, sort: str) -> None:
+    calls = []
+    monkeypatch.setattr(
+        profiling, "profile_day", lambda *args, **kwargs: calls.append(kwargs)
+    )
+    command = ["-d", "1", "-y", "2024", "run", "--profile", "--sort", sort]
+    result = CliRunner().invoke(aoc, command)
+    assert result.exit_code == 0, result.output
+    assert calls[0]["sort"] == sort
+
+
+def test_run_profile_sort_invalid() -> None:
+    command = ["-d", "1", "-y", "2024", "run", "--profile", "--sort", "bogus"]
+    result = CliRunner().invoke(aoc, command)
+    assert result.exit_code == 2
+    assert "Invalid value for '--sort'" in result.output
@@ -0,0 +1,77 @@
+# Advent of Code - Cycle - Test
+
+from __future__ import annotations
+
+import pytest
+
+from aoc.cycle import (
+    Cycle,
+    Period,
+    brent,
+    crt,
+    first_common,
+    floyd,
+    has_cycle,
+    signal_periods,
+    simulate_until,
+)
+
+
+def rho(x: int) -> int:
+    # 0 -> 1 -> 2 -> 3 -> 4 -> 5 -> 6 -> 3 -> ...
+    return x + 1 if x < 6 else 3
+
+
+@pytest.mark.parametrize("find", [brent, floyd])
+def test_find_cycle(find) -> None:
+    assert find(0, rho) == Cycle(3, 4)
+    assert find(5, rho) == Cycle(0, 4)
+    assert find(0, lambda x: x) == Cycle(0, 1)
+    assert find(0, lambda x: x + 1 if x < 10 else None) is None
+
+
+def test_key() -> None:
+    # Only the first item of the state drives the sequence
+    assert brent((0, "a"), lambda s: (rho(s[0]), s[1] + "a"), key=lambda s: s[0]) == (
+        Cycle(3, 4)
+    )
+
+
+def test_has_cycle() -> None:
+    assert has_cycle(0, rho)
+    assert not has_cycle(0, lambda x: x + 1 if x < 10 else None)
+
+
+def test_simulate_until() -> None:
+    assert [simulate_until(0, rho, n) for n in range(9)] == [0, 1, 2, 3, 4, 5, 6, 3, 4]
+    assert simulate_until(0, rho, 10**12) == 3 + (10**12 - 3) % 4
+    assert simulate_until(0, lambda x: x + 1, 50) == 50
+
+
+def test_cycle_reduce() -> None:
+    assert Cycle(3, 4).reduce(2) == 2
+    assert Cycle(3, 4).reduce(7) == 3
+    assert Cycle(3, 4).reduce(10**12 + 1) == 5
+
+
+def test_crt() -> None:
+    assert crt([2, 3, 2], [3, 5, 7]) == (23, 105)
+    assert crt([1, 3], [4, 6]) == (9, 12)
+    assert crt([0, 1], [4, 6]) is None
+    assert crt([], []) == (0, 1)
+
+
+def test_first_common() -> None:
+    assert first_common([Period(3, 3), Period(5, 5)]) == 15
+    assert first_common([Period(2, 3), Period(3, 5)]) == 8
+    assert first_common([Period(1, 2), Period(2, 4)]) is None
+    assert first_common([]) is None
+
+
+def test_signal_periods() -> None:
+    def step(i: int) -> list[str]:
+        return [name for name, every in (("a", 3), ("b", 4)) if i % every == 0]
+
+    periods = signal_periods(step, ["a", "b", "c"], 20)
+    assert periods == {"a": Period(3, 3), "b": Period(4, 4)}
+    assert first_common(periods.values()) == 12
@@ -0,0 +1,41 @@
+# Advent of Code - DSU - Test
+
+from __future__ import annotations
+
+import pytest
+
+from aoc.dsu import DisjointSet
+
+
+def test_union() -> None:
+    dsu = DisjointSet(6)
+    assert dsu.union(0, 1)
+    assert dsu.union(1, 2)
+    assert not dsu.union(0, 2)
+    assert dsu.union(3, 4)
+
+    assert dsu.components == 3
+    assert dsu.connected(0, 2)
+    assert not dsu.connected(0, 3)
+    assert dsu.component_size(2) == 3
+    assert dsu.largest_k(2) == [3, 2]
+
+
+def test_rollback() -> None:
+    dsu = DisjointSet(4, rollback=True)
+    dsu.union(0, 1)
+    snapshot = dsu.snapshot()
+    dsu.union(1, 2)
+    dsu.union(2, 3)
+    assert dsu.components == 1
+
+    dsu.rollback(snapshot)
+    assert dsu.components == 3
+    assert dsu.connected(0, 1)
+    assert not dsu.connected(1, 2)
+    assert dsu.largest_k(3) == [2, 1, 1]
+
+
+def test_snapshot_without_rollback() -> None:
+    with pytest.raises(ValueError):
+        DisjointSet(2).snapshot()
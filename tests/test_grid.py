@@ -0,0 +1,57 @@
+# Advent of Code - Grid - Test
+
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+
+from aoc.grid import Grid
+
+LINES = ["#..\n", ".S#\n", "..#\n"]
+
+
+def test_from_lines() -> None:
+    grid = Grid.from_lines(LINES)
+    assert (grid.height, grid.width) == (3, 3)
+    assert str(grid) == "#..\n.S#\n..#"
+    assert len(grid.data) == 25  # noqa
+
+
+def test_indices() -> None:
+    grid = Grid.from_lines(LINES)
+    start = grid.find_one("S")
+    assert grid.coords(start) == (1, 1)
+    assert grid.index(1, 1) == start
+    assert grid.to_complex(start) == complex(1, 1)
+    assert grid.from_complex(complex(1, 1)) == start
+    assert chr(grid[start]) == "S"
+    assert [chr(grid[start + x]) for x in grid.n4] == [".", "#", ".", "."]
+    assert list(grid.indices()[:3]) == [6, 7, 8]
+
+
+def test_border() -> None:
+    grid = Grid.from_lines(LINES)
+    corner = grid.index(0, 0)
+    assert all(grid.is_border(corner + x) for x in (-1, -grid.stride))
+    assert not grid.is_border(corner)
+
+
+def test_masks() -> None:
+    grid = Grid.from_lines(LINES)
+    assert grid.count("#") == 3  # noqa
+    assert grid.count(b".S") == 6  # noqa
+    assert grid.mask("#")[1].tolist() == [False, False, True]
+    assert grid.count_neighbors("#")[1].tolist() == [1, 3, 1]
+    assert grid.count_neighbors("#", diagonals=False)[1].tolist() == [1, 1, 1]
+
+
+def test_copy() -> None:
+    grid = Grid.from_lines(LINES)
+    other = grid.copy()
+    other[other.find_one("S")] = ord(".")
+    assert grid.count("S") == 1
+    assert other.count("S") == 0
+
+    loaded = pickle.loads(pickle.dumps(grid))
+    assert np.array_equal(loaded.data, grid.data)
@@ -0,0 +1,47 @@
+# Advent of Code - Intervals - Test
+
+from __future__ import annotations
+
+import numpy as np
+
+from aoc.intervals import IntervalSet
+
+
+def test_normalize() -> None:
+    intervals = IntervalSet([(10, 14), (3, 5), (16, 20), (12, 18), (6, 6)])
+    assert list(intervals) == [(3, 6), (10, 20)]
+    assert intervals.total_length == 15
+
+
+def test_contains() -> None:
+    intervals = IntervalSet([(3, 5), (10, 20)])
+    assert [x in intervals for x in (2, 3, 5, 6, 10, 20, 21)] == [
+        False,
+        True,
+        True,
+        False,
+        True,
+        True,
+        False,
+    ]
+
+    values = np.array([1, 5, 8, 11, 17, 32])
+    assert intervals.contains_many(values).tolist() == [
+        False,
+        True,
+        False,
+        True,
+        True,
+        False,
+    ]
+    assert not IntervalSet().contains_many(values).any()
+
+
+def test_operations() -> None:
+    a = IntervalSet([(0, 10), (20, 30)])
+    b = IntervalSet([(5, 25), (28, 40)])
+    assert list(a | b) == [(0, 40)]
+    assert list(a & b) == [(5, 10), (20, 25), (28, 30)]
+    assert list(a - b) == [(0, 4), (26, 27)]
+    assert list(b - a) == [(11, 19), (31, 40)]
+    assert (a - b) | (a & b) == a
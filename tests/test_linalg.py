@@ -0,0 +1,149 @@
+# Advent of Code - Linalg - Test
+
+from __future__ import annotations
+
+import itertools
+import random
+from fractions import Fraction
+
+import numpy as np
+import sympy
+from sympy.matrices.normalforms import smith_normal_form as sympy_smith
+
+from aoc.linalg import (
+    hermite_normal_form,
+    min_integer_solution,
+    rref,
+    smith_normal_form,
+    solve,
+    solve_2x2,
+    solve_integer,
+)
+
+
+def matmul(a: list[list[int]], b: list[list[int]]) -> list[list[int]]:
+    return [[sum(x * y for x, y in zip(row, col)) for col in zip(*b)] for row in a]
+
+
+def random_matrices(count: int) -> list[list[list[int]]]:
+    rng = random.Random(0)
+    matrices = []
+    for _ in range(count):
+        nrows, ncols = rng.randint(1, 4), rng.randint(1, 5)
+        matrices.append(
+            [[rng.randint(-6, 6) for _ in range(ncols)] for _ in range(nrows)]
+        )
+    return matrices
+
+
+def test_rref() -> None:
+    # sympy is only a cross-check
+    for a in random_matrices(50):
+        reduced, pivots = rref(a)
+        expected, expected_pivots = sympy.Matrix(a).rref()
+        assert pivots == list(expected_pivots)
+        assert reduced == [list(expected.row(i)) for i in range(len(pivots))]
+
+
+def test_solve() -> None:
+    x, basis = solve([[1, 2, 3], [2, 4, 7]], [1, 3])
+    assert x == [-2, 0, 1]
+    assert basis == [[-2, 1, 0]]
+    assert solve([[1, 2], [2, 4]], [1, 3]) is None
+    assert solve([[2, 0], [0, 3]], [1, 1])[0] == [Fraction(1, 2), Fraction(1, 3)]
+
+
+def test_hermite_normal_form() -> None:
+    for a in random_matrices(50):
+        h, u = hermite_normal_form(a)
+        assert matmul(u, a) == h
+        assert abs(sympy.Matrix(u).det()) == 1
+
+    h, _ = hermite_normal_form([[2, 3], [4, 5]])
+    assert h == [[2, 0], [0, 1]]
+
+
+def test_smith_normal_form() -> None:
+    for a in random_matrices(50):
+        d, u, v = smith_normal_form(a)
+        assert matmul(matmul(u, a), v) == d
+        assert abs(sympy.Matrix(u).det()) == abs(sympy.Matrix(v).det()) == 1
+
+        size = min(len(a), len(a[0]))
+        expected = sympy_smith(sympy.Matrix(a), domain=sympy.ZZ)
+        assert [d[i][i] for i in range(size)] == [
+            abs(expected[i, i]) for i in range(size)
+        ]
+
+
+def test_solve_integer() -> None:
+    x, basis = solve_integer([[2, 4]], [6])
+    assert 2 * x[0] + 4 * x[1] == 6
+    assert len(basis) == 1
+    assert 2 * basis[0][0] + 4 * basis[0][1] == 0
+
+    assert solve_integer([[2, 4]], [5]) is None
+    assert solve_integer([[1, 1], [1, -1]], [3, 0]) is None
+
+
+def test_min_integer_solution() -> None:
+    # The buttons (3) (1,3) (2) (2,3) (0,2) (0,1) and the joltages {3,5,4,7}
+    buttons = [(3,), (1, 3), (2,), (2, 3), (0, 2), (0, 1)]
+    joltages = [3, 5, 4, 7]
+    a = [[int(i in button) for button in buttons] for i in range(len(joltages))]
+    presses = min_integer_solution(a, joltages, [7] * len(buttons))
+    assert sum(presses) == 10
+    assert matmul(a, [[x] for x in presses]) == [[x] for x in joltages]
+
+    assert min_integer_solution([[2]], [3], [5]) is None
+    assert min_integer_solution([[1, 1]], [3], [1, 1]) is None
+
+
+def test_min_integer_solution_brute_force() -> None:
+    rng = random.Random(1)
+    for _ in range(100):
+        nrows, ncols = rng.randint(1, 3), rng.randint(1, 4)
+        a = [[rng.randint(-1, 2) for _ in range(ncols)] for _ in range(nrows)]
+        b = [rng.randint(0, 8) for _ in range(nrows)]
+        upper = [rng.randint(1, 4) for _ in range(ncols)]
+        cost = [rng.randint(-2, 3) for _ in range(ncols)]
+
+        costs = [
+            sum(c * v for c, v in zip(cost, x))
+            for x in itertools.product(*(range(u + 1) for u in upper))
+            if all(sum(c * v for c, v in zip(row, x)) == y for row, y in zip(a, b))
+        ]
+        x = min_integer_solution(a, b, upper, cost)
+        if not costs:
+            assert x is None
+        else:
+            assert sum(c * v for c, v in zip(cost, x)) == min(costs)
+
+
+def test_solve_2x2() -> None:
+    a = np.array([[[94, 22], [34, 67]], [[26, 67], [66, 21]], [[1, 2], [2, 4]]])
+    b = np.array([[8400, 5400], [12748, 12176], [3, 6]])
+    x, solvable = solve_2x2(a, b)
+    assert solvable.tolist() == [True, False, False]
+    assert x.tolist() == [[80, 40], [0, 0], [0, 0]]
+    assert x.dtype == np.int64
+
+
+def test_solve_2x2_large_b() -> None:
+    # Only the products with an entry of a are computed, b can be large
+    offset = 10**13
+    a = np.array([[[26, 67], [66, 21]]])
+    b = np.array([[12748, 12176]]) + offset
+    x, solvable = solve_2x2(a, b)
+    assert solvable.tolist() == [True]
+    assert x.tolist() == [[118679050709, 103199174542]]
+    assert x.dtype == np.int64
+
+
+def test_solve_2x2_overflow() -> None:
+    big = 10**15
+    a = np.array([[[3, 1], [1, 2]]], dtype=object) * big
+    b = np.array([[5, 5]], dtype=object) * big**2
+    x, solvable = solve_2x2(a, b)
+    assert solvable.tolist() == [True]
+    assert x.tolist() == [[big, 2 * big]]
@@ -0,0 +1,59 @@
+# Advent of Code - Memo - Test
+
+from __future__ import annotations
+
+from aoc import memo
+from aoc.memo import cached
+
+
+@cached(maxsize=2)
+def square(x: int) -> int:
+    return x * x
+
+
+@cached(maxsize=None)
+def fibonacci(n: int) -> int:
+    return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)  # noqa
+
+
+@cached(key=lambda grid, x: x)
+def cell(grid: list[int], x: int) -> int:
+    return grid[x]
+
+
+def test_lru_eviction() -> None:
+    memo.clear()
+    square(1)
+    square(2)
+    square(1)
+    # 2 is the least recently used
+    square(3)
+    square(1)
+    square(2)
+
+    info = square.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.size) == (2, 4, 2, 2)
+
+
+def test_unbounded() -> None:
+    memo.clear()
+    assert fibonacci(80) == 23416728348467685
+    info = fibonacci.cache_info()
+    assert (info.misses, info.evictions) == (81, 0)
+
+
+def test_key() -> None:
+    memo.clear()
+    assert cell([1, 2, 3], 1) == 2
+    # The key leaves the unhashable grid out
+    assert cell([4, 5, 6], 1) == 2
+
+
+def test_clear_and_stats() -> None:
+    memo.clear()
+    square(4)
+    assert list(memo.stats()) == [f"{__name__}.square"]
+
+    memo.clear()
+    assert memo.stats() == {}
+    assert square.cache_info().size == 0
@@ -0,0 +1,31 @@
+# Advent of Code - Parallel - Test
+
+from __future__ import annotations
+
+import numpy as np
+
+from aoc.parallel import get_jobs, pmap
+
+
+def row_sum(row: int, grid: np.ndarray, offset: int) -> int:
+    assert not grid.flags.writeable
+    return int(grid[row].sum()) + offset
+
+
+def test_pmap_order() -> None:
+    grid = np.arange(100, dtype=np.int64).reshape(20, 5)
+    expected = [int(x) + 1 for x in grid.sum(axis=1)]
+    assert pmap(row_sum, range(20), grid, 1, jobs=3, chunksize=2) == expected
+
+
+def test_pmap_serial() -> None:
+    grid = np.arange(10, dtype=np.int64).reshape(2, 5)
+    grid.flags.writeable = False
+    assert pmap(row_sum, [1, 0], grid, 0, jobs=1) == [35, 10]
+
+
+def test_get_jobs(monkeypatch) -> None:
+    monkeypatch.setenv("AOC_JOBS", "3")
+    assert get_jobs() == 3
+    assert get_jobs(2) == 2
+    assert get_jobs(0) == 1
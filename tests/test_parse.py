@@ -0,0 +1,32 @@
+# Advent of Code - Parse - Test
+
+from __future__ import annotations
+
+import pytest
+
+from aoc.parse import int_rows, ints, split_blocks
+
+
+def test_ints() -> None:
+    assert ints(b"p=0,4 v=3,-3").tolist() == [0, 4, 3, -3]
+    assert ints("3-5", signed=False).tolist() == [3, 5]
+    assert ints(["190: 10 19\n", "83: 17 5\n"]).tolist() == [190, 10, 19, 83, 17, 5]
+    assert ints(b"no numbers").tolist() == []
+
+
+def test_int_rows() -> None:
+    rows = int_rows(["3   4\n", "4   3\n", "2   5\n"], 2)
+    assert rows.shape == (3, 2)
+    assert rows[:, 1].tolist() == [4, 3, 5]
+
+    with pytest.raises(ValueError):
+        int_rows(b"1 2 3", 2)
+
+
+def test_split_blocks() -> None:
+    assert split_blocks(b"a\nb\n\nc\n \n\nd\n") == [b"a\nb", b"c", b"d"]
+    assert split_blocks(["47|53\n", "97|13\n", "\n", "75,47\n"]) == [
+        "47|53\n97|13",
+        "75,47",
+    ]
+    assert split_blocks("x: 1\r\n\r\ny -> z") == ["x: 1", "y -> z"]
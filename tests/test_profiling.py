@@ -0,0 +1,79 @@
+# Advent of Code - Profiling - Test
+
+from __future__ import annotations
+
+import cProfile
+import gc
+import pstats
+import time
+import tracemalloc
+
+from aoc.profiling import GcMonitor, PeakSampler, collapse_stacks
+
+
+def leaf(n: int) -> int:
+    return sum(range(n))
+
+
+def branch() -> int:
+    return leaf(200_000) + leaf(100_000)
+
+
+def root() -> int:
+    return branch() + leaf(100_000)
+
+
+def test_collapse_stacks() -> None:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    root()
+    profiler.disable()
+
+    stacks = {}
+    for line in collapse_stacks(profiler):
+        stack, value = line.rsplit(" ", 1)
+        stacks[stack] = int(value)
+
+    def label(func) -> str:
+        return f"test_profiling.py:{func.__code__.co_firstlineno}:{func.__name__}"
+
+    root_stack = label(root)
+    leaf_stack = f"{label(leaf)};<built-in method builtins.sum>"
+    from_branch = f"{root_stack};{label(branch)};{leaf_stack}"
+    from_root = f"{root_stack};{leaf_stack}"
+    assert from_branch in stacks
+    assert from_root in stacks
+
+    # The time of sum is split by caller, the shares add up to its total
+    total = next(
+        tt
+        for func, (_, _, tt, *_) in pstats.Stats(profiler).stats.items()
+        if func[2] == "<built-in method builtins.sum>"
+    )
+    split = sum(v for k, v in stacks.items() if k.endswith(leaf_stack))
+    # Each share is rounded to the microsecond
+    assert abs(split - total * 1_000_000) <= 2
+
+
+def test_gc_monitor() -> None:
+    with GcMonitor() as monitor:
+        gc.collect()
+    assert monitor.stats.collections[2] == 1
+    assert monitor.stats.pause > 0
+    assert monitor.callback not in gc.callbacks
+
+
+def test_peak_sampler() -> None:
+    tracemalloc.start()
+    try:
+        with PeakSampler(interval=0.001) as sampler:
+            blocks = [bytearray(1024) for _ in range(1000)]
+            # Give the sampler thread a few samples, without hanging if it died
+            deadline = time.monotonic() + 5
+            while sampler.size <= 1000 * 1024 and time.monotonic() < deadline:
+                time.sleep(0.001)
+            del blocks
+    finally:
+        tracemalloc.stop()
+    assert sampler.snapshot is not None
+    assert sampler.size > 1000 * 1024
@@ -0,0 +1,21 @@
+# Advent of Code - Runner - Test
+
+from __future__ import annotations
+
+from aoc.runner import Job, parse_days, schedule
+
+
+def test_parse_days() -> None:
+    assert parse_days("1-3,7, 10-11") == [1, 2, 3, 7, 10, 11]
+    assert parse_days("5") == [5]
+
+
+def test_schedule_longest_first() -> None:
+    jobs = [Job(2024, 1, 1), Job(2024, 6, 2), Job(2024, 17, 2)]
+    timings = {"2024-01-1": 0.01, "2024-06-2": 12.0}
+
+    assert schedule(jobs, timings) == [
+        Job(2024, 17, 2),
+        Job(2024, 6, 2),
+        Job(2024, 1, 1),
+    ]
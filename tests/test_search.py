@@ -0,0 +1,71 @@
+# Advent of Code - Search - Test
+
+from __future__ import annotations
+
+from aoc import search
+
+# 0 -> 1 -> 3 and 0 -> 2 -> 3 are both optimal, 0 -> 3 is not
+GRAPH = {0: [(1, 1), (2, 1), (3, 5)], 1: [(3, 1)], 2: [(3, 1)], 3: [(4, 1)], 4: []}
+
+
+def test_dijkstra() -> None:
+    result = search.dijkstra([0], GRAPH.__getitem__, goal=lambda x: x == 3)
+    assert result.cost == 2
+    assert result.path() == [0, 1, 3]
+    # The goal is not expanded
+    assert 4 not in result.distances
+
+
+def test_dijkstra_all_paths() -> None:
+    result = search.dijkstra(
+        [0], GRAPH.__getitem__, goal=lambda x: x == 3, all_paths=True
+    )
+    assert sorted(result.paths()) == [[0, 1, 3], [0, 2, 3]]
+    assert result.on_paths() == {0, 1, 2, 3}
+
+
+def test_dijkstra_unreachable() -> None:
+    result = search.dijkstra([4], GRAPH.__getitem__, goal=lambda x: x == 0)
+    assert result.cost == float("inf")
+    assert result.goals == []
+
+
+def test_astar() -> None:
+    # Manhattan distance on an open 10x10 grid
+    def neighbors(pos: complex) -> list[tuple[complex, int]]:
+        return [
+            (pos + x, 1)
+            for x in (1, -1, 1j, -1j)
+            if 0 <= (pos + x).real < 10 and 0 <= (pos + x).imag < 10  # noqa
+        ]
+
+    goal = complex(9, 9)
+    result = search.astar(
+        [0j],
+        neighbors,
+        lambda x: int(abs(goal.real - x.real) + abs(goal.imag - x.imag)),
+        goal=lambda x: x == goal,
+    )
+    assert result.cost == 18
+    assert result.expanded < search.dijkstra([0j], neighbors).expanded
+
+
+def test_bfs_multi_source() -> None:
+    line = {x: [y for y in (x - 1, x + 1) if 0 <= y < 10] for x in range(10)}  # noqa
+    result = search.bfs([0, 9], line.__getitem__)
+    assert result.distances[4] == 4
+    assert result.distances[7] == 2
+    assert result.path(7) == [9, 8, 7]
+
+
+def test_bfs01() -> None:
+    graph = {0: [(1, 1), (2, 0)], 1: [(3, 0)], 2: [(1, 0), (3, 1)], 3: []}
+    result = search.bfs01([0], graph.__getitem__, goal=lambda x: x == 3)
+    assert result.cost == 0
+    assert result.path() == [0, 2, 1, 3]
+
+
+def test_stats() -> None:
+    search.stats.reset()
+    search.bfs([0], lambda x: [x + 1] if x < 5 else [])  # noqa
+    assert search.stats.to_dict() == {"searches": 1, "expanded": 6, "pushed": 5}
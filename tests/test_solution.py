@@ -0,0 +1,52 @@
+# Advent of Code - Solution - Test
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from aoc.memo import cached
+from aoc.solution import DaySolution, solver
+
+
+@solver
+def double(parsed: list[int]) -> list[int]:
+    return [x * 2 for x in parsed]
+
+
+def test_solver() -> None:
+    assert double.takes_parsed
+    assert double([1, 2]) == [2, 4]
+
+
+def test_day_solution() -> None:
+    module = SimpleNamespace(
+        parse=lambda data: [int(x) for x in data], part1=double, part2=double
+    )
+    solution = DaySolution(1, 2024, module)
+    assert not solution.legacy
+    assert solution.solve(1, solution.parse(["1", "2"])) == [2, 4]
+
+
+def test_day_solution_legacy() -> None:
+    module = SimpleNamespace(part1=lambda: 1, part2=lambda: 2)
+    solution = DaySolution(1, 2024, module)
+    assert solution.legacy
+    assert solution.parse(["1"]) is None
+    assert solution.solve(2, None) == 2
+
+
+def test_solver_clears_memo() -> None:
+    calls = []
+
+    @cached()
+    def twice(x: int) -> int:
+        calls.append(x)
+        return 2 * x
+
+    @solver
+    def part1(parsed: int) -> int:
+        return twice(parsed) + twice(parsed)
+
+    assert part1(3) == 12
+    assert part1(3) == 12
+    assert calls == [3, 3]
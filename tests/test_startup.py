@@ -0,0 +1,26 @@
+# Advent of Code - Startup - Test
+
+from __future__ import annotations
+
+from aoc.startup import ImportTime, format_report, parse_import_times
+
+OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 | aoc.utils
+import time:        50 |       1000 |   click
+import time:       800 |       2000 | aoc.cli
+"""
+
+
+def test_parse_import_times() -> None:
+    imports = parse_import_times(OUTPUT)
+    assert imports[1] == ImportTime("aoc.utils", 300, 900, 0)
+    assert imports[2] == ImportTime("click", 50, 1000, 1)
+
+
+def test_format_report() -> None:
+    report = format_report(parse_import_times(OUTPUT), top=2)
+    lines = report.splitlines()
+    assert lines[2].startswith("aoc.cli")
+    assert lines[3].startswith("  click")
+    assert lines[-1].endswith("2.9ms")
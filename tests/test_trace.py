@@ -0,0 +1,61 @@
+# Advent of Code - Trace - Test
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from aoc import trace
+
+
+@pytest.fixture(autouse=True)
+def disable_trace() -> Iterator[None]:
+    yield
+    trace.disable()
+
+
+def read_events(path: Path) -> list[dict]:
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_disabled() -> None:
+    point = trace.point("aoc.y2025.day03", "test_disabled")
+    assert point.name == "day03.test_disabled"
+    assert not point.enabled
+
+
+def test_enable(tmp_path: Path) -> None:
+    out = tmp_path / "trace.ndjson"
+    before = trace.point("aoc.y2025.day03", "test_before")
+    other = trace.point("aoc.y2025.day04", "test_other")
+
+    trace.enable(["day03.*"], out)
+    after = trace.point("aoc.y2025.day03", "test_after")
+    assert before.enabled
+    assert after.enabled
+    assert not other.enabled
+
+    before.emit(value=1)
+    after.emit(pos=1 + 2j)
+    trace.disable()
+    assert not before.enabled
+
+    events = read_events(out)
+    assert [x["point"] for x in events] == ["day03.test_before", "day03.test_after"]
+    assert events[0]["value"] == 1
+    assert events[1]["pos"] == "(1+2j)"
+
+
+def test_sampling(tmp_path: Path) -> None:
+    out = tmp_path / "trace.ndjson"
+    point = trace.point("aoc.y2025.day03", "test_sampling")
+    trace.enable(["day03.test_sampling"], out, every=3)
+    for i in range(10):
+        point.emit(i=i)
+    trace.disable()
+
+    assert [x["i"] for x in read_events(out)] == [2, 5, 8]
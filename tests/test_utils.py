@@ -0,0 +1,71 @@
+# Advent of Code - Utils - Test
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from aoc.utils import (
+    ROOT_ENV,
+    byte_mask,
+    bytes_to_grid,
+    find_bytes,
+    get_root_directory,
+    read_grid,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_root_cache() -> Iterator[None]:
+    get_root_directory.cache_clear()
+    yield
+    get_root_directory.cache_clear()
+
+
+def test_root_directory_env(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(ROOT_ENV, str(tmp_path))
+    assert get_root_directory() == tmp_path.resolve()
+
+
+def test_root_directory_lookup(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    (tmp_path / ".git").mkdir()
+    (tmp_path / "src" / "aoc").mkdir(parents=True)
+    monkeypatch.delenv(ROOT_ENV, raising=False)
+    monkeypatch.chdir(tmp_path / "src" / "aoc")
+    assert get_root_directory() == tmp_path.resolve()
+
+
+def test_bytes_to_grid() -> None:
+    grid = bytes_to_grid(b"#.S\n.#E\n")
+    assert grid.shape == (2, 3)
+    assert grid.tobytes() == b"#.S.#E"
+    assert not grid.flags.writeable
+
+
+def test_bytes_to_grid_newlines() -> None:
+    assert bytes_to_grid(b"ab\ncd").tobytes() == b"abcd"
+    assert bytes_to_grid(b"ab\r\ncd\r\n").tobytes() == b"abcd"
+    assert bytes_to_grid(b"abc").shape == (1, 3)
+
+
+def test_bytes_to_grid_ragged() -> None:
+    with pytest.raises(ValueError):
+        bytes_to_grid(b"abc\nde\n")
+
+
+def test_byte_mask() -> None:
+    grid = bytes_to_grid(b"#.S\n.#E\n")
+    assert byte_mask(grid, "#").tolist() == [[True, False, False], [False, True, False]]
+    assert find_bytes(grid, b"SE") == [(0, 2), (1, 2)]
+
+
+def test_read_grid(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    input_file = tmp_path / "data" / "y2024" / "day01_input.txt"
+    input_file.parent.mkdir(parents=True)
+    input_file.write_text("#..\n.#.\n..#\n")
+    monkeypatch.setenv(ROOT_ENV, str(tmp_path))
+
+    grid = read_grid(day=1, year=2024)
+    assert find_bytes(grid, "#") == [(0, 0), (1, 1), (2, 2)]
@@ -2,7 +2,19 @@
 
 from __future__ import annotations
 
-from aoc.y2024.day07 import part1, part2
+from aoc.y2024.day07 import count_assignments, part1, part2
+
+
+def test_count_assignments() -> None:
+    assert count_assignments(190, (10, 19), concat=False) == 1
+    # 81 + 40 * 27 and 81 * 40 + 27
+    assert count_assignments(3267, (81, 40, 27), concat=False) == 2
+    assert count_assignments(3267, (81, 40, 27), concat=False, first=True) == 1
+    assert count_assignments(156, (15, 6), concat=False) == 0
+    assert count_assignments(156, (15, 6), concat=True) == 1
+    # 6 * 8 || 6 * 15
+    assert count_assignments(7290, (6, 8, 6, 15), concat=True) == 1
+    assert count_assignments(83, (17, 5), concat=True) == 0
 
 
 def test_part1() -> None:
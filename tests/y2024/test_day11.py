@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
-from aoc.y2024.day11 import part1, part2
+from aoc.y2024.day11 import evolve, part1, part2
+
+
+def test_evolve() -> None:
+    assert evolve((125, 17), 1) == {253000: 1, 1: 1, 7: 1}
+    assert sum(evolve((125, 17), 6).values()) == 22
+    assert sum(evolve((125, 17), 25).values()) == 55312
 
 
 def test_part1() -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from aoc.y2025.day02 import part1, part2
+from aoc.y2025.day02 import part1, part2, repeated_ids
 
 
 def test_part1() -> None:
@@ -11,3 +11,12 @@ def test_part1() -> None:
 
 def test_part2() -> None:
     assert part2() == 15704845910
+
+
+def test_repeated_ids_large() -> None:
+    # Only the parts of the range are generated, not every 9 digit part
+    assert part1(((10**17, 10**17 + 10**9),)) == 100000000100000000
+    assert part2(((1111111111111111100, 1111111111111111200),)) == 1111111111111111111
+    # Past int64, 1000000 three times
+    ids = repeated_ids(10**20, 10**20 + 10**14, at_least_twice=True)
+    assert ids.tolist() == [100000010000001000000]